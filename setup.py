@@ -19,6 +19,14 @@ setuptools.setup(
     install_requires=[
         'httpx>=0.28.1'  # compatible with httpx 0.28+
     ],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'brotli': ['httpx[brotli]'],
+        'zstd': ['httpx[zstd]'],
+        'orjson': ['orjson'],
+        'msgspec': ['msgspec'],
+        'ujson': ['ujson'],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.7",
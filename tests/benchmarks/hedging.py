@@ -0,0 +1,55 @@
+'''Measures the tail latency of `aio.VideosSearch` with & without request hedging, against the bundled stub server.
+
+    python tests/benchmarks/hedging.py --requests 400 --latency 0.02 --tail-rate 0.03 --tail-latency 0.5
+
+A `--tail-rate` share of the stub's responses is delayed by `--tail-latency`, like the slow replicas behind the p99
+of real requests. With hedging, a duplicate of every request still unanswered after the 95th percentile of recent
+latencies is sent, within a budget of extra requests, and the first response wins.
+'''
+import argparse
+import asyncio
+import statistics
+import time
+
+from youtubesearchpython.aio import HedgingPolicy, VideosSearch
+from youtubesearchpython.testing import StubServer
+
+
+async def run(label: str, server: StubServer, requests: int, concurrency: int, hedging: HedgingPolicy = None) -> str:
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+    async with server.session(hedging = hedging) as session:
+        async def search(index: int) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                await VideosSearch(f'NoCopyrightSounds {index}', limit = 20, session = session).next()
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*[search(index) for index in range(requests)])
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    line = '%-9s p50 %7.1f ms   p99 %7.1f ms   max %7.1f ms' % (
+        label, statistics.median(latencies) * 1000, p99 * 1000, latencies[-1] * 1000,
+    )
+    if hedging is not None:
+        line += '   hedges %d (%d won)' % (hedging.hedges, hedging.wins)
+    return line
+
+
+async def main(requests: int, concurrency: int, latency: float, tailRate: float, tailLatency: float, budget: float) -> None:
+    async with StubServer(latency = latency, jitter = latency / 2, tailRate = tailRate, tailLatency = tailLatency, seed = 1) as server:
+        print(await run('plain', server, requests, concurrency))
+        print(await run('hedged', server, requests, concurrency, HedgingPolicy(budget = budget)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--requests', type = int, default = 400)
+    parser.add_argument('--concurrency', type = int, default = 20)
+    parser.add_argument('--latency', type = float, default = 0.02, help = 'stub response delay in seconds')
+    parser.add_argument('--tail-rate', type = float, default = 0.03, help = 'share of responses in the latency tail')
+    parser.add_argument('--tail-latency', type = float, default = 0.5, help = 'extra delay of the tail in seconds')
+    parser.add_argument('--budget', type = float, default = 0.1, help = 'maximum share of hedged requests')
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.requests, arguments.concurrency, arguments.latency, arguments.tail_rate,
+                     arguments.tail_latency, arguments.budget))
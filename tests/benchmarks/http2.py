@@ -0,0 +1,57 @@
+'''Compares HTTP/1.1 & HTTP/2 for concurrent `VideosSearch` calls against a local stub server.
+
+The bundled `StubServer` answers `youtubei/v1/search` with a canned response after a fixed delay, over
+cleartext HTTP/1.1 or HTTP/2 (prior knowledge), and counts the sockets clients open to it.
+
+    python tests/benchmarks/http2.py --requests 500 --latency 0.05
+
+With HTTP/1.1 every in-flight request needs its own socket, and requests beyond `--max-connections`
+queue inside the client pool, whose scheduling cost grows with the queue length. With HTTP/2 the
+same requests share a single connection.
+'''
+import argparse
+import asyncio
+import statistics
+import time
+
+from youtubesearchpython.aio import Session, VideosSearch
+from youtubesearchpython.testing import StubServer
+
+
+async def run(label: str, session: Session, requests: int) -> str:
+    latencies = []
+
+    async def search(index: int) -> None:
+        start = time.perf_counter()
+        result = await VideosSearch(f'NoCopyrightSounds {index}', limit = 20, session = session).next()
+        latencies.append(time.perf_counter() - start)
+        assert len(result['result']) == 20
+
+    start = time.perf_counter()
+    await asyncio.gather(*[search(index) for index in range(requests)])
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return '%-10s p50 %7.1f ms   p99 %7.1f ms   total %6.2f s   ' % (
+        label, statistics.median(latencies) * 1000, p99 * 1000, elapsed,
+    )
+
+
+async def main(requests: int, latency: float, maxConnections: int) -> None:
+    for label, options in [
+        ('HTTP/1.1', {'http2': False}),
+        ('HTTP/2', {'http2': True, 'http1': False}),
+    ]:
+        async with StubServer(latency = latency) as server:
+            async with server.session(maxConnections = maxConnections, **options) as session:
+                line = await run(label, session, requests)
+        print(line + 'sockets %d' % server.sockets)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--requests', type = int, default = 500)
+    parser.add_argument('--latency', type = float, default = 0.05, help = 'stub response delay in seconds')
+    parser.add_argument('--max-connections', type = int, default = 100)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.requests, arguments.latency, arguments.max_connections))
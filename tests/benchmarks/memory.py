@@ -0,0 +1,63 @@
+'''Measures the memory retained by search & playlist results, per item, with ResultMode.dict and ResultMode.objects.
+
+    python tests/benchmarks/memory.py --pages 200
+
+Pages are the bundled stub server's payloads: 20-item search pages and 100-item playlist pages, parsed once
+each. The results of every page are kept alive, as when collecting many of them, and the memory they hold is
+measured with `tracemalloc` once the responses are released.
+'''
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Callable, List
+
+from youtubesearchpython.core.constants import ResultMode, SearchMode
+from youtubesearchpython.core.playlist import PlaylistCore
+from youtubesearchpython.core.search import SearchCore
+from youtubesearchpython.testing import payloads
+
+
+def searchPage(text: bytes, mode: int) -> list:
+    search = SearchCore('NoCopyrightSounds', 20, 'en', 'US', SearchMode.videos, None)
+    search.response = text
+    search._parseSource()
+    search._getComponents(True, False, False)
+    return search.result(mode)['result']
+
+
+def playlistPage(text: bytes, mode: int) -> list:
+    playlist = PlaylistCore('https://www.youtube.com/playlist?list=PL', 'getVideos', mode, None)
+    playlist.response = text
+    playlist.post_processing()
+    return playlist.result['videos']
+
+
+def measure(parse: Callable[[bytes, int], list], texts: List[bytes], mode: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    results = [item for text in texts for item in parse(text, mode)]
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained / len(results)
+
+
+def report(label: str, parse: Callable[[bytes, int], list], texts: List[bytes]) -> str:
+    dictBytes = measure(parse, texts, ResultMode.dict)
+    objectBytes = measure(parse, texts, ResultMode.objects)
+    return '%-9s dict %7.0f B/item   objects %7.0f B/item   %4.1fx less' % (label, dictBytes, objectBytes, dictBytes / objectBytes)
+
+
+def main(pages: int) -> None:
+    searchTexts = [json.dumps(payloads.search(f'NoCopyrightSounds {index}', SearchMode.videos, 0, 20, 'token')).encode() for index in range(pages)]
+    playlistTexts = [json.dumps(payloads.playlist(f'PL{index}', 0, 100, 'token')).encode() for index in range(pages)]
+    print(report('search', searchPage, searchTexts))
+    print(report('playlist', playlistPage, playlistTexts))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--pages', type = int, default = 200)
+    arguments = parser.parse_args()
+    main(arguments.pages)
@@ -0,0 +1,59 @@
+'''Measures the CPU time spent parsing a search or playlist page, per item, with no network involved.
+
+    python tests/benchmarks/parsing.py --pages 2000 --json json
+
+Pages are the bundled stub server's payloads: 20-item search pages and 100-item playlist pages. Each page is
+decoded from JSON & turned into results exactly as a response from YouTube would be, so the numbers reflect
+the JSON decoding, with the given backend (the fastest installed one by default), plus the renderer parsers.
+'''
+import argparse
+import json
+import time
+
+from youtubesearchpython.core.constants import ResultMode, SearchMode
+from youtubesearchpython.core.jsonbackend import availableJsonBackends, getJsonBackend, setJsonBackend
+from youtubesearchpython.core.playlist import PlaylistCore
+from youtubesearchpython.core.search import SearchCore
+from youtubesearchpython.testing import payloads
+
+
+def report(label: str, pages: int, items: int, elapsed: float) -> str:
+    return '%-9s %8.1f pages/s   %6.2f us/item' % (label, pages / elapsed, elapsed / (pages * items) * 1e6)
+
+
+def runSearch(pages: int) -> str:
+    texts = [json.dumps(payloads.search(f'NoCopyrightSounds {index}', SearchMode.videos, 0, 20, 'token')).encode() for index in range(pages)]
+    start = time.process_time()
+    for text in texts:
+        search = SearchCore('NoCopyrightSounds', 20, 'en', 'US', SearchMode.videos, None)
+        search.response = text
+        search._parseSource()
+        search._getComponents(True, False, False)
+        assert len(search.resultComponents) == 20
+    return report('search', pages, 20, time.process_time() - start)
+
+
+def runPlaylist(pages: int) -> str:
+    texts = [json.dumps(payloads.playlist(f'PL{index}', 0, 100, 'token')).encode() for index in range(pages)]
+    start = time.process_time()
+    for text in texts:
+        playlist = PlaylistCore('https://www.youtube.com/playlist?list=PL', None, ResultMode.dict, None)
+        playlist.response = text
+        playlist.post_processing()
+        assert len(playlist.result['videos']) == 100
+    return report('playlist', pages, 100, time.process_time() - start)
+
+
+def main(pages: int, backend: str) -> None:
+    setJsonBackend(backend)
+    print(f'JSON backend: {getJsonBackend()}')
+    print(runSearch(pages))
+    print(runPlaylist(pages))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--pages', type = int, default = 2000)
+    parser.add_argument('--json', choices = availableJsonBackends(), default = getJsonBackend())
+    arguments = parser.parse_args()
+    main(arguments.pages, arguments.json)
@@ -0,0 +1,69 @@
+'''Measures requests per second of the synchronous & asynchronous APIs against the bundled stub server.
+
+    python tests/benchmarks/throughput.py --requests 1000 --concurrency 50 --latency 0.02
+
+The synchronous API is driven from a thread pool, the asynchronous one from a single event loop. Both share
+one pooled `Session` each, so the numbers reflect the client side of the library: connection reuse, parsing
+and scheduling, with the network replaced by a fixed `--latency`.
+'''
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from youtubesearchpython import VideosSearch
+from youtubesearchpython.aio import VideosSearch as AsyncVideosSearch
+from youtubesearchpython.testing import StubServer
+
+
+def report(label: str, latencies: list, elapsed: float) -> str:
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return '%-6s %8.1f req/s   p50 %7.1f ms   p99 %7.1f ms' % (
+        label, len(latencies) / elapsed, statistics.median(latencies) * 1000, p99 * 1000,
+    )
+
+
+def runSync(server: StubServer, requests: int, concurrency: int) -> str:
+    latencies = []
+    with server.session(maxConnections = concurrency) as session:
+        def search(index: int) -> None:
+            start = time.perf_counter()
+            VideosSearch(f'NoCopyrightSounds {index}', limit = 20, session = session).result()
+            latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as executor:
+            list(executor.map(search, range(requests)))
+        return report('sync', latencies, time.perf_counter() - start)
+
+
+async def runAsync(server: StubServer, requests: int, concurrency: int) -> str:
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+    async with server.session(maxConnections = concurrency) as session:
+        async def search(index: int) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                await AsyncVideosSearch(f'NoCopyrightSounds {index}', limit = 20, session = session).next()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*[search(index) for index in range(requests)])
+        return report('async', latencies, time.perf_counter() - start)
+
+
+def main(requests: int, concurrency: int, latency: float) -> None:
+    with StubServer(latency = latency) as server:
+        print(runSync(server, requests, concurrency))
+        print(asyncio.run(runAsync(server, requests, concurrency)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--requests', type = int, default = 1000)
+    parser.add_argument('--concurrency', type = int, default = 50)
+    parser.add_argument('--latency', type = float, default = 0.02, help = 'stub response delay in seconds')
+    arguments = parser.parse_args()
+    main(arguments.requests, arguments.concurrency, arguments.latency)
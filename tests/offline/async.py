@@ -0,0 +1,75 @@
+from youtubesearchpython.aio import *
+from youtubesearchpython.testing import StubServer
+import asyncio
+
+async def main():
+    async with StubServer(pageSize = 5, pages = 3) as server:
+        setDefaultSession(server.session())
+
+        search = Search('NoCopyrightSounds', limit = 5)
+        print(await search.next())
+        print(len((await search.next())['result']))
+
+
+        print(await VideosSearch('NoCopyrightSounds', limit = 5).next())
+        print((await VideosSearch('NoCopyrightSounds', limit = 5).next(ResultMode.objects))['result'][0].link)
+        print(await ChannelsSearch('NoCopyrightSounds', limit = 1).next())
+        print(await PlaylistsSearch('NoCopyrightSounds', limit = 1).next())
+        print(await ChannelSearch('Watermelon Sugar', 'UCZFWPqqPkFlNwIxcpsLOwew').next())
+
+
+        video = await Video.get('https://www.youtube.com/watch?v=z0GKGpObgPY', get_upload_date = True)
+        print(video['title'], video['publishedTime'], len(video['thumbnails']))
+        print(await Video.getInfo('https://youtu.be/z0GKGpObgPY'))
+        print(await Video.getFormats('z0GKGpObgPY'))
+        video = await Video.get('z0GKGpObgPY', thumbnailMode = ThumbnailMode.probe)
+        print([thumbnail['url'] for thumbnail in video['thumbnails']])
+        video = await Video.get('z0GKGpObgPY', thumbnailMode = ThumbnailMode.lazy)
+        print(len(await video['thumbnails'].asyncResolve()))
+        videos = await Video.getMany(['z0GKGpObgPY', 'E07s5ZYygMg', 'K4DyBUG242c'], concurrency = 2)
+        print([video['title'] for video in videos])
+        async for videoLink, video in Video.iterMany(['z0GKGpObgPY', 'E07s5ZYygMg'], infoOnly = True):
+            print(videoLink, video['title'])
+
+
+        print(await Suggestions.get('NoCopyrightSounds', language = 'en', region = 'US'))
+
+
+        hashtag = Hashtag('ncs', limit = 1)
+        print(await hashtag.next())
+        print(await hashtag.next())
+        print(await Hashtag('ncs', limit = 1).next(ResultMode.objects))
+
+
+        playlist = Playlist('https://www.youtube.com/playlist?list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK')
+        await playlist.init()
+        print(f'Videos Retrieved: {len(playlist.videos)}')
+        while playlist.hasMoreVideos:
+            await playlist.getNextVideos()
+            print(f'Videos Retrieved: {len(playlist.videos)}')
+
+
+        comments = Comments('_ZdsmLgCVdU')
+        await comments.init()
+        print(len(comments.comments['result']))
+        while comments.hasMoreComments:
+            await comments.getNextComments()
+            print(len(comments.comments['result']))
+
+
+        transcript = await Transcript.get('https://www.youtube.com/watch?v=L7kF4MXXCoA')
+        print(transcript['segments'][0])
+
+
+        print((await Channel.get('UC_aEa8K-EOJ3D6gOs7HcyNg'))['title'])
+        channel = Channel('UC_aEa8K-EOJ3D6gOs7HcyNg')
+        await channel.init()
+        print(len(channel.result['playlists']))
+        while channel.has_more_playlists():
+            await channel.next()
+            print(len(channel.result['playlists']))
+
+        print(server.requests)
+
+
+asyncio.run(main())
@@ -0,0 +1,210 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+from youtubesearchpython import *
+from youtubesearchpython.core.exceptions import YouTubeCircuitOpenError, YouTubeDeadlineExceeded, YouTubeRequestError
+from youtubesearchpython.core.requests import innertubeUrl
+from youtubesearchpython.testing import StubServer
+
+
+player = innertubeUrl('player')
+
+
+def playerRequest(session: Session, videoId: str = 'E07s5ZYygMg', **kwargs):
+    return session.request('POST', player, json = {'videoId': videoId}, idempotent = True, **kwargs)
+
+
+def raises(error: type, function, *args, **kwargs) -> Exception:
+    try:
+        function(*args, **kwargs)
+    except error as e:
+        return e
+    raise AssertionError(f'{error.__name__} not raised')
+
+
+# RetryPolicy: a failing request is sent `maxAttempts` times, then the search gives up.
+with StubServer(errorRate = 1.0) as server:
+    session = server.session(retry = RetryPolicy(maxAttempts = 3, backoffBase = 0.01))
+    raises(YouTubeRequestError, VideosSearch, 'NoCopyrightSounds', session = session)
+    assert server.requests['/youtubei/v1/search'] == 3, server.requests
+    session.close()
+    session = server.session(retry = RetryPolicy(maxAttempts = 1))
+    raises(YouTubeRequestError, VideosSearch, 'NoCopyrightSounds', session = session)
+    assert server.requests['/youtubei/v1/search'] == 4, server.requests
+    session.close()
+print('RetryPolicy: ok')
+
+
+# CircuitBreaker: opens once the failure rate is reached, fails fast while open, closes after a successful probe.
+with StubServer(errorRate = 1.0) as server:
+    breaker = CircuitBreaker(failureRate = 0.5, minimumRequests = 4, openDuration = 0.2)
+    session = server.session(retry = RetryPolicy(maxAttempts = 1), circuitBreaker = breaker)
+    for _ in range(4):
+        assert playerRequest(session).status_code == 503
+    assert breaker.state('player') == 'open'
+    raises(YouTubeCircuitOpenError, playerRequest, session)
+    assert server.requests['/youtubei/v1/player'] == 4, server.requests
+    server.errorRate = 0.0
+    time.sleep(0.25)
+    assert playerRequest(session).status_code == 200
+    assert breaker.state('player') == 'closed'
+    # A failed probe opens the circuit again.
+    for _ in range(4):
+        server.errorRate = 1.0
+        playerRequest(session)
+    assert breaker.state('player') == 'open'
+    time.sleep(0.25)
+    assert playerRequest(session).status_code == 503
+    assert breaker.state('player') == 'open'
+    session.close()
+print('CircuitBreaker: ok')
+
+
+# RateLimiter: requests beyond the burst are spaced by 1 / rate, and a wait past the deadline raises right away.
+with StubServer() as server:
+    session = server.session(rateLimiter = RateLimiter(rate = 20, burst = 2))
+    started = time.monotonic()
+    for _ in range(6):
+        playerRequest(session)
+    elapsed = time.monotonic() - started
+    assert 0.18 <= elapsed < 1.0, elapsed
+    session.close()
+    session = server.session(rateLimiter = RateLimiter(endpoints = {'player': 1}))
+    playerRequest(session)
+    started = time.monotonic()
+    raises(YouTubeDeadlineExceeded, playerRequest, session, deadline = Deadline(0.5))
+    assert time.monotonic() - started < 0.1
+    assert server.requests['/youtubei/v1/player'] == 7, server.requests
+    session.close()
+print('RateLimiter: ok')
+
+
+# AdaptiveConcurrency: a burst of slow responses cuts the limit once, not once per response.
+concurrency = AdaptiveConcurrency(initial = 16, decrease = 0.5)
+gate = concurrency.gate(player)
+for _ in range(9):
+    gate.acquire()
+gate.release(0.01)
+time.sleep(0.05)
+for _ in range(8):
+    gate.release(0.05, failed = True)
+assert concurrency.limit('player') == 8, gate.limit
+print('AdaptiveConcurrency: ok')
+
+
+# SingleFlight: identical requests in flight at once are sent a single time, by threads & by coroutines.
+with StubServer(latency = 0.2) as server:
+    session = server.session(singleFlight = SingleFlight())
+    barrier = threading.Barrier(10)
+    responses = []
+
+    def request() -> None:
+        barrier.wait()
+        responses.append(playerRequest(session).status_code)
+
+    threads = [threading.Thread(target = request) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert responses == [200] * 10, responses
+    assert server.requests['/youtubei/v1/player'] == 1, server.requests
+    assert (session.singleFlight.requests, session.singleFlight.coalesced) == (1, 9)
+
+    async def requestAll() -> list:
+        try:
+            return await asyncio.gather(*[session.asyncRequest('POST', player, json = {'videoId': 'K4DyBUG242c'}, idempotent = True) for _ in range(10)])
+        finally:
+            await session.aclose()
+
+    assert [response.status_code for response in asyncio.run(requestAll())] == [200] * 10
+    assert server.requests['/youtubei/v1/player'] == 2, server.requests
+    # Different requests are not coalesced.
+    playerRequest(session, 'z0GKGpObgPY')
+    assert server.requests['/youtubei/v1/player'] == 3, server.requests
+    session.close()
+print('SingleFlight: ok')
+
+
+# ResponseCache & SQLiteCache: hits, misses, expirations and stale hits refreshed in the background.
+directory = tempfile.mkdtemp()
+with StubServer() as server:
+    for cache in (ResponseCache(ttls = {'search': 60}), SQLiteCache(os.path.join(directory, 'cache.sqlite'), ttls = {'search': 60})):
+        session = server.session(cache = cache)
+        before = server.requests.get('/youtubei/v1/search', 0)
+        first = VideosSearch('NoCopyrightSounds', limit = 5, session = session).result()
+        second = VideosSearch('NoCopyrightSounds', limit = 5, session = session).result()
+        assert first == second
+        VideosSearch('Watermelon Sugar', limit = 5, session = session)
+        with cache.bypass():
+            VideosSearch('NoCopyrightSounds', limit = 5, session = session)
+        assert server.requests['/youtubei/v1/search'] - before == 3, server.requests
+        stats = cache.stats
+        assert (stats['hits'], stats['staleHits'], stats['misses'], stats['entries']) == (1, 0, 2, 2), stats
+        session.close()
+
+    session = server.session(cache = ResponseCache(ttls = {'search': 0.1}, staleWhileRevalidate = {'search': 60}))
+    before = server.requests['/youtubei/v1/search']
+    VideosSearch('NoCopyrightSounds', limit = 5, session = session)
+    time.sleep(0.15)
+    VideosSearch('NoCopyrightSounds', limit = 5, session = session)
+    VideosSearch('NoCopyrightSounds', limit = 5, session = session)
+    stats = session.cache.stats
+    assert (stats['hits'], stats['staleHits'], stats['misses']) == (2, 2, 1), stats
+    session.close()
+    # Both stale hits are refreshed by a single background request.
+    assert server.requests['/youtubei/v1/search'] - before == 2, server.requests
+
+    session = server.session(cache = ResponseCache(ttls = {'search': 0.1}))
+    VideosSearch('NoCopyrightSounds', limit = 5, session = session)
+    time.sleep(0.15)
+    VideosSearch('NoCopyrightSounds', limit = 5, session = session)
+    stats = session.cache.stats
+    assert (stats['hits'], stats['misses'], stats['expirations']) == (0, 2, 1), stats
+    session.close()
+print('ResponseCache: ok')
+
+
+# NegativeCache: a video the player request was rejected for is not requested again.
+with StubServer(errorRate = 1.0, errorStatus = 404) as server:
+    session = server.session(negativeCache = NegativeCache())
+    first = raises(YouTubeRequestError, Video.get, 'E07s5ZYygMg', session = session)
+    second = raises(YouTubeRequestError, Video.get, 'E07s5ZYygMg', session = session)
+    assert type(first) is type(second) and first.args == second.args
+    assert server.requests['/youtubei/v1/player'] == 1, server.requests
+    assert session.negativeCache.stats == {'hits': 1, 'misses': 1, 'entries': 1}, session.negativeCache.stats
+    session.close()
+print('NegativeCache: ok')
+
+
+# Deadline: optional requests cut short mark the result `timedOut`, required ones raise YouTubeDeadlineExceeded.
+with StubServer(latency = 0.3) as server:
+    session = server.session()
+    video = Video.get('E07s5ZYygMg', session = session, deadline = 10)
+    assert video['timedOut'] is False
+    video = Video.get('E07s5ZYygMg', session = session, deadline = 0.5, thumbnailMode = ThumbnailMode.probe)
+    assert video['timedOut'] is True
+    assert video['title'] == 'Stub video E07s5ZYygMg'
+    started = time.monotonic()
+    raises(YouTubeDeadlineExceeded, Video.get, 'K4DyBUG242c', session = session, deadline = 0.1)
+    assert time.monotonic() - started < 0.25
+    session.close()
+print('Deadline: ok')
+
+
+# RecordReplayTransport: responses recorded from the server are replayed once it is gone, in a directory or SQLite.
+for path in (os.path.join(directory, 'recordings'), os.path.join(directory, 'recordings.sqlite')):
+    with StubServer() as server:
+        transport = RecordReplayTransport(path, mode = 'record', transport = HttpxTransport(hostOverrides = {'https://www.youtube.com': server.url}))
+        session = Session(transport = transport)
+        recorded = VideosSearch('NoCopyrightSounds', limit = 5, session = session).result()
+        session.close()
+        assert server.requests['/youtubei/v1/search'] == 1
+    session = Session(transport = RecordReplayTransport(path))
+    assert VideosSearch('NoCopyrightSounds', limit = 5, session = session).result() == recorded
+    raises(YouTubeRequestError, VideosSearch, 'Watermelon Sugar', session = session)
+    session.close()
+print('RecordReplayTransport: ok')
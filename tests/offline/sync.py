@@ -0,0 +1,75 @@
+from youtubesearchpython import *
+from youtubesearchpython.testing import StubServer
+
+
+with StubServer(pageSize = 5, pages = 3) as server:
+    setDefaultSession(server.session())
+
+    search = Search('NoCopyrightSounds', limit = 5)
+    print(search.result(mode = ResultMode.json))
+    search.next()
+    print(len(search.result()['result']))
+
+
+    videosSearch = VideosSearch('NoCopyrightSounds', limit = 5)
+    print(videosSearch.result())
+    print(videosSearch.result(mode = ResultMode.compactJson))
+    print(videosSearch.result(mode = ResultMode.objects))
+    print(ChannelsSearch('NoCopyrightSounds', limit = 1).result())
+    print(PlaylistsSearch('NoCopyrightSounds', limit = 1).result())
+    print(CustomSearch('NoCopyrightSounds', VideoSortOrder.uploadDate, limit = 1).result())
+    print(ChannelSearch('Watermelon Sugar', 'UCZFWPqqPkFlNwIxcpsLOwew').result())
+
+
+    video = Video.get('https://www.youtube.com/watch?v=z0GKGpObgPY', get_upload_date = True)
+    print(video['title'], video['publishedTime'], len(video['thumbnails']))
+    print(Video.getInfo('https://youtu.be/z0GKGpObgPY', mode = ResultMode.json))
+    print(Video.getFormats('z0GKGpObgPY'))
+    video = Video.get('z0GKGpObgPY', deadline = 2.5)
+    print(video['timedOut'])
+    video = Video.get('z0GKGpObgPY', thumbnailMode = ThumbnailMode.lazy)
+    print(video['thumbnails'][-1]['url'])
+    videos = Video.getMany(['z0GKGpObgPY', 'E07s5ZYygMg', 'K4DyBUG242c'], concurrency = 2)
+    print([video['title'] for video in videos])
+
+    print(Suggestions(language = 'en', region = 'US').get('NoCopyrightSounds'))
+
+
+    hashtag = Hashtag('ncs', limit = 1)
+    print(hashtag.result())
+    print(hashtag.next())
+
+
+    playlist = Playlist('https://www.youtube.com/playlist?list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK')
+    print(f'Videos Retrieved: {len(playlist.videos)}')
+    while playlist.hasMoreVideos:
+        playlist.getNextVideos()
+        print(f'Videos Retrieved: {len(playlist.videos)}')
+    print(Playlist.getInfo('https://www.youtube.com/playlist?list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK'))
+    print(Playlist.getVideos('https://www.youtube.com/playlist?list=PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK', mode = ResultMode.objects)['videos'][0].link)
+
+
+    comments = Comments('_ZdsmLgCVdU')
+    print(len(comments.comments['result']))
+    while comments.hasMoreComments:
+        comments.getNextComments()
+        print(len(comments.comments['result']))
+    print(Comments.get('_ZdsmLgCVdU', mode = ResultMode.objects)['result'][0])
+
+
+    transcript = Transcript.get('https://www.youtube.com/watch?v=L7kF4MXXCoA')
+    print(transcript['segments'][0])
+    print(Transcript.get('L7kF4MXXCoA', transcript['languages'][-1]['params'])['segments'][0])
+    print(Transcript.get('L7kF4MXXCoA', mode = ResultMode.objects)['segments'][0].toDict())
+
+
+    print(Channel.get('UC_aEa8K-EOJ3D6gOs7HcyNg')['title'])
+    channel = Channel('UC_aEa8K-EOJ3D6gOs7HcyNg')
+    print(len(channel.result['playlists']))
+    while channel.has_more_playlists():
+        channel.next()
+        print(len(channel.result['playlists']))
+
+
+    print(SearchVideos('NoCopyrightSounds', max_results = 1).result())
+    print(server.requests)
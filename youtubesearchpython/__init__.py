@@ -9,6 +9,19 @@ from youtubesearchpython.extras import Video, Playlist, Suggestions, Hashtag, Co
 from youtubesearchpython.streamurlfetcher import StreamURLFetcher
 from youtubesearchpython.core.constants import *
 from youtubesearchpython.core.utils import *
+from youtubesearchpython.core.session import Session, getDefaultSession, setDefaultSession
+from youtubesearchpython.core.transport import Transport, HttpxTransport, RecordReplayTransport
+from youtubesearchpython.core.retry import RetryPolicy
+from youtubesearchpython.core.ratelimit import RateLimiter
+from youtubesearchpython.core.breaker import CircuitBreaker
+from youtubesearchpython.core.concurrency import AdaptiveConcurrency
+from youtubesearchpython.core.hedging import HedgingPolicy
+from youtubesearchpython.core.deadline import Deadline
+from youtubesearchpython.core.singleflight import SingleFlight
+from youtubesearchpython.core.cache import ResponseCache, SQLiteCache, NegativeCache, LookupCache
+from youtubesearchpython.core.thumbnails import ThumbnailResolver
+from youtubesearchpython.core.jsonbackend import availableJsonBackends, getJsonBackend, setJsonBackend
+from youtubesearchpython.core.results import Result, Thumbnail, VideoResult, ChannelResult, PlaylistResult, PlaylistVideoResult, CommentResult, TranscriptSegment
 
 __title__        = 'youtube-search-python'
 __version__      = '1.7.0'
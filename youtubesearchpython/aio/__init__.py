@@ -2,6 +2,19 @@ from youtubesearchpython.aio.search import Search, VideosSearch, ChannelsSearch,
 from youtubesearchpython.aio.extras import Video, Playlist, Suggestions, Hashtag, Comments, Transcript, Channel
 from youtubesearchpython.aio.streamurlfetcher import StreamURLFetcher
 from youtubesearchpython.core.utils import *
+from youtubesearchpython.core.session import Session, getDefaultSession, setDefaultSession
+from youtubesearchpython.core.transport import Transport, HttpxTransport, RecordReplayTransport
+from youtubesearchpython.core.retry import RetryPolicy
+from youtubesearchpython.core.ratelimit import RateLimiter
+from youtubesearchpython.core.breaker import CircuitBreaker
+from youtubesearchpython.core.concurrency import AdaptiveConcurrency
+from youtubesearchpython.core.hedging import HedgingPolicy
+from youtubesearchpython.core.deadline import Deadline
+from youtubesearchpython.core.singleflight import SingleFlight
+from youtubesearchpython.core.cache import ResponseCache, SQLiteCache, NegativeCache, LookupCache
+from youtubesearchpython.core.thumbnails import ThumbnailResolver
+from youtubesearchpython.core.jsonbackend import availableJsonBackends, getJsonBackend, setJsonBackend
+from youtubesearchpython.core.results import Result, Thumbnail, VideoResult, ChannelResult, PlaylistResult, PlaylistVideoResult, CommentResult, TranscriptSegment
 from youtubesearchpython.core.constants import *
 
 
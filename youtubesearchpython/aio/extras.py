@@ -1,25 +1,43 @@
 import copy
-from typing import Union
+from typing import AsyncIterator, Iterable, List, Optional, Tuple, Union
 
 from youtubesearchpython.core import VideoCore
+from youtubesearchpython.core.batch import gatherConcurrently, iterConcurrently
 from youtubesearchpython.core.comments import CommentsCore
-from youtubesearchpython.core.constants import ResultMode, ChannelRequestType
+from youtubesearchpython.core.constants import ResultMode, ChannelRequestType, ThumbnailMode
 from youtubesearchpython.core.hashtag import HashtagCore
 from youtubesearchpython.core.playlist import PlaylistCore
+from youtubesearchpython.core.results import CommentResult, TranscriptSegment, withObjects
 from youtubesearchpython.core.suggestions import SuggestionsCore
 from youtubesearchpython.core.transcript import TranscriptCore
 from youtubesearchpython.core.channel import ChannelCore
+from youtubesearchpython.core.session import Session
+from youtubesearchpython.core.deadline import Deadline
 
 
 class Video:
     @staticmethod
-    async def get(videoLink: str, resultMode: int = ResultMode.dict, timeout: int = 2, get_upload_date: bool = False) -> \
+    async def get(videoLink: str, resultMode: int = ResultMode.dict, timeout: int = 2, get_upload_date: bool = False, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None, thumbnailMode: int = ThumbnailMode.synthesized, searchEnrichment: bool = True) -> \
     Union[dict, None]:
         '''Fetches information and formats  for the given video link or ID.
         Returns None if video is unavailable.
 
         Args:
             videoLink (str): link or ID of the video on YouTube.
+            session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
+            deadline (Deadline | float, optional): Time budget of the whole call in seconds, shared by the player request,
+                the search fallbacks & the thumbnail checks. Fallbacks that do not fit are skipped and the result gets
+                `timedOut` set to True. Defaults to None.
+            thumbnailMode (int, optional): How the standard thumbnails YouTube may have for the video are added to
+                `thumbnails`. `ThumbnailMode.synthesized` adds the URLs of those every video has (default,
+                mqdefault & hqdefault) without checking them, `ThumbnailMode.probe` checks all of them and
+                keeps those that exist, checked concurrently, `ThumbnailMode.lazy` returns a `ThumbnailResolver`
+                checking them when first read, and `ThumbnailMode.none` keeps the thumbnails of the player response
+                only. Defaults to ThumbnailMode.synthesized.
+            searchEnrichment (bool, optional): Searches for the video, by title, then link & ID while not found, to fill
+                `publishedTime` when the player response lacks it & add the hq720 thumbnail search results have
+                with `ThumbnailMode.probe` & `ThumbnailMode.lazy`. What is found is remembered by the session's
+                `lookupCache`. Defaults to True.
 
         Examples:
 
@@ -259,19 +277,33 @@ class Video:
                     ]
                 }
         '''
-        video = VideoCore(videoLink, None, resultMode, timeout, get_upload_date, "ANDROID")
+        video = VideoCore(videoLink, None, resultMode, timeout, get_upload_date, "ANDROID", session=session, deadline=deadline, thumbnailMode=thumbnailMode, searchEnrichment=searchEnrichment)
         if get_upload_date:
             await video.async_html_create()
         await video.async_create()
         return video.result
 
     @staticmethod
-    async def getInfo(videoLink: str, resultMode: int = ResultMode.dict, timeout: int = 2) -> Union[dict, None]:
+    async def getInfo(videoLink: str, resultMode: int = ResultMode.dict, timeout: int = 2, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None, thumbnailMode: int = ThumbnailMode.synthesized, searchEnrichment: bool = True) -> Union[dict, None]:
         '''Fetches only information  for the given video link or ID.
         Returns None if video is unavailable.
 
         Args:
             videoLink (str): link or ID of the video on YouTube.
+            session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
+            deadline (Deadline | float, optional): Time budget of the whole call in seconds, shared by the player request,
+                the search fallbacks & the thumbnail checks. Fallbacks that do not fit are skipped and the result gets
+                `timedOut` set to True. Defaults to None.
+            thumbnailMode (int, optional): How the standard thumbnails YouTube may have for the video are added to
+                `thumbnails`. `ThumbnailMode.synthesized` adds the URLs of those every video has (default,
+                mqdefault & hqdefault) without checking them, `ThumbnailMode.probe` checks all of them and
+                keeps those that exist, checked concurrently, `ThumbnailMode.lazy` returns a `ThumbnailResolver`
+                checking them when first read, and `ThumbnailMode.none` keeps the thumbnails of the player response
+                only. Defaults to ThumbnailMode.synthesized.
+            searchEnrichment (bool, optional): Searches for the video, by title, then link & ID while not found, to fill
+                `publishedTime` when the player response lacks it & add the hq720 thumbnail search results have
+                with `ThumbnailMode.probe` & `ThumbnailMode.lazy`. What is found is remembered by the session's
+                `lookupCache`. Defaults to True.
 
         Examples:
 
@@ -346,18 +378,20 @@ class Video:
                 "link": "https://www.youtube.com/watch?v=E07s5ZYygMg",
             }
         '''
-        video = VideoCore(videoLink, "getInfo", resultMode, timeout, True)
+        video = VideoCore(videoLink, "getInfo", resultMode, timeout, True, session=session, deadline=deadline, thumbnailMode=thumbnailMode, searchEnrichment=searchEnrichment)
         await video.async_html_create()
         video.post_request_only_html_processing()
         return video.result
 
     @staticmethod
-    async def getFormats(videoLink: str, resultMode: int = ResultMode.dict, timeout: int = 2) -> Union[dict, None]:
+    async def getFormats(videoLink: str, resultMode: int = ResultMode.dict, timeout: int = 2, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None) -> Union[dict, None]:
         '''Fetches formats  for the given video link or ID.
         Returns None if video is unavailable.
 
         Args:
             videoLink (str): link or ID of the video on YouTube.
+            session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
+            deadline (Deadline | float, optional): Time budget of the whole call in seconds, including retries. Defaults to None.
 
         Examples:
 
@@ -532,10 +566,70 @@ class Video:
                 }
             }
         '''
-        video = VideoCore(videoLink, "getFormats", resultMode, timeout, False)
+        video = VideoCore(videoLink, "getFormats", resultMode, timeout, False, session=session, deadline=deadline)
         await video.async_create()
         return video.result
 
+    @staticmethod
+    def _fetchOne(infoOnly: bool, resultMode: int, timeout: Optional[int], session: Optional[Session],
+                  deadline: Union[Deadline, float, None], thumbnailMode: int, searchEnrichment: bool):
+        VideoCore.checkResultMode(resultMode)
+        # Every video of a batch shares the session & the deadline, but makes its own player request.
+        deadline = Deadline.of(deadline)
+
+        async def fetch(videoLink: str) -> dict:
+            video = VideoCore(videoLink, "getInfo" if infoOnly else None, resultMode, timeout, False, "ANDROID", session=session, deadline=deadline, thumbnailMode=thumbnailMode, searchEnrichment=searchEnrichment)
+            await video.async_create()
+            return video.result
+        return fetch
+
+    @staticmethod
+    async def getMany(videoLinks: Iterable[str], concurrency: int = 10, infoOnly: bool = False, resultMode: int = ResultMode.dict, timeout: int = 2, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None, thumbnailMode: int = ThumbnailMode.synthesized, searchEnrichment: bool = True) -> List[Union[dict, Exception]]:
+        '''Fetches information and formats for many video links or IDs, up to `concurrency` at a time, on the
+        pooled connections of the session.
+
+        Args:
+            videoLinks (iterable): links or IDs of the videos on YouTube.
+            concurrency (int, optional): Maximum number of videos fetched at the same time. Defaults to 10.
+            infoOnly (bool, optional): Fetches only information, like `Video.getInfo`, without downloading
+                formats. Defaults to False.
+            session (Session, optional): Pooled session used for the requests. Defaults to the process-wide session.
+            deadline (Deadline | float, optional): Time budget of the whole batch in seconds. Videos not fetched
+                in time fail with `YouTubeDeadlineExceeded`. Defaults to None.
+            thumbnailMode (int, optional): See `Video.get`. Defaults to ThumbnailMode.synthesized.
+            searchEnrichment (bool, optional): See `Video.get`. Defaults to True.
+
+        Returns:
+            list: The result of every video, in the order of `videoLinks`. A video that could not be fetched is
+            replaced by the exception raised for it, the others are still returned.
+
+        Examples:
+
+            >>> videos = await Video.getMany(["E07s5ZYygMg", "K4DyBUG242c"], concurrency = 20)
+            >>> [video["title"] for video in videos if not isinstance(video, Exception)]
+            ['Harry Styles - Watermelon Sugar (Official Video)', 'Cartoon - On & On (feat. Daniel Levi) [NCS Release]']
+        '''
+        fetch = Video._fetchOne(infoOnly, resultMode, timeout, session, deadline, thumbnailMode, searchEnrichment)
+        return await gatherConcurrently(fetch, videoLinks, concurrency)
+
+    @staticmethod
+    async def iterMany(videoLinks: Iterable[str], concurrency: int = 10, infoOnly: bool = False, resultMode: int = ResultMode.dict, timeout: int = 2, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None, thumbnailMode: int = ThumbnailMode.synthesized, searchEnrichment: bool = True) -> AsyncIterator[Tuple[str, Union[dict, Exception]]]:
+        '''Fetches many video links or IDs like `Video.getMany`, and yields `(videoLink, result)` as soon as each
+        video is fetched. `videoLinks` is read as videos complete, so it can be a long or endless iterator.
+        Fetches still running are cancelled when the loop is left early.
+
+        Examples:
+
+            >>> async for videoLink, video in Video.iterMany(videoIds, concurrency = 20):
+            >>>     if isinstance(video, Exception):
+            >>>         print(videoLink, "failed:", video)
+            >>>     else:
+            >>>         print(videoLink, video["title"])
+        '''
+        fetch = Video._fetchOne(infoOnly, resultMode, timeout, session, deadline, thumbnailMode, searchEnrichment)
+        async for _, videoLink, result in iterConcurrently(fetch, videoLinks, concurrency):
+            yield videoLink, result
+
 
 class Suggestions:
     '''Gets search suggestions for the given query.
@@ -570,17 +664,18 @@ class Suggestions:
     '''
 
     @staticmethod
-    async def get(query: str, language: str = 'en', region: str = 'US', mode: int = ResultMode.dict):
+    async def get(query: str, language: str = 'en', region: str = 'US', mode: int = ResultMode.dict, session: Optional[Session] = None):
         '''Fetches & returns the search suggestions for the given query.
 
         Args:
             language (str, optional): Sets the language of the result. Defaults to 'en'.
             region (str, optional): Sets the region of the result. Defaults to 'US'.
+            session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
 
         Returns:
             Union[str, dict]: Returns JSON or dictionary.
         '''
-        suggestionsInternal = SuggestionsCore(language=language, region=region)
+        suggestionsInternal = SuggestionsCore(language=language, region=region, session=session)
         suggestions = await suggestionsInternal._getAsync(query, mode)
         return suggestions
 
@@ -600,6 +695,7 @@ class Playlist:
 
     Args:
         playlistLink (str): link of the playlist on YouTube.
+        session (Session, optional): Pooled session used for the requests. Defaults to the process-wide session.
     '''
     playlistLink = None
     videos = []
@@ -607,13 +703,14 @@ class Playlist:
     hasMoreVideos = True
     __playlist = None
 
-    def __init__(self, playlistLink: str):
+    def __init__(self, playlistLink: str, session: Optional[Session] = None):
         self.playlistLink = playlistLink
+        self.session = session
 
     async def init(self) -> None:
         '''Initializes the playlist by fetching the first batch of videos.'''
         if not self.info:
-            self.__playlist = PlaylistCore(self.playlistLink, None, ResultMode.dict, 2)
+            self.__playlist = PlaylistCore(self.playlistLink, None, ResultMode.dict, 2, session=self.session)
             await self.__playlist.async_create()
             self.info = copy.deepcopy(self.__playlist.result)
             self.videos = self.__playlist.result['videos']
@@ -635,12 +732,13 @@ class Playlist:
             self.hasMoreVideos = self.__playlist.continuationKey != None
 
     @staticmethod
-    async def get(playlistLink: str) -> Union[dict, str, None]:
+    async def get(playlistLink: str, session: Optional[Session] = None) -> Union[dict, str, None]:
         '''Fetches information and videos for the given playlist link.
         Returns None if playlist is unavailable.
 
         Args:
             playlistLink (str): link of the playlist on YouTube.
+            session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
 
         Examples:
 
@@ -1183,17 +1281,18 @@ class Playlist:
                 ]
             }
         '''
-        playlist = PlaylistCore(playlistLink, None, ResultMode.dict, 2)
+        playlist = PlaylistCore(playlistLink, None, ResultMode.dict, 2, session=session)
         await playlist.async_create()
         return playlist.playlistComponent
 
     @staticmethod
-    async def getInfo(playlistLink: str) -> Union[dict, str, None]:
+    async def getInfo(playlistLink: str, session: Optional[Session] = None) -> Union[dict, str, None]:
         '''Fetches only information for the given playlist link.
         Returns None if playlist is unavailable.
 
         Args:
             playlistLink (str): link of the playlist on YouTube.
+            session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
 
         Examples:
 
@@ -1253,17 +1352,18 @@ class Playlist:
                 }
             }
         '''
-        playlist = PlaylistCore(playlistLink, 'getInfo', ResultMode.dict, 2)
+        playlist = PlaylistCore(playlistLink, 'getInfo', ResultMode.dict, 2, session=session)
         await playlist.async_create()
         return playlist.playlistComponent
 
     @staticmethod
-    async def getVideos(playlistLink: str) -> Union[dict, str, None]:
+    async def getVideos(playlistLink: str, session: Optional[Session] = None) -> Union[dict, str, None]:
         '''Fetches only videos in the given playlist from link.
         Returns None if playlist is unavailable.
 
         Args:
             playlistLink (str): link of the playlist on YouTube.
+            session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
 
         Examples:
 
@@ -1755,7 +1855,7 @@ class Playlist:
                 ]
             }
         '''
-        playlist = PlaylistCore(playlistLink, 'getVideos', ResultMode.dict, 2)
+        playlist = PlaylistCore(playlistLink, 'getVideos', ResultMode.dict, 2, session=session)
         await playlist.async_create()
         return playlist.playlistComponent
 
@@ -1768,6 +1868,7 @@ class Hashtag(HashtagCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        session (Session, optional): Pooled session used for the requests. Defaults to the process-wide session.
     
     Examples:
         >>> hashtag = Hashtags('ncs', limit = 1)
@@ -1836,23 +1937,24 @@ class Hashtag(HashtagCore):
         }
     '''
 
-    def __init__(self, hashtag: str, limit: int = 60, language: str = 'en', region: str = 'US', timeout: int = None):
-        super().__init__(hashtag, limit, language, region, timeout)
+    def __init__(self, hashtag: str, limit: int = 60, language: str = 'en', region: str = 'US', timeout: int = None, session: Optional[Session] = None):
+        super().__init__(hashtag, limit, language, region, timeout, session=session)
 
-    async def next(self) -> dict:
+    async def next(self, mode: int = ResultMode.dict) -> Union[str, dict]:
         '''Gets the videos from the next page.
+        Args:
+            mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
         Returns:
-            dict: Returns dictionary containing the search result.
+            Union[str, dict]: Returns the search result like `result`.
         '''
         self.response = None
         self.resultComponents = []
         if self.params is None:
-            await self._asyncGetParams()
-        await self._asyncMakeRequest()
-        self._getComponents()
-        return {
-            'result': self.resultComponents,
-        }
+            await self.async_create()
+        elif self.continuationKey:
+            await self._asyncMakeRequest()
+            self._getComponents()
+        return self.result(mode)
 
 
 class Comments:
@@ -1860,45 +1962,52 @@ class Comments:
     hasMoreComments = True
     __comments = None
 
-    def __init__(self, playlistLink: str, timeout: int = None):
+    def __init__(self, playlistLink: str, timeout: int = None, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None):
         self.timeout = timeout
         self.playlistLink = playlistLink
+        self.session = session
+        self.deadline = deadline
 
     async def init(self) -> None:
         """Initialize comments by fetching the first batch."""
         if self.__comments is None:
-            self.__comments = CommentsCore(self.playlistLink)
+            self.__comments = CommentsCore(self.playlistLink, self.timeout, session=self.session, deadline=self.deadline)
             await self.__comments.async_create()
             self.comments = self.__comments.commentsComponent
             self.hasMoreComments = self.__comments.continuationKey is not None
 
-    async def getNextComments(self) -> None:
+    async def getNextComments(self, deadline: Union[Deadline, float, None] = None) -> None:
         if self.__comments is None:
-            self.__comments = CommentsCore(self.playlistLink)
+            self.__comments = CommentsCore(self.playlistLink, self.timeout, session=self.session, deadline=deadline or self.deadline)
             await self.__comments.async_create()
         else:
+            self.__comments.deadline = Deadline.of(deadline or self.deadline)
             await self.__comments.async_create_next()
         self.comments = self.__comments.commentsComponent
         self.hasMoreComments = self.__comments.continuationKey is not None
 
     @staticmethod
-    async def get(playlistLink: str) -> Union[dict, str, None]:
-        pc = CommentsCore(playlistLink)
+    async def get(playlistLink: str, timeout: int = None, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None, mode: int = ResultMode.dict) -> Union[dict, str, None]:
+        pc = CommentsCore(playlistLink, timeout, session=session, deadline=deadline)
         await pc.async_create()
+        if mode == ResultMode.objects:
+            return withObjects(pc.commentsComponent, 'result', CommentResult)
         return pc.commentsComponent
 
 
 class Transcript:
     @staticmethod
-    async def get(videoLink: str, params: str = None):
-        transcript_core = TranscriptCore(videoLink, params)
+    async def get(videoLink: str, params: str = None, session: Optional[Session] = None, mode: int = ResultMode.dict):
+        transcript_core = TranscriptCore(videoLink, params, session=session)
         await transcript_core.async_create()
+        if mode == ResultMode.objects:
+            return withObjects(transcript_core.result, 'segments', TranscriptSegment)
         return transcript_core.result
 
 
 class Channel(ChannelCore):
-    def __init__(self, channel_id: str, request_type: str = ChannelRequestType.playlists):
-        super().__init__(channel_id, request_type)
+    def __init__(self, channel_id: str, request_type: str = ChannelRequestType.playlists, session: Optional[Session] = None):
+        super().__init__(channel_id, request_type, session=session)
 
     async def init(self):
         await self.async_create()
@@ -1907,7 +2016,7 @@ class Channel(ChannelCore):
         await self.async_next()
 
     @staticmethod
-    async def get(channel_id: str, request_type: str = ChannelRequestType.playlists):
-        channel_core = ChannelCore(channel_id, request_type)
+    async def get(channel_id: str, request_type: str = ChannelRequestType.playlists, session: Optional[Session] = None):
+        channel_core = ChannelCore(channel_id, request_type, session=session)
         await channel_core.async_create()
         return channel_core.result
@@ -1,8 +1,9 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from youtubesearchpython.core.channelsearch import ChannelSearchCore
 from youtubesearchpython.core.constants import *
 from youtubesearchpython.core.search import SearchCore
+from youtubesearchpython.core.session import Session
 
 
 class Search(SearchCore):
@@ -14,6 +15,7 @@ class Search(SearchCore):
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
         timeout (int, optional): Sets the request timeout in seconds. Defaults to 10 seconds. Pass None to use default.
+        session (Session, optional): Sets the pooled session used for the requests. Defaults to the process-wide session.
 
     Examples:
         Calling `result` method gives the search result.
@@ -72,12 +74,12 @@ class Search(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, session: Optional[Session] = None):
         self.searchMode = (True, True, True)
-        super().__init__(query, limit, language, region, None, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, None, timeout, session=session)  # type: ignore
 
-    async def next(self) -> Dict[str, Any]:
-        return await self._nextAsync()  # type: ignore
+    async def next(self, mode: int = ResultMode.dict) -> Union[str, Dict[str, Any]]:
+        return await self._nextAsync(mode)  # type: ignore
 
 
 class VideosSearch(SearchCore):
@@ -89,6 +91,7 @@ class VideosSearch(SearchCore):
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
         timeout (int, optional): Sets the request timeout in seconds. Defaults to 10 seconds. Pass None to use default.
+        session (Session, optional): Sets the pooled session used for the requests. Defaults to the process-wide session.
 
     Examples:
         Calling `result` method gives the search result.
@@ -147,12 +150,12 @@ class VideosSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, session: Optional[Session] = None):
         self.searchMode = (True, False, False)
-        super().__init__(query, limit, language, region, SearchMode.videos, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, SearchMode.videos, timeout, session=session)  # type: ignore
 
-    async def next(self) -> Dict[str, Any]:
-        return await self._nextAsync()  # type: ignore
+    async def next(self, mode: int = ResultMode.dict) -> Union[str, Dict[str, Any]]:
+        return await self._nextAsync(mode)  # type: ignore
 
 
 class ChannelsSearch(SearchCore):
@@ -164,6 +167,7 @@ class ChannelsSearch(SearchCore):
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
         timeout (int, optional): Sets the request timeout in seconds. Defaults to 10 seconds. Pass None to use default.
+        session (Session, optional): Sets the pooled session used for the requests. Defaults to the process-wide session.
 
     Examples:
         Calling `result` method gives the search result.
@@ -197,12 +201,12 @@ class ChannelsSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, session: Optional[Session] = None):
         self.searchMode = (False, True, False)
-        super().__init__(query, limit, language, region, SearchMode.channels, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, SearchMode.channels, timeout, session=session)  # type: ignore
 
-    async def next(self) -> Dict[str, Any]:
-        return await self._nextAsync()  # type: ignore
+    async def next(self, mode: int = ResultMode.dict) -> Union[str, Dict[str, Any]]:
+        return await self._nextAsync(mode)  # type: ignore
 
 
 class PlaylistsSearch(SearchCore):
@@ -214,6 +218,7 @@ class PlaylistsSearch(SearchCore):
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
         timeout (int, optional): Sets the request timeout in seconds. Defaults to 10 seconds. Pass None to use default.
+        session (Session, optional): Sets the pooled session used for the requests. Defaults to the process-wide session.
 
     Examples:
         Calling `result` method gives the search result.
@@ -260,12 +265,12 @@ class PlaylistsSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, session: Optional[Session] = None):
         self.searchMode = (False, False, True)
-        super().__init__(query, limit, language, region, SearchMode.playlists, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, SearchMode.playlists, timeout, session=session)  # type: ignore
 
-    async def next(self) -> Dict[str, Any]:
-        return await self._nextAsync()  # type: ignore
+    async def next(self, mode: int = ResultMode.dict) -> Union[str, Dict[str, Any]]:
+        return await self._nextAsync(mode)  # type: ignore
 
 class CustomSearch(SearchCore):
     '''Performs custom search in YouTube with search filters or sorting orders. 
@@ -287,6 +292,7 @@ class CustomSearch(SearchCore):
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
         timeout (int, optional): Sets the request timeout in seconds. Defaults to 10 seconds. Pass None to use default.
+        session (Session, optional): Sets the pooled session used for the requests. Defaults to the process-wide session.
     
     Examples:
         Calling `result` method gives the search result.
@@ -345,12 +351,12 @@ class CustomSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, searchPreferences: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, searchPreferences: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, session: Optional[Session] = None):
         self.searchMode = (True, True, True)
-        super().__init__(query, limit, language, region, searchPreferences, timeout)  # type: ignore
+        super().__init__(query, limit, language, region, searchPreferences, timeout, session=session)  # type: ignore
 
-    async def next(self) -> Dict[str, Any]:
-        return await self._nextAsync()  # type: ignore
+    async def next(self, mode: int = ResultMode.dict) -> Union[str, Dict[str, Any]]:
+        return await self._nextAsync(mode)  # type: ignore
 
 class ChannelSearch(ChannelSearchCore):
     '''Searches for videos in specific channel in YouTube.
@@ -361,6 +367,7 @@ class ChannelSearch(ChannelSearchCore):
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
         timeout (int, optional): Sets the request timeout in seconds. Defaults to 10 seconds. Pass None to use default.
+        session (Session, optional): Sets the pooled session used for the requests. Defaults to the process-wide session.
 
     Examples:
         Calling `result` method gives the search result.
@@ -426,5 +433,5 @@ class ChannelSearch(ChannelSearchCore):
         }
     '''
 
-    def __init__(self, query: str, browseId: str, language: str = 'en', region: str = 'US', searchPreferences: str = "EgZzZWFyY2g%3D", timeout: Optional[int] = None):
-        super().__init__(query, language, region, searchPreferences, browseId, timeout)  # type: ignore
+    def __init__(self, query: str, browseId: str, language: str = 'en', region: str = 'US', searchPreferences: str = "EgZzZWFyY2g%3D", timeout: Optional[int] = None, session: Optional[Session] = None):
+        super().__init__(query, language, region, searchPreferences, browseId, timeout, session=session)  # type: ignore
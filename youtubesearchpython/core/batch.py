@@ -0,0 +1,88 @@
+import asyncio
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, Tuple, TypeVar
+
+from youtubesearchpython.core.exceptions import YouTubeSearchError
+
+T = TypeVar('T')
+
+
+def _checkConcurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise YouTubeSearchError(f'Concurrency must be positive, got {concurrency}')
+
+
+def mapConcurrently(function: Callable[[T], Any], items: Iterable[T], concurrency: int) -> List[Any]:
+    '''Calls `function` on every item from up to `concurrency` threads, and returns the results in input order.
+    An item whose call raised is replaced by the exception.
+    '''
+    _checkConcurrency(concurrency)
+
+    def call(item: T) -> Any:
+        try:
+            return function(item)
+        except Exception as error:
+            return error
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(call, items))
+
+
+async def iterConcurrently(function: Callable[[T], Awaitable[Any]], items: Iterable[T],
+                           concurrency: int) -> AsyncIterator[Tuple[int, T, Any]]:
+    '''Awaits `function` on every item, up to `concurrency` at a time, and yields `(index, item, result)` as soon
+    as each call completes. A call that raised gives the exception as result. Items are read from `items` only
+    as calls complete, so that it can be a long or endless iterator. Calls still running are cancelled when
+    the iteration is stopped early.
+    '''
+    _checkConcurrency(concurrency)
+    pending = enumerate(items)
+    done = asyncio.Queue()
+    running = 0
+
+    async def call(index: int, item: T) -> None:
+        try:
+            result = await function(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            result = error
+        done.put_nowait((index, item, result))
+
+    tasks = set()
+
+    def startNext() -> bool:
+        nonlocal running
+        for index, item in itertools.islice(pending, 1):
+            task = asyncio.ensure_future(call(index, item))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            running += 1
+            return True
+        return False
+
+    try:
+        while running < concurrency and startNext():
+            pass
+        while running:
+            completed = await done.get()
+            running -= 1
+            startNext()
+            yield completed
+    finally:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def gatherConcurrently(function: Callable[[T], Awaitable[Any]], items: Iterable[T],
+                             concurrency: int) -> List[Any]:
+    '''Awaits `function` on every item, up to `concurrency` at a time, and returns the results in input order.
+    An item whose call raised is replaced by the exception.
+    '''
+    results = {}
+    async for index, _, result in iterConcurrently(function, items, concurrency):
+        results[index] = result
+    return [results[index] for index in range(len(results))]
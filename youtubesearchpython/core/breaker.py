@@ -0,0 +1,118 @@
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from youtubesearchpython.core.exceptions import YouTubeCircuitOpenError
+from youtubesearchpython.core.ratelimit import RateLimiter
+
+
+class Circuit:
+    '''State of the circuit of a single endpoint: 'closed', 'open' or 'halfOpen'.'''
+
+    def __init__(self, breaker: 'CircuitBreaker', endpoint: str):
+        self.breaker = breaker
+        self.endpoint = endpoint
+        self.state = 'closed'
+        self.outcomes = deque()
+        self.openedAt = 0.0
+        self.probes = 0
+        self._lock = threading.Lock()
+
+    def _trim(self, now: float) -> None:
+        while self.outcomes and self.outcomes[0][0] < now - self.breaker.window:
+            self.outcomes.popleft()
+
+    def acquire(self) -> bool:
+        '''Lets a request through, or raises YouTubeCircuitOpenError. Returns whether the request is a probe.'''
+        with self._lock:
+            now = time.monotonic()
+            if self.state == 'open' and now - self.openedAt >= self.breaker.openDuration:
+                self.state = 'halfOpen'
+                self.probes = 0
+            if self.state == 'closed':
+                return False
+            if self.state == 'halfOpen' and self.probes < self.breaker.halfOpenProbes:
+                self.probes += 1
+                return True
+            retryIn = max(0.0, self.breaker.openDuration - (now - self.openedAt))
+        raise YouTubeCircuitOpenError(f'Circuit of {self.endpoint} is open after repeated failures, retry in {retryIn:.1f} s.')
+
+    def release(self, probe: bool) -> None:
+        '''Gives back a probe let through by `acquire` whose request was never completed.'''
+        if probe:
+            with self._lock:
+                self.probes -= 1
+
+    def record(self, failed: bool, probe: bool = False) -> None:
+        '''Records the outcome of a request let through by `acquire`.'''
+        with self._lock:
+            now = time.monotonic()
+            if probe or self.state == 'halfOpen':
+                if failed:
+                    self.state = 'open'
+                    self.openedAt = now
+                elif probe and self.state == 'halfOpen':
+                    self.probes -= 1
+                    if self.probes <= 0:
+                        self.state = 'closed'
+                        self.outcomes.clear()
+                return
+            self.outcomes.append((now, failed))
+            self._trim(now)
+            failures = sum(1 for _, outcome in self.outcomes if outcome)
+            if len(self.outcomes) >= self.breaker.minimumRequests and failures / len(self.outcomes) >= self.breaker.failureRate:
+                self.state = 'open'
+                self.openedAt = now
+                self.outcomes.clear()
+
+
+class CircuitBreaker:
+    '''Fails requests fast once an endpoint keeps failing, instead of letting each of them wait out its timeout.
+
+    Outcomes are tracked per endpoint (keyed like `RateLimiter`) over a sliding time window. A response with a
+    5xx or 429 status, and a connection error or timeout, count as failures. Once at least `minimumRequests`
+    outcomes are known and the share of failures reaches `failureRate`, the circuit opens: every request to
+    the endpoint raises `YouTubeCircuitOpenError` right away for `openDuration` seconds. Then up to
+    `halfOpenProbes` requests are let through as probes; the circuit closes when they succeed, and opens again
+    as soon as one of them fails.
+
+    Args:
+        failureRate (float, optional): Share of failed requests opening the circuit. Defaults to 0.5.
+        minimumRequests (int, optional): Outcomes needed in the window before the circuit can open. Defaults to 10.
+        window (float, optional): Seconds outcomes are remembered for. Defaults to 30.
+        openDuration (float, optional): Seconds an open circuit fails requests for, before probing. Defaults to 10.
+        halfOpenProbes (int, optional): Concurrent probe requests allowed while half-open. Defaults to 1.
+
+    Examples:
+        >>> session = Session(circuitBreaker = CircuitBreaker(failureRate = 0.3, openDuration = 5))
+    '''
+
+    def __init__(self, failureRate: float = 0.5, minimumRequests: int = 10, window: float = 30.0,
+                 openDuration: float = 10.0, halfOpenProbes: int = 1):
+        self.failureRate = failureRate
+        self.minimumRequests = max(1, minimumRequests)
+        self.window = window
+        self.openDuration = openDuration
+        self.halfOpenProbes = max(1, halfOpenProbes)
+        self.circuits = {}
+        self._lock = threading.Lock()
+
+    def circuit(self, url: str) -> Circuit:
+        '''Returns the circuit of the endpoint of `url`.'''
+        endpoint = RateLimiter.endpoint(url)
+        circuit = self.circuits.get(endpoint)
+        if circuit is None:
+            with self._lock:
+                circuit = self.circuits.setdefault(endpoint, Circuit(self, endpoint))
+        return circuit
+
+    def state(self, endpoint: str) -> str:
+        '''Returns the state of the circuit of `endpoint`, e.g. 'search'.'''
+        circuit = self.circuits.get(endpoint)
+        return circuit.state if circuit is not None else 'closed'
+
+    @staticmethod
+    def isFailure(statusCode: Optional[int]) -> bool:
+        '''Returns whether a response status, or None for a request that got no response, counts as a failure.'''
+        return statusCode is None or statusCode == 429 or statusCode >= 500
@@ -0,0 +1,550 @@
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+import httpx
+
+from youtubesearchpython.core.exceptions import YouTubeSearchError
+from youtubesearchpython.core.ratelimit import RateLimiter
+from youtubesearchpython.core.transport import RecordReplayTransport
+
+_bypass = ContextVar('youtubesearchpython.cache.bypass', default=False)
+
+
+class ResponseCache:
+    '''In-memory cache of successful responses, with a time to live per endpoint and LRU eviction.
+
+    Requests are keyed by their method, endpoint & query (language & region included), field mask and JSON
+    body, leaving out fields that differ between identical requests such as `visitorData` & click tracking
+    (see `volatileFields`). Endpoints are named like in `RateLimiter`, and only the ones in `ttls` are cached.
+
+    Signed stream URLs expire, so `player` responses are only cached when their field mask leaves
+    `streamingData` out, e.g. for `Video.getInfo`: video metadata is cached, stream URLs never are.
+
+    Once `maxEntries` responses or `maxBytes` of bodies are cached, the least recently used ones are evicted.
+    Hits, misses, expirations & evictions are counted in `stats`. Requests sent within `bypass()` skip the
+    cache, and refresh it with their response.
+
+    With `staleWhileRevalidate`, an expired response is still served right away for a while, and the `Session`
+    refreshes it in the background, once per key however many callers hit it. Served responses carry their
+    `age` in seconds, and whether they are `stale`.
+
+    Args:
+        ttls (dict, optional): Maps an endpoint to the seconds its responses are kept for, merged into
+            `ResponseCache.defaultTtls`. A ttl of 0 or None stops caching the endpoint. Defaults to None.
+        maxEntries (int, optional): Maximum number of cached responses. Defaults to 1024.
+        maxBytes (int, optional): Maximum total size of the cached bodies, in bytes. Defaults to 64 MiB.
+        staleWhileRevalidate (dict, optional): Maps an endpoint to the seconds its expired responses are still
+            served for while being refreshed, e.g. {'search': 3600, 'player': 86400, 'browse': 3600}.
+            Defaults to None.
+
+    Examples:
+        >>> session = Session(cache = ResponseCache(ttls = {'search': 60}, maxEntries = 500))
+        >>> search = VideosSearch('NoCopyrightSounds', session = session)
+        >>> search = VideosSearch('NoCopyrightSounds', session = session)  # served from the cache
+        >>> session.cache.stats
+        {'hits': 1, 'staleHits': 0, 'misses': 1, 'expirations': 0, 'evictions': 0, 'entries': 1, 'bytes': 413802}
+        >>> with session.cache.bypass():
+        >>>     search = VideosSearch('NoCopyrightSounds', session = session)  # sent to YouTube
+        >>> session = Session(cache = ResponseCache(ttls = {'search': 60}, staleWhileRevalidate = {'search': 600}))
+    '''
+
+    defaultTtls = {
+        'search': 300,
+        'player': 3600,
+        'browse': 600,
+        'next': 300,
+        'get_transcript': 3600,
+        'clients1.google.com': 3600,
+    }
+    # Paths of the body fields which differ between otherwise identical requests.
+    volatileFields = (
+        ('context', 'client', 'visitorData'),
+        ('context', 'clickTracking'),
+        ('context', 'adSignalsInfo'),
+        ('context', 'request', 'consistencyTokenJars'),
+        ('context', 'request', 'internalExperimentFlags'),
+    )
+    cacheableMethods = ('GET', 'POST')
+
+    def __init__(self, ttls: Optional[Dict[str, Optional[float]]] = None, maxEntries: int = 1024,
+                 maxBytes: int = 64 * 1024 * 1024, staleWhileRevalidate: Optional[Dict[str, float]] = None):
+        if maxEntries < 1 or maxBytes < 1:
+            raise YouTubeSearchError(f'Cache size must be positive, got {maxEntries} entries & {maxBytes} bytes')
+        self.ttls = {**self.defaultTtls, **(ttls or {})}
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.staleWhileRevalidate = dict(staleWhileRevalidate or {})
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.staleHits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> dict:
+        '''Returns the hits (stale ones included), misses, expirations & evictions so far, and the current number
+        & size of entries.
+        '''
+        entries, size = self._size()
+        return {
+            'hits': self.hits,
+            'staleHits': self.staleHits,
+            'misses': self.misses,
+            'expirations': self.expirations,
+            'evictions': self.evictions,
+            'entries': entries,
+            'bytes': size,
+        }
+
+    @staticmethod
+    @contextmanager
+    def bypass() -> Iterator[None]:
+        '''Sends the requests made within it to YouTube, in the current thread or task, and caches their
+        fresh responses.
+        '''
+        token = _bypass.set(True)
+        try:
+            yield
+        finally:
+            _bypass.reset(token)
+
+    def ttl(self, url: str) -> Optional[float]:
+        '''Returns the seconds responses from `url` are kept for, or None when they are not cached.'''
+        return self.ttls.get(RateLimiter.endpoint(url)) or None
+
+    def staleTtl(self, url: str) -> float:
+        '''Returns the seconds expired responses from `url` are still served for while being refreshed.'''
+        return self.staleWhileRevalidate.get(RateLimiter.endpoint(url)) or 0.0
+
+    def startRefresh(self, key: str) -> bool:
+        '''Returns whether the caller should refresh the stale response under `key`, False while another
+        refresh of it is running.
+        '''
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def endRefresh(self, key: str) -> None:
+        '''Marks the refresh started with `startRefresh` as finished, successful or not.'''
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def key(self, method: str, url: str, **kwargs) -> Optional[str]:
+        '''Returns the key a request is cached under, or None when its response is not cacheable.'''
+        if method.upper() not in self.cacheableMethods or self.ttl(url) is None:
+            return None
+        if RateLimiter.endpoint(url) == 'player':
+            fieldMask = httpx.Headers(kwargs.get('headers') or {}).get('X-Goog-FieldMask')
+            if not fieldMask or 'streamingData' in fieldMask:
+                return None
+        body = kwargs.get('json')
+        if isinstance(body, dict):
+            kwargs = {**kwargs, 'json': self._canonicalBody(body)}
+        return RecordReplayTransport.fingerprint(method, url, **kwargs)
+
+    def _canonicalBody(self, body: dict) -> dict:
+        body = copy.deepcopy(body)
+        for path in self.volatileFields:
+            parent = body
+            for name in path[:-1]:
+                parent = parent.get(name) if isinstance(parent, dict) else None
+            if isinstance(parent, dict):
+                parent.pop(path[-1], None)
+        return body
+
+    def get(self, key: str) -> Optional[httpx.Response]:
+        '''Returns a copy of the response cached under `key`, or None on a miss or inside `bypass()`.'''
+        if _bypass.get():
+            return None
+        loaded = self._load(key)
+        if loaded is None:
+            return None
+        age, stale, (statusCode, headers, content, method, url) = loaded
+        response = httpx.Response(statusCode, headers=headers, content=content, request=httpx.Request(method, url))
+        response.cached = True
+        response.age = age
+        response.stale = stale
+        return response
+
+    def put(self, key: str, method: str, url: str, response: httpx.Response) -> None:
+        '''Caches the `response` to a request under `key`, when it succeeded.'''
+        ttl = self.ttl(url)
+        if ttl is None or response.status_code != 200:
+            return
+        # The body is stored decoded, headers describing the wire format no longer apply to it.
+        headers = [
+            (name, value) for name, value in response.headers.multi_items()
+            if name.lower() not in ('content-encoding', 'content-length', 'transfer-encoding', 'set-cookie')
+        ]
+        self._store(key, ttl, self.staleTtl(url), (response.status_code, headers, response.content, method, url))
+
+    def _load(self, key: str) -> Optional[tuple]:
+        # Returns the age, staleness & (statusCode, headers, content, method, url) entry under `key` unless
+        # expired, and counts the lookup. Storage backends override this, `_store`, `_size` & `clear`.
+        with self._lock:
+            item = self.entries.get(key)
+            now = time.monotonic()
+            if item is None:
+                self.misses += 1
+                return None
+            storedAt, freshUntil, expiresAt, entry = item
+            if expiresAt <= now:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self._countHit(freshUntil <= now)
+        return now - storedAt, freshUntil <= now, entry
+
+    def _countHit(self, stale: bool) -> None:
+        # Called with the lock held.
+        self.hits += 1
+        if stale:
+            self.staleHits += 1
+
+    def _store(self, key: str, ttl: float, staleTtl: float, entry: tuple) -> None:
+        size = len(entry[2])
+        if size > self.maxBytes:
+            return
+        with self._lock:
+            if key in self.entries:
+                self._remove(key)
+            now = time.monotonic()
+            self.entries[key] = (now, now + ttl, now + ttl + staleTtl, entry)
+            self.bytes += size
+            while len(self.entries) > self.maxEntries or self.bytes > self.maxBytes:
+                self._remove(next(iter(self.entries)))
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        item = self.entries.pop(key)
+        self.bytes -= len(item[3][2])
+
+    def _size(self) -> Tuple[int, int]:
+        return len(self.entries), self.bytes
+
+    def clear(self) -> None:
+        '''Removes every cached response.'''
+        with self._lock:
+            self.entries.clear()
+            self.bytes = 0
+
+
+class SQLiteCache(ResponseCache):
+    '''`ResponseCache` kept in a SQLite database file, shared by every process using the same `path` and
+    surviving restarts.
+
+    The database runs in WAL mode, so lookups from many processes & threads go on while one of them writes.
+    A lookup or write the database fails, e.g. while it stays locked for longer than `busyTimeout`, counts as a
+    miss or is skipped, so the cache never fails a request.
+    Bodies are stored zlib compressed, and `maxBytes` bounds their compressed size. Entries expire after the
+    time to live of their endpoint, and the least recently used ones are evicted beyond `maxEntries` or
+    `maxBytes`. Hits, misses, expirations & evictions in `stats` are counted per process, while `entries` &
+    `bytes` describe the whole database.
+
+    Args:
+        path (str): Path of the database file, created when missing.
+        ttls (dict, optional): Maps an endpoint to the seconds its responses are kept for, merged into
+            `ResponseCache.defaultTtls`. Defaults to None.
+        maxEntries (int, optional): Maximum number of cached responses. Defaults to 100000.
+        maxBytes (int, optional): Maximum total size of the compressed bodies, in bytes. Defaults to 1 GiB.
+        busyTimeout (float, optional): Seconds to wait for another process writing to the database. Defaults to 5.
+        staleWhileRevalidate (dict, optional): Maps an endpoint to the seconds its expired responses are still
+            served for while being refreshed. Defaults to None.
+
+    Examples:
+        >>> session = Session(cache = SQLiteCache('/var/cache/youtube.db', ttls = {'search': 900}))
+        >>> search = VideosSearch('NoCopyrightSounds', session = session)
+    '''
+
+    schema = (
+        'CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, storedAt REAL NOT NULL, freshUntil REAL NOT NULL, '
+        'expiresAt REAL NOT NULL, usedAt REAL NOT NULL, '
+        'size INTEGER NOT NULL, statusCode INTEGER NOT NULL, headers TEXT NOT NULL, body BLOB NOT NULL, '
+        'method TEXT NOT NULL, url TEXT NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS responsesExpiresAt ON responses (expiresAt)',
+        'CREATE INDEX IF NOT EXISTS responsesUsedAt ON responses (usedAt)',
+        # Totals kept up to date by triggers, so that checking the limits does not scan the table.
+        'CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), entries INTEGER NOT NULL, bytes INTEGER NOT NULL)',
+        'INSERT OR IGNORE INTO totals (id, entries, bytes) VALUES (0, 0, 0)',
+        'CREATE TRIGGER IF NOT EXISTS responsesInsert AFTER INSERT ON responses BEGIN '
+        'UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size WHERE id = 0; END',
+        'CREATE TRIGGER IF NOT EXISTS responsesDelete AFTER DELETE ON responses BEGIN '
+        'UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size WHERE id = 0; END',
+    )
+    # A hit only refreshes the recency of its entry once it is this old, sparing most lookups a write.
+    touchInterval = 60.0
+
+    def __init__(self, path: str, ttls: Optional[Dict[str, Optional[float]]] = None, maxEntries: int = 100000,
+                 maxBytes: int = 1024 * 1024 * 1024, busyTimeout: float = 5.0,
+                 staleWhileRevalidate: Optional[Dict[str, float]] = None):
+        super().__init__(ttls=ttls, maxEntries=maxEntries, maxBytes=maxBytes, staleWhileRevalidate=staleWhileRevalidate)
+        self.path = path
+        self.busyTimeout = busyTimeout
+        self._local = threading.local()
+        # Every connection opened, by any thread, mapped to the process it belongs to, for `close`.
+        self._connections = {}
+        self._connectionsLock = threading.Lock()
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per thread, opened again in a forked child instead of sharing the parent's one, and
+        # after `close`.
+        connection = getattr(self._local, 'connection', None)
+        pid = os.getpid()
+        with self._connectionsLock:
+            if connection is not None and self._connections.get(connection) == pid:
+                return connection
+        # Only used by this thread, but closed by whichever thread calls `close`.
+        connection = sqlite3.connect(self.path, timeout=self.busyTimeout, isolation_level=None, check_same_thread=False)
+        connection.execute('PRAGMA journal_mode = WAL')
+        connection.execute('PRAGMA synchronous = NORMAL')
+        for statement in self.schema:
+            connection.execute(statement)
+        with self._connectionsLock:
+            self._connections[connection] = pid
+        self._local.connection = connection
+        return connection
+
+    def _write(self, function) -> None:
+        connection = self._connect()
+        # Takes the write lock upfront, so that concurrent writers wait for each other instead of failing.
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            function(connection)
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    def _tryWrite(self, function) -> None:
+        # The cache never fails a request: a write it cannot make, e.g. while another process holds the database
+        # locked for longer than `busyTimeout`, is skipped.
+        try:
+            self._write(function)
+        except sqlite3.Error:
+            pass
+
+    def _load(self, key: str) -> Optional[tuple]:
+        try:
+            row = self._connect().execute(
+                'SELECT storedAt, freshUntil, expiresAt, usedAt, statusCode, headers, body, method, url FROM responses '
+                'WHERE key = ?', (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            # A lookup the database cannot answer is a miss, the request is sent to YouTube.
+            row = None
+        now = time.time()
+        if row is None or row[2] <= now:
+            with self._lock:
+                self.misses += 1
+                if row is not None:
+                    self.expirations += 1
+            if row is not None:
+                self._tryWrite(lambda connection: connection.execute(
+                    'DELETE FROM responses WHERE key = ? AND expiresAt <= ?', (key, now)))
+            return None
+        storedAt, freshUntil, expiresAt, usedAt, statusCode, headers, body, method, url = row
+        if now - usedAt >= self.touchInterval:
+            self._tryWrite(lambda connection: connection.execute('UPDATE responses SET usedAt = ? WHERE key = ?', (now, key)))
+        with self._lock:
+            self._countHit(freshUntil <= now)
+        return now - storedAt, freshUntil <= now, (statusCode, json.loads(headers), zlib.decompress(body), method, url)
+
+    def _store(self, key: str, ttl: float, staleTtl: float, entry: tuple) -> None:
+        statusCode, headers, content, method, url = entry
+        body = zlib.compress(content)
+        if len(body) > self.maxBytes:
+            return
+        now = time.time()
+
+        def store(connection: sqlite3.Connection) -> None:
+            connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+            connection.execute(
+                'INSERT INTO responses (key, storedAt, freshUntil, expiresAt, usedAt, size, statusCode, headers, body, '
+                'method, url) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, now, now + ttl, now + ttl + staleTtl, now, len(body), statusCode, json.dumps(headers), body,
+                 method, url),
+            )
+            expired = connection.execute('DELETE FROM responses WHERE expiresAt <= ?', (now,)).rowcount
+            evicted = 0
+            while True:
+                entries, size = connection.execute('SELECT entries, bytes FROM totals WHERE id = 0').fetchone()
+                if entries <= self.maxEntries and size <= self.maxBytes:
+                    break
+                # Evicts the least recently used entries, one by one while only the size is over its limit.
+                evicted += connection.execute(
+                    'DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY usedAt LIMIT ?)',
+                    (max(1, entries - self.maxEntries),),
+                ).rowcount
+            with self._lock:
+                self.expirations += expired
+                self.evictions += evicted
+
+        self._tryWrite(store)
+
+    def _size(self) -> Tuple[int, int]:
+        return self._connect().execute('SELECT entries, bytes FROM totals WHERE id = 0').fetchone()
+
+    def clear(self) -> None:
+        '''Removes every cached response, for every process.'''
+        self._write(lambda connection: connection.execute('DELETE FROM responses'))
+
+    def close(self) -> None:
+        '''Closes the connections of every thread. A thread using the cache afterwards opens a new one.'''
+        pid = os.getpid()
+        with self._connectionsLock:
+            connections, self._connections = self._connections, {}
+        for connection, owner in connections.items():
+            # Connections inherited from the parent of a forked process are left to it.
+            if owner == pid:
+                connection.close()
+        self._local.connection = None
+
+
+class LookupCache:
+    '''Remembers the outcome of lookups made of several requests, so that repeating them makes no request.
+
+    Entries are keyed by a key, usually a video ID, & a feature, and kept for a time to live per feature:
+
+    - 'search': the publish time & hq720 thumbnail `Video.get` finds by searching for the video.
+    - 'thumbnail': whether a thumbnail URL probed by `ThumbnailMode.probe` or `ThumbnailMode.lazy` exists.
+
+    Every session has one, as `session.lookupCache`. Lookups within `ResponseCache.bypass()` ignore it. At most
+    `maxEntries` entries are kept, the least recently used are evicted first.
+
+    Args:
+        ttls (dict, optional): Maps a feature to the seconds its entries are kept for, merged into
+            `defaultTtls`. A ttl of 0 or None stops remembering the feature. Defaults to None.
+        maxEntries (int, optional): Maximum number of entries. Defaults to 10000.
+
+    Examples:
+        >>> session = Session(lookupCache = LookupCache(ttls = {'search': 86400}))
+        >>> video = Video.get('E07s5ZYygMg', session = session)
+        >>> session.lookupCache.stats
+        {'hits': 0, 'misses': 1, 'entries': 1}
+    '''
+
+    defaultTtls = {
+        'search': 3600,
+        'thumbnail': 86400,
+    }
+
+    def __init__(self, ttls: Optional[Dict[str, Optional[float]]] = None, maxEntries: int = 10000):
+        if maxEntries < 1:
+            raise YouTubeSearchError(f'Cache size must be positive, got {maxEntries} entries')
+        self.ttls = {**self.defaultTtls, **(ttls or {})}
+        self.maxEntries = maxEntries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> dict:
+        '''Returns the hits & misses so far, and the current number of entries.'''
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self.entries)}
+
+    def _lookup(self, key: str, feature: str) -> Optional[tuple]:
+        if _bypass.get():
+            return None
+        with self._lock:
+            entry = self.entries.get((key, feature))
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self.entries[(key, feature)]
+                self.misses += 1
+                return None
+            self.entries.move_to_end((key, feature))
+            self.hits += 1
+        return entry
+
+    def get(self, key: str, feature: str):
+        '''Returns a copy of the value remembered for `feature` of `key`, or None when nothing is known.'''
+        entry = self._lookup(key, feature)
+        return copy.deepcopy(entry[1]) if entry is not None else None
+
+    def put(self, key: str, feature: str, value) -> None:
+        '''Remembers `value` for `feature` of `key`.'''
+        ttl = self.ttls.get(feature)
+        if not ttl or not key:
+            return
+        with self._lock:
+            self.entries.pop((key, feature), None)
+            self.entries[(key, feature)] = (time.monotonic() + ttl, value if isinstance(value, Exception) else copy.deepcopy(value))
+            while len(self.entries) > self.maxEntries:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        '''Forgets every entry.'''
+        with self._lock:
+            self.entries.clear()
+
+
+class NegativeCache(LookupCache):
+    '''Remembers the videos a feature was found missing for, so that looking them up again makes no request.
+
+    Entries are keyed by video ID & feature, and kept for a short time to live per feature:
+
+    - 'video': the video does not exist or was removed (a player response without `videoDetails`), or the
+      player request was rejected with 400 or 404.
+    - 'streams': no stream could be found by `StreamURLFetcher`, e.g. for an age-restricted video.
+    - 'transcript': the video has no transcript.
+    - 'comments': the video has no comments, or they are disabled.
+
+    A known missing lookup gives back the same empty result, or raises the same error, as the first time.
+    Lookups within `ResponseCache.bypass()` ignore it. At most `maxEntries` entries are kept, the least
+    recently used are evicted first.
+
+    Args:
+        ttls (dict, optional): Maps a feature to the seconds its entries are kept for, merged into
+            `NegativeCache.defaultTtls`. A ttl of 0 or None stops remembering the feature. Defaults to None.
+        maxEntries (int, optional): Maximum number of entries. Defaults to 10000.
+
+    Examples:
+        >>> session = Session(negativeCache = NegativeCache(ttls = {'comments': 3600}))
+        >>> comments = Comments.get('E07s5ZYygMg', session = session)
+        >>> session.negativeCache.stats
+        {'hits': 0, 'misses': 1, 'entries': 1}
+    '''
+
+    defaultTtls = {
+        'video': 600,
+        'streams': 300,
+        'transcript': 1800,
+        'comments': 1800,
+    }
+
+    def get(self, videoId: str, feature: str) -> Optional[dict]:
+        '''Returns a copy of the empty result remembered for `feature` of `videoId`, raises the error remembered
+        for it, or returns None when nothing is known.
+        '''
+        entry = self._lookup(videoId, feature)
+        if entry is None:
+            return None
+        value = entry[1]
+        if isinstance(value, Exception):
+            # A new instance, so that the traceback of the first error does not grow with every raise.
+            raise type(value)(*value.args)
+        return copy.deepcopy(value)
+
+    def put(self, videoId: str, feature: str, value: Union[dict, Exception]) -> None:
+        '''Remembers that `feature` of `videoId` gives the empty result, or raises the error, `value`.'''
+        super().put(videoId, feature, value)
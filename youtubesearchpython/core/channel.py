@@ -1,26 +1,24 @@
 import copy
 import json
-from typing import Union, List
-from urllib.parse import urlencode
+from typing import Union, List, Optional
 
 from youtubesearchpython.core.constants import *
-from youtubesearchpython.core.requests import RequestCore
+from youtubesearchpython.core.requests import RequestCore, innertubeUrl
+from youtubesearchpython.core.session import Session
 from youtubesearchpython.core.componenthandler import getValue, getVideoId
+from youtubesearchpython.core.jsonbackend import loads
 
 
 class ChannelCore(RequestCore):
-    def __init__(self, channel_id: str, request_params: str):
-        super().__init__()
+    def __init__(self, channel_id: str, request_params: str, session: Optional[Session] = None):
+        super().__init__(session=session)
         self.browseId = channel_id
         self.params = request_params
         self.result = {}
         self.continuation = None
 
     def prepare_request(self):
-        self.url = 'https://www.youtube.com/youtubei/v1/browse' + "?" + urlencode({
-            'key': searchKey,
-            "prettyPrint": "false"
-        })
+        self.url = innertubeUrl('browse')
         self.data = copy.deepcopy(requestPayload)
         if not self.continuation:
             self.data["params"] = self.params
@@ -38,7 +36,7 @@ class ChannelCore(RequestCore):
         }
 
     def parse_response(self):
-        response = self.data.json()
+        response = loads(self.data.content)
 
         thumbnails = []
         try:
@@ -104,7 +102,7 @@ class ChannelCore(RequestCore):
         }
 
     def parse_next_response(self):
-        response = self.data.json()
+        response = loads(self.data.content)
 
         self.continuation = None
 
@@ -1,12 +1,13 @@
 import copy
 from typing import Union, Optional
 import json
-from urllib.parse import urlencode
 
-from youtubesearchpython.core.requests import RequestCore
+from youtubesearchpython.core.requests import RequestCore, innertubeUrl
+from youtubesearchpython.core.session import Session
 from youtubesearchpython.core.componenthandler import ComponentHandler
 from youtubesearchpython.core.constants import *
-from youtubesearchpython.core.exceptions import YouTubeRequestError, YouTubeParseError
+from youtubesearchpython.core.exceptions import YouTubeRequestError, YouTubeParseError, YouTubeSearchError
+from youtubesearchpython.core.jsonbackend import dumps, loads
 import httpx
 
 
@@ -15,8 +16,8 @@ class ChannelSearchCore(RequestCore, ComponentHandler):
     responseSource = None
     resultComponents = []
 
-    def __init__(self, query: str, language: str, region: str, searchPreferences: str, browseId: str, timeout: int):
-        super().__init__()
+    def __init__(self, query: str, language: str, region: str, searchPreferences: str, browseId: str, timeout: int, session: Optional[Session] = None):
+        super().__init__(session=session)
         self.query = query
         self.language = language
         self.region = region
@@ -82,6 +83,8 @@ class ChannelSearchCore(RequestCore, ComponentHandler):
                 self.response = []
         except (KeyError, AttributeError, IndexError) as e:
             raise YouTubeParseError(f'Failed to parse YouTube response: {str(e)}')
+        except YouTubeSearchError:
+            raise
         except Exception as e:
             raise YouTubeParseError(f'Unexpected error parsing response: {str(e)}')
 
@@ -95,9 +98,7 @@ class ChannelSearchCore(RequestCore, ComponentHandler):
         }
         requestBody['params'] = self.searchPreferences
         requestBody['browseId'] = self.browseId
-        self.url = 'https://www.youtube.com/youtubei/v1/browse' + '?' + urlencode({
-            'key': searchKey,
-        })
+        self.url = innertubeUrl('browse')
         self.data = requestBody
 
     def _syncRequest(self) -> None:
@@ -108,13 +109,15 @@ class ChannelSearchCore(RequestCore, ComponentHandler):
             request = self.syncPostRequest()
             if request.status_code != 200:
                 raise YouTubeRequestError(f'Request failed with status code {request.status_code}. URL: {self.url}')
-            self.response = request.json()
+            self.response = loads(request.content)
         except httpx.RequestError as e:
             raise YouTubeRequestError(f'Failed to make request to {self.url}: {str(e)}')
         except httpx.HTTPStatusError as e:
             raise YouTubeRequestError(f'HTTP error {e.response.status_code} for {self.url}: {str(e)}')
         except json.JSONDecodeError as e:
             raise YouTubeRequestError(f'Failed to decode JSON response: {str(e)}')
+        except YouTubeSearchError:
+            raise
         except Exception as e:
             raise YouTubeRequestError(f'Unexpected error making request: {str(e)}')
 
@@ -126,13 +129,15 @@ class ChannelSearchCore(RequestCore, ComponentHandler):
             request = await self.asyncPostRequest()
             if request.status_code != 200:
                 raise YouTubeRequestError(f'Request failed with status code {request.status_code}. URL: {self.url}')
-            self.response = request.json()
+            self.response = loads(request.content)
         except httpx.RequestError as e:
             raise YouTubeRequestError(f'Failed to make request to {self.url}: {str(e)}')
         except httpx.HTTPStatusError as e:
             raise YouTubeRequestError(f'HTTP error {e.response.status_code} for {self.url}: {str(e)}')
         except json.JSONDecodeError as e:
             raise YouTubeRequestError(f'Failed to decode JSON response: {str(e)}')
+        except YouTubeSearchError:
+            raise
         except Exception as e:
             raise YouTubeRequestError(f'Unexpected error making request: {str(e)}')
 
@@ -143,8 +148,8 @@ class ChannelSearchCore(RequestCore, ComponentHandler):
         Returns:
             Union[str, dict]: Returns JSON or dictionary.
         '''
-        if mode == ResultMode.json:
-            return json.dumps({'result': self.response}, indent=4)
+        if mode in (ResultMode.json, ResultMode.compactJson):
+            return dumps({'result': self.response}, mode)
         elif mode == ResultMode.dict:
             return {'result': self.response}
 
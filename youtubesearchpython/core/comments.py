@@ -2,37 +2,63 @@ import collections
 import copy
 import itertools
 import json
-from typing import Iterable, Mapping, Tuple, TypeVar, Union, List
-from urllib.parse import urlencode
+from typing import Iterable, Mapping, Tuple, TypeVar, Union, List, Optional
 from urllib.request import Request, urlopen
 
 from youtubesearchpython.core.componenthandler import getVideoId, getValue
+from youtubesearchpython.core.extractor import compilePath, compileSchema
 from youtubesearchpython.core.constants import *
-from youtubesearchpython.core.requests import RequestCore
+from youtubesearchpython.core.requests import RequestCore, innertubeUrl
+from youtubesearchpython.core.session import Session
+from youtubesearchpython.core.deadline import Deadline
 from youtubesearchpython.core.exceptions import YouTubeRequestError
+from youtubesearchpython.core.jsonbackend import dumps, loads
 
 K = TypeVar("K")
 T = TypeVar("T")
 
 
+# Schema of a commentRenderer, compiled once at import. See `compileSchema`.
+_commentRenderer = compilePath(["commentThreadRenderer", "comment", "commentRenderer"])
+_commentSchema = compileSchema({
+    "id": ["commentId"],
+    "author": {
+        "id": ["authorEndpoint", "browseEndpoint", "browseId"],
+        "name": ["authorText", "simpleText"],
+        "thumbnails": ["authorThumbnail", "thumbnails"],
+    },
+    "content": ["contentText", "runs", 0, "text"],
+    "published": ["publishedTimeText", "runs", 0, "text"],
+    "isLiked": ["isLiked"],
+    "authorIsChannelOwner": ["authorIsChannelOwner"],
+    "voteStatus": ["voteStatus"],
+    "votes": {
+        "simpleText": ["voteCount", "simpleText"],
+        "label": ["voteCount", "accessibility", "accessibilityData", "label"],
+    },
+    "replyCount": ["replyCount"],
+})
+
+
 class CommentsCore(RequestCore):
     result = None
     continuationKey = None
     isNextRequest = False
     response = None
 
-    def __init__(self, videoLink: str):
-        super().__init__()
+    def __init__(self, videoLink: str, timeout: Optional[int] = None, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None):
+        super().__init__(timeout=timeout, session=session)
         self.commentsComponent = {"result": []}
         self.responseSource = None
         self.videoLink = videoLink
+        self.deadline = Deadline.of(deadline)
 
     def prepare_continuation_request(self):
         self.data = {
             "context": {"client": {"clientName": "WEB", "clientVersion": "2.20210820.01.00"}},
             "videoId": getVideoId(self.videoLink)
         }
-        self.url = f"https://www.youtube.com/youtubei/v1/next?key={searchKey}"
+        self.url = innertubeUrl('next')
 
     def prepare_comments_request(self):
         self.data = {
@@ -41,7 +67,7 @@ class CommentsCore(RequestCore):
         }
 
     def parse_source(self):
-        self.responseSource = getValue(self.response.json(), [
+        self.responseSource = getValue(loads(self.response.content), [
             "onResponseReceivedEndpoints",
             0 if self.isNextRequest else 1,
             "appendContinuationItemsAction" if self.isNextRequest else "reloadContinuationItemsCommand",
@@ -49,7 +75,7 @@ class CommentsCore(RequestCore):
         ])
 
     def parse_continuation_source(self):
-        response_json = self.response.json()
+        response_json = loads(self.response.content)
         
         # Try multiple paths to find continuation token
         paths = [
@@ -152,62 +178,69 @@ class CommentsCore(RequestCore):
             raise YouTubeRequestError(f"Status code is not 200: {self.response.status_code}")
 
     def sync_create(self):
+        if self.__isKnownMissing():
+            return
         self.sync_make_continuation_request()
-        # Only make comment request if we have a continuation key
-        if self.continuationKey:
+        self.__rememberMissing()
+        # Only make comment request if we have a continuation key, and time left for it
+        if self.continuationKey and self._allows('comments'):
             self.sync_make_comment_request()
             self.__getComponents()
         else:
             # No comments available - set empty result
             self.commentsComponent = {"result": []}
+        self.__markTimeout()
 
     def sync_create_next(self):
         self.isNextRequest = True
         self.sync_make_comment_request()
         self.__getComponents()
+        self.__markTimeout()
 
     async def async_create(self):
+        if self.__isKnownMissing():
+            return
         await self.async_make_continuation_request()
-        # Only make comment request if we have a continuation key
-        if self.continuationKey:
+        self.__rememberMissing()
+        # Only make comment request if we have a continuation key, and time left for it
+        if self.continuationKey and self._allows('comments'):
             await self.async_make_comment_request()
             self.__getComponents()
         else:
             # No comments available - set empty result
             self.commentsComponent = {"result": []}
+        self.__markTimeout()
 
     async def async_create_next(self):
         self.isNextRequest = True
         await self.async_make_comment_request()
         self.__getComponents()
+        self.__markTimeout()
+
+    def __isKnownMissing(self) -> bool:
+        # Videos without comments are remembered by the session's negative cache.
+        result = self._knownMissing(getVideoId(self.videoLink), 'comments')
+        if result is None:
+            return False
+        self.continuationKey = None
+        self.commentsComponent = result
+        self.__markTimeout()
+        return True
+
+    def __rememberMissing(self) -> None:
+        if not self.continuationKey:
+            self._rememberMissing(getVideoId(self.videoLink), 'comments', {"result": []})
+
+    def __markTimeout(self) -> None:
+        if self.deadline is not None:
+            self.commentsComponent["timedOut"] = self.deadline.timedOut
 
     def __getComponents(self) -> None:
         comments = []
         for comment in self.responseSource:
-            comment = getValue(comment, ["commentThreadRenderer", "comment", "commentRenderer"])
-            #print(json.dumps(comment, indent=4))
-            try:
-                j = {
-                    "id": self.__getValue(comment, ["commentId"]),
-                    "author": {
-                        "id": self.__getValue(comment, ["authorEndpoint", "browseEndpoint", "browseId"]),
-                        "name": self.__getValue(comment, ["authorText", "simpleText"]),
-                        "thumbnails": self.__getValue(comment, ["authorThumbnail", "thumbnails"])
-                    },
-                    "content": self.__getValue(comment, ["contentText", "runs", 0, "text"]),
-                    "published": self.__getValue(comment, ["publishedTimeText", "runs", 0, "text"]),
-                    "isLiked": self.__getValue(comment, ["isLiked"]),
-                    "authorIsChannelOwner": self.__getValue(comment, ["authorIsChannelOwner"]),
-                    "voteStatus": self.__getValue(comment, ["voteStatus"]),
-                    "votes": {
-                        "simpleText": self.__getValue(comment, ["voteCount", "simpleText"]),
-                        "label": self.__getValue(comment, ["voteCount", "accessibility", "accessibilityData", "label"])
-                    },
-                    "replyCount": self.__getValue(comment, ["replyCount"]),
-                }
-                comments.append(j)
-            except (KeyError, AttributeError, IndexError, TypeError):
-                pass
+            comment = _commentRenderer(comment)
+            if comment is not None:
+                comments.append(_commentSchema(comment))
 
         self.commentsComponent["result"].extend(comments)
         self.continuationKey = self.__getValue(self.responseSource, [-1, "continuationItemRenderer", "continuationEndpoint", "continuationCommand", "token"])
@@ -215,25 +248,11 @@ class CommentsCore(RequestCore):
     def __result(self, mode: int) -> Union[dict, str]:
         if mode == ResultMode.dict:
             return self.commentsComponent
-        elif mode == ResultMode.json:
-            return json.dumps(self.commentsComponent, indent=4)
+        elif mode in (ResultMode.json, ResultMode.compactJson):
+            return dumps(self.commentsComponent, mode)
 
-    def __getValue(self, source: dict, path: Iterable[str]) -> Union[str, int, dict, None]:
-        value = source
-        for key in path:
-            if type(key) is str:
-                if key in value.keys():
-                    value = value[key]
-                else:
-                    value = None
-                    break
-            elif type(key) is int:
-                if len(value) != 0:
-                    value = value[key]
-                else:
-                    value = None
-                    break
-        return value
+    # Shared with every parser, see `compilePath`.
+    __getValue = staticmethod(getValue)
 
     def __getAllWithKey(self, source: Iterable[Mapping[K, T]], key: K) -> Iterable[T]:
         for item in source:
@@ -1,23 +1,6 @@
 from typing import Union, List
 from youtubesearchpython.core.constants import *
-
-
-def getValue(source: dict, path: List[str]) -> Union[str, int, dict, None]:
-    value = source
-    for key in path:
-        if type(key) is str:
-            if key in value.keys():
-                value = value[key]
-            else:
-                value = None
-                break
-        elif type(key) is int:
-            if len(value) != 0:
-                value = value[key]
-            else:
-                value = None
-                break
-    return value
+from youtubesearchpython.core.extractor import compilePath, compileSchema, getValue
 
 
 def getVideoId(videoLink: str) -> str:
@@ -46,32 +29,123 @@ def getVideoId(videoLink: str) -> str:
         return videoLink
 
 
+# Renderer schemas, compiled once at import. See `compileSchema`.
+_videoSchema = compileSchema({
+    'type':                            'video',
+    'id':                              ['videoId'],
+    'title':                           ['title', 'runs', 0, 'text'],
+    'publishedTime':                   ['publishedTimeText', 'simpleText'],
+    'duration':                        ['lengthText', 'simpleText'],
+    'viewCount': {
+        'text':                        ['viewCountText', 'simpleText'],
+        'short':                       ['shortViewCountText', 'simpleText'],
+    },
+    'thumbnails':                      ['thumbnail', 'thumbnails'],
+    'richThumbnail':                   ['richThumbnail', 'movingThumbnailRenderer', 'movingThumbnailDetails', 'thumbnails', 0],
+    'descriptionSnippet':              ['detailedMetadataSnippets', 0, 'snippetText', 'runs'],
+    'channel': {
+        'name':                        ['ownerText', 'runs', 0, 'text'],
+        'id':                          ['ownerText', 'runs', 0, 'navigationEndpoint', 'browseEndpoint', 'browseId'],
+        'thumbnails':                  ['channelThumbnailSupportedRenderers', 'channelThumbnailWithLinkRenderer', 'thumbnail', 'thumbnails'],
+    },
+    'accessibility': {
+        'title':                       ['title', 'accessibility', 'accessibilityData', 'label'],
+        'duration':                    ['lengthText', 'accessibility', 'accessibilityData', 'label'],
+    },
+})
+
+_channelSchema = compileSchema({
+    'type':                            'channel',
+    'id':                              ['channelId'],
+    'title':                           ['title', 'simpleText'],
+    'thumbnails':                      ['thumbnail', 'thumbnails'],
+    'videoCount':                      ['videoCountText', 'runs', 0, 'text'],
+    'descriptionSnippet':              ['descriptionSnippet', 'runs'],
+    'subscribers':                     ['subscriberCountText', 'simpleText'],
+})
+
+_playlistSchema = compileSchema({
+    'type':                            'playlist',
+    'id':                              ['playlistId'],
+    'title':                           ['title', 'simpleText'],
+    'videoCount':                      ['videoCount'],
+    'channel': {
+        'name':                        ['shortBylineText', 'runs', 0, 'text'],
+        'id':                          ['shortBylineText', 'runs', 0, 'navigationEndpoint', 'browseEndpoint', 'browseId'],
+    },
+    'thumbnails':                      ['thumbnailRenderer', 'playlistVideoThumbnailRenderer', 'thumbnail', 'thumbnails'],
+})
+
+_shelfSchema = compileSchema({
+    'title':                           ['title', 'simpleText'],
+    'elements':                        ['content', 'verticalListRenderer', 'items'],
+})
+
+_channelSearchVideoDurationSchema = {
+    'simpleText':                      ['lengthText', 'simpleText'],
+    'text':                            ['lengthText', 'accessibility', 'accessibilityData', 'label'],
+}
+
+_channelSearchChildVideoSchema = compileSchema({
+    'id':                              ['videoId'],
+    'title':                           ['title', 'simpleText'],
+    'uri':                             ['navigationEndpoint', 'commandMetadata', 'webCommandMetadata', 'url'],
+    'duration':                        _channelSearchVideoDurationSchema,
+})
+
+_channelSearchVideoSchema = compileSchema({
+    'id':                              ['videoId'],
+    'thumbnails': {
+        'normal':                      ['thumbnail', 'thumbnails'],
+        'rich':                        ['richThumbnail', 'movingThumbnailRenderer', 'movingThumbnailDetails', 'thumbnails'],
+    },
+    'title':                           ['title', 'runs', 0, 'text'],
+    'descriptionSnippet':              ['descriptionSnippet', 'runs', 0, 'text'],
+    'uri':                             ['navigationEndpoint', 'commandMetadata', 'webCommandMetadata', 'url'],
+    'views': {
+        'precise':                     ['viewCountText', 'simpleText'],
+        'simple':                      ['shortViewCountText', 'simpleText'],
+        'approximate':                 ['shortViewCountText', 'accessibility', 'accessibilityData', 'label'],
+    },
+    'duration':                        _channelSearchVideoDurationSchema,
+    'published':                       ['publishedTimeText', 'simpleText'],
+    'channel': {
+        'name':                        ['ownerText', 'runs', 0, 'text'],
+        'thumbnails':                  ['channelThumbnailSupportedRenderers', 'channelThumbnailWithLinkRenderer', 'thumbnail', 'thumbnails'],
+    },
+    'type':                            'video',
+})
+
+_channelSearchPlaylistSchema = compileSchema({
+    'id':                              ['playlistId'],
+    'videos':                          ['videos'],
+    'thumbnails': {
+        'normal':                      ['thumbnails'],
+    },
+    'title':                           ['title', 'simpleText'],
+    'uri':                             ['navigationEndpoint', 'commandMetadata', 'webCommandMetadata', 'url'],
+    'channel': {
+        'name':                        ['longBylineText', 'runs', 0, 'text'],
+    },
+    'type':                            'playlist',
+})
+
+_channelSearchGridPlaylistSchema = compileSchema({
+    'id':                              ['playlistId'],
+    'thumbnails': {
+        'normal':                      ['thumbnail', 'thumbnails', 0],
+    },
+    'title':                           ['title', 'runs', 0, 'text'],
+    'uri':                             ['navigationEndpoint', 'commandMetadata', 'webCommandMetadata', 'url'],
+    'type':                            'playlist',
+})
+
+_childVideoRenderer = compilePath(['childVideoRenderer'])
+
+
 class ComponentHandler:
     def _getVideoComponent(self, element: dict, shelfTitle: str = None) -> dict:
-        video = element[videoElementKey]
-        component = {
-            'type':                           'video',
-            'id':                              self._getValue(video, ['videoId']),
-            'title':                           self._getValue(video, ['title', 'runs', 0, 'text']),
-            'publishedTime':                   self._getValue(video, ['publishedTimeText', 'simpleText']),
-            'duration':                        self._getValue(video, ['lengthText', 'simpleText']),
-            'viewCount': {
-                'text':                        self._getValue(video, ['viewCountText', 'simpleText']),
-                'short':                       self._getValue(video, ['shortViewCountText', 'simpleText']),
-            },
-            'thumbnails':                      self._getValue(video, ['thumbnail', 'thumbnails']),
-            'richThumbnail':                   self._getValue(video, ['richThumbnail', 'movingThumbnailRenderer', 'movingThumbnailDetails', 'thumbnails', 0]),
-            'descriptionSnippet':              self._getValue(video, ['detailedMetadataSnippets', 0, 'snippetText', 'runs']),
-            'channel': {
-                'name':                        self._getValue(video, ['ownerText', 'runs', 0, 'text']),
-                'id':                          self._getValue(video, ['ownerText', 'runs', 0, 'navigationEndpoint', 'browseEndpoint', 'browseId']),
-                'thumbnails':                  self._getValue(video, ['channelThumbnailSupportedRenderers', 'channelThumbnailWithLinkRenderer', 'thumbnail', 'thumbnails']),
-            },
-            'accessibility': {
-                'title':                       self._getValue(video, ['title', 'accessibility', 'accessibilityData', 'label']),
-                'duration':                    self._getValue(video, ['lengthText', 'accessibility', 'accessibilityData', 'label']),
-            },
-        }
+        component = _videoSchema(element[videoElementKey])
         component['link'] = 'https://www.youtube.com/watch?v=' + component['id']
 
         if component['channel']['id']:
@@ -81,32 +155,12 @@ class ComponentHandler:
         return component
 
     def _getChannelComponent(self, element: dict) -> dict:
-        channel = element[channelElementKey]
-        component = {
-            'type':                           'channel',
-            'id':                              self._getValue(channel, ['channelId']),
-            'title':                           self._getValue(channel, ['title', 'simpleText']),
-            'thumbnails':                      self._getValue(channel, ['thumbnail', 'thumbnails']),
-            'videoCount':                      self._getValue(channel, ['videoCountText', 'runs', 0, 'text']),
-            'descriptionSnippet':              self._getValue(channel, ['descriptionSnippet', 'runs']),
-            'subscribers':                     self._getValue(channel, ['subscriberCountText', 'simpleText']),
-        }
+        component = _channelSchema(element[channelElementKey])
         component['link'] = 'https://www.youtube.com/channel/' + component['id']
         return component
 
     def _getPlaylistComponent(self, element: dict) -> dict:
-        playlist = element[playlistElementKey]
-        component = {
-            'type':                           'playlist',
-            'id':                             self._getValue(playlist, ['playlistId']),
-            'title':                          self._getValue(playlist, ['title', 'simpleText']),
-            'videoCount':                     self._getValue(playlist, ['videoCount']),
-            'channel': {
-                'name':                       self._getValue(playlist, ['shortBylineText', 'runs', 0, 'text']),
-                'id':                         self._getValue(playlist, ['shortBylineText', 'runs', 0, 'navigationEndpoint', 'browseEndpoint', 'browseId']),
-            },
-            'thumbnails':                     self._getValue(playlist, ['thumbnailRenderer', 'playlistVideoThumbnailRenderer', 'thumbnail', 'thumbnails']),
-        }
+        component = _playlistSchema(element[playlistElementKey])
         component['link'] = 'https://www.youtube.com/playlist?list=' + component['id']
 
         if component['channel']['id']:
@@ -115,20 +169,7 @@ class ComponentHandler:
         return component
     
     def _getVideoFromChannelSearch(self, elements: list) -> list:
-        channelsearch = []
-        for element in elements:
-            element = self._getValue(element, ["childVideoRenderer"])
-            json = {
-                "id":                                    self._getValue(element, ["videoId"]),
-                "title":                                 self._getValue(element, ["title", "simpleText"]),
-                "uri":                                   self._getValue(element, ["navigationEndpoint", "commandMetadata", "webCommandMetadata", "url"]),
-                "duration": {
-                    "simpleText":                        self._getValue(element, ["lengthText", "simpleText"]),
-                    "text":                              self._getValue(element, ["lengthText", "accessibility", "accessibilityData", "label"])
-                }
-            }
-            channelsearch.append(json)
-        return channelsearch
+        return [_channelSearchChildVideoSchema(_childVideoRenderer(element)) for element in elements]
     
     def _getChannelSearchComponent(self, elements: list) -> list:
         channelsearch = []
@@ -154,78 +195,17 @@ class ComponentHandler:
                 raise ValueError(f'Unexpected element {element}')
             
             if responsetype == "video":
-                json = {
-                    "id":                                    self._getValue(element, ["videoId"]),
-                    "thumbnails": {
-                        "normal":                            self._getValue(element, ["thumbnail", "thumbnails"]),
-                        "rich":                              self._getValue(element, ["richThumbnail", "movingThumbnailRenderer", "movingThumbnailDetails", "thumbnails"])
-                    },
-                    "title":                                 self._getValue(element, ["title", "runs", 0, "text"]),
-                    "descriptionSnippet":                    self._getValue(element, ["descriptionSnippet", "runs", 0, "text"]),
-                    "uri":                                   self._getValue(element, ["navigationEndpoint", "commandMetadata", "webCommandMetadata", "url"]),
-                    "views": {
-                        "precise":                           self._getValue(element, ["viewCountText", "simpleText"]),
-                        "simple":                            self._getValue(element, ["shortViewCountText", "simpleText"]),
-                        "approximate":                       self._getValue(element, ["shortViewCountText", "accessibility", "accessibilityData", "label"])
-                    },
-                    "duration": {
-                        "simpleText":                        self._getValue(element, ["lengthText", "simpleText"]),
-                        "text":                              self._getValue(element, ["lengthText", "accessibility", "accessibilityData", "label"])
-                    },
-                    "published":                             self._getValue(element, ["publishedTimeText", "simpleText"]),
-                    "channel": {
-                        "name":                              self._getValue(element, ["ownerText", "runs", 0, "text"]),
-                        "thumbnails":                        self._getValue(element, ["channelThumbnailSupportedRenderers", "channelThumbnailWithLinkRenderer", "thumbnail", "thumbnails"])
-                    },
-                    "type":                                  responsetype
-                }
+                json = _channelSearchVideoSchema(element)
             elif responsetype == 'playlist':
-                json = {
-                    "id":                                    self._getValue(element, ["playlistId"]),
-                    "videos":                                self._getVideoFromChannelSearch(self._getValue(element, ["videos"])),
-                    "thumbnails": {
-                        "normal":                            self._getValue(element, ["thumbnails"]),
-                    },
-                    "title":                                 self._getValue(element, ["title", "simpleText"]),
-                    "uri":                                   self._getValue(element, ["navigationEndpoint", "commandMetadata", "webCommandMetadata", "url"]),
-                    "channel": {
-                        "name":                              self._getValue(element, ["longBylineText", "runs", 0, "text"]),
-                    },
-                    "type":                                  responsetype
-                }
+                json = _channelSearchPlaylistSchema(element)
+                json['videos'] = self._getVideoFromChannelSearch(json['videos'])
             else:
-                json = {
-                    "id":                                    self._getValue(element, ["playlistId"]),
-                    "thumbnails": {
-                        "normal":                            self._getValue(element, ["thumbnail", "thumbnails", 0]),
-                    },
-                    "title":                                 self._getValue(element, ["title", "runs", 0, "text"]),
-                    "uri":                                   self._getValue(element, ["navigationEndpoint", "commandMetadata", "webCommandMetadata", "url"]),
-                    "type":                                  'playlist'
-                }
+                json = _channelSearchGridPlaylistSchema(element)
             channelsearch.append(json)
         return channelsearch
 
     def _getShelfComponent(self, element: dict) -> dict:
-        shelf = element[shelfElementKey]
-        return {
-            'title':                           self._getValue(shelf, ['title', 'simpleText']),
-            'elements':                        self._getValue(shelf, ['content', 'verticalListRenderer', 'items']),
-        }
-
-    def _getValue(self, source: dict, path: List[str]) -> Union[str, int, dict, None]:
-        value = source
-        for key in path:
-            if type(key) is str:
-                if key in value.keys():
-                    value = value[key]
-                else:
-                    value = None
-                    break
-            elif type(key) is int:
-                if len(value) != 0:
-                    value = value[key]
-                else:
-                    value = None
-                    break
-        return value
+        return _shelfSchema(element[shelfElementKey])
+
+    # Shared with every parser, see `compilePath`.
+    _getValue = staticmethod(getValue)
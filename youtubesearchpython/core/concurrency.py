@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from youtubesearchpython.core.ratelimit import RateLimiter
+
+
+class Gate:
+    '''Concurrency limit of a single endpoint, shared by threads & event loops.'''
+
+    def __init__(self, concurrency: 'AdaptiveConcurrency', endpoint: str):
+        self.concurrency = concurrency
+        self.endpoint = endpoint
+        self.limit = float(concurrency.initial)
+        self.inFlight = 0
+        self.minLatency = None
+        self.lastDecrease = None
+        self._condition = threading.Condition()
+        self._waiters = deque()
+
+    def _tryAcquire(self) -> bool:
+        if self.inFlight < int(self.limit):
+            self.inFlight += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        '''Blocks until a request can be sent.'''
+        with self._condition:
+            while not self._tryAcquire():
+                self._condition.wait()
+
+    async def asyncAcquire(self) -> None:
+        '''Waits without blocking the event loop until a request can be sent.'''
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self._tryAcquire():
+                    return
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Passes on a wake up this waiter may have consumed.
+                with self._condition:
+                    self._wake()
+                raise
+
+    def _wake(self) -> None:
+        # Called with the lock held, wakes as many waiters as there are free slots. Woken waiters compete
+        # for the slots again, so waking too many is harmless.
+        free = int(self.limit) - self.inFlight
+        if free <= 0:
+            return
+        self._condition.notify(free)
+        while free > 0 and self._waiters:
+            loop, waiter = self._waiters.popleft()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_resolve, waiter)
+                free -= 1
+
+    def release(self, latency: Optional[float] = None, failed: bool = False) -> None:
+        '''Frees the slot of a finished request, and adapts the limit to its outcome. A request without
+        `latency` (e.g. a cancelled one) leaves the limit as is.
+        '''
+        concurrency = self.concurrency
+        with self._condition:
+            self.inFlight -= 1
+            if latency is not None:
+                if self.minLatency is None or latency < self.minLatency:
+                    self.minLatency = latency
+                else:
+                    # Lets the baseline follow slower networks over time.
+                    self.minLatency += (latency - self.minLatency) * 0.01
+                if failed or latency > self.minLatency * concurrency.tolerance:
+                    # Requests sent before the last decrease saw the congestion it already answered, so the
+                    # limit is cut at most once per round trip.
+                    now = time.monotonic()
+                    if self.lastDecrease is None or now - latency >= self.lastDecrease:
+                        self.limit = max(concurrency.minimum, self.limit * concurrency.decrease)
+                        self.lastDecrease = now
+                else:
+                    self.limit = min(concurrency.maximum, self.limit + 1 / self.limit)
+            self._wake()
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AdaptiveConcurrency:
+    '''Adapts the number of concurrent requests per endpoint (keyed like `RateLimiter`) to YouTube's latency,
+    additive increase & multiplicative decrease (AIMD) style.
+
+    Every request finishing within `tolerance` times the lowest latency seen for its endpoint raises the limit
+    by about one per round of requests. A slower or failed request multiplies it by `decrease`, at most once per
+    round trip: requests already in flight when the limit was cut do not cut it again. Requests beyond the limit
+    wait for a free slot, so worker pools stop piling requests onto a struggling endpoint.
+
+    Args:
+        initial (int, optional): Starting limit of every endpoint. Defaults to 16.
+        minimum (int, optional): Lowest limit. Defaults to 1.
+        maximum (int, optional): Highest limit. Defaults to 100.
+        tolerance (float, optional): Latency, as a multiple of the lowest one seen, considered a sign of
+            congestion. Defaults to 2.
+        decrease (float, optional): Factor the limit is multiplied by on congestion. Defaults to 0.7.
+
+    Examples:
+        >>> session = Session(concurrency = AdaptiveConcurrency(initial = 8, maximum = 64))
+    '''
+
+    def __init__(self, initial: int = 16, minimum: int = 1, maximum: int = 100, tolerance: float = 2.0,
+                 decrease: float = 0.7):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.initial = min(max(initial, self.minimum), self.maximum)
+        self.tolerance = tolerance
+        self.decrease = decrease
+        self.gates = {}
+        self._lock = threading.Lock()
+
+    def gate(self, url: str) -> Gate:
+        '''Returns the gate of the endpoint of `url`.'''
+        endpoint = RateLimiter.endpoint(url)
+        gate = self.gates.get(endpoint)
+        if gate is None:
+            with self._lock:
+                gate = self.gates.setdefault(endpoint, Gate(self, endpoint))
+        return gate
+
+    def limit(self, endpoint: str) -> int:
+        '''Returns the current limit of `endpoint`, e.g. 'player'.'''
+        gate = self.gates.get(endpoint)
+        return int(gate.limit) if gate is not None else self.initial
@@ -30,6 +30,10 @@ contentPath = ['contents', 'twoColumnSearchResultsRenderer', 'primaryContents',
 fallbackContentPath = ['contents', 'twoColumnSearchResultsRenderer', 'primaryContents', 'richGridRenderer', 'contents']
 continuationContentPath = ['onResponseReceivedCommands', 0, 'appendContinuationItemsAction', 'continuationItems']
 continuationKeyPath = ['continuationItemRenderer', 'continuationEndpoint', 'continuationCommand', 'token']
+# The only parts of a search response read, see `contentPath`, `fallbackContentPath` & `continuationContentPath`.
+searchFieldMask = 'contents,onResponseReceivedCommands'
+# Seconds a search lookup of `Video.get` waits on a query before racing the next one alongside it.
+searchStaggerDelay = 0.5
 playlistInfoPath = ['response', 'sidebar', 'playlistSidebarRenderer', 'items']
 playlistVideosPath = ['response', 'contents', 'twoColumnBrowseResultsRenderer', 'tabs', 0, 'tabRenderer', 'content', 'sectionListRenderer', 'contents', 0, 'itemSectionRenderer', 'contents', 0, 'playlistVideoListRenderer', 'contents']
 playlistPrimaryInfoKey = 'playlistSidebarPrimaryInfoRenderer'
@@ -40,6 +44,15 @@ playlistVideoKey = 'playlistVideoRenderer'
 class ResultMode:
     json = 0
     dict = 1
+    compactJson = 2
+    objects = 3
+
+
+class ThumbnailMode:
+    none = 0
+    synthesized = 1
+    lazy = 2
+    probe = 3
 
 
 class SearchMode:
@@ -0,0 +1,72 @@
+import time
+from typing import List, Optional, Union
+
+from youtubesearchpython.core.exceptions import YouTubeDeadlineExceeded
+
+
+class Deadline:
+    '''Time budget of a whole public call, shared by every HTTP request it makes.
+
+    Each request gets the smaller of its own timeout and the time left, so a call fanning out into several
+    requests can no longer take the sum of their timeouts. Optional follow-up requests (search fallbacks,
+    thumbnail checks, continuations) are skipped once the budget runs out; their names are collected in
+    `skipped`, and the result of the call is marked with `timedOut`.
+
+    Args:
+        seconds (float): Time budget, starting now.
+
+    Examples:
+        >>> video = Video.get('E07s5ZYygMg', deadline = 3)
+        >>> video['timedOut']
+        False
+        >>> deadline = Deadline(5)
+        >>> comments = Comments.get('E07s5ZYygMg', deadline = deadline)
+        >>> deadline.skipped
+        []
+    '''
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expiresAt = time.monotonic() + seconds
+        self.skipped: List[str] = []
+
+    @classmethod
+    def of(cls, deadline: Union['Deadline', float, None]) -> Optional['Deadline']:
+        '''Returns `deadline` as a `Deadline`, starting one now when given a number of seconds.'''
+        if deadline is None or isinstance(deadline, Deadline):
+            return deadline
+        return cls(deadline)
+
+    def remaining(self) -> float:
+        '''Returns the seconds left, 0 once expired.'''
+        return max(0.0, self.expiresAt - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    @property
+    def timedOut(self) -> bool:
+        '''Whether a request was skipped for lack of time.'''
+        return len(self.skipped) > 0
+
+    def timeout(self, timeout: Optional[float]) -> float:
+        '''Returns the timeout of a required request, or raises YouTubeDeadlineExceeded when no time is left.'''
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise YouTubeDeadlineExceeded(f'Deadline of {self.seconds} s exceeded.')
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def allows(self, hop: str, minimum: float = 0.05) -> bool:
+        '''Returns whether an optional request named `hop` still has at least `minimum` seconds to run, and
+        records it as skipped otherwise.
+        '''
+        if self.remaining() > minimum:
+            return True
+        self.skip(hop)
+        return False
+
+    def skip(self, hop: str) -> None:
+        '''Records the optional request named `hop` as skipped, e.g. when it ran out of time while being sent.'''
+        if hop not in self.skipped:
+            self.skipped.append(hop)
@@ -8,6 +8,16 @@ class YouTubeRequestError(YouTubeSearchError):
     pass
 
 
+class YouTubeCircuitOpenError(YouTubeRequestError):
+    """Exception raised when a request is refused by an open circuit breaker."""
+    pass
+
+
+class YouTubeDeadlineExceeded(YouTubeRequestError):
+    """Exception raised when the deadline of a call runs out before a required request."""
+    pass
+
+
 class YouTubeParseError(YouTubeSearchError):
     """Exception raised when parsing YouTube response fails."""
     pass
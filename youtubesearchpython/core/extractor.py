@@ -0,0 +1,130 @@
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple, Union
+
+Path = Sequence[Union[str, int]]
+Extractor = Callable[[Any], Any]
+Schema = Mapping[str, Any]
+
+_extractors: Dict[Tuple[Union[str, int], ...], Extractor] = {}
+
+
+def _generate(paths: List[Tuple[Union[str, int], ...]]) -> Tuple[List[str], Dict[tuple, str]]:
+    # The paths are merged into a trie & unrolled into nested blocks, like `namedtuple` & `dataclasses` generate
+    # their methods: a shared prefix is walked once, and a missing key skips every path below it at once.
+    trie = {}
+    for path in paths:
+        node = trie
+        for key in path:
+            if type(key) is not str and type(key) is not int:
+                raise TypeError(f'Path keys must be str or int, got {key!r}')
+            node = node.setdefault(key, {})
+    names = {(): 'value'}
+    body = []
+
+    def visit(node: dict, prefix: tuple, name: str, indent: str) -> None:
+        objectKeys = [key for key in node if type(key) is str]
+        arrayIndexes = [key for key in node if type(key) is int]
+        if objectKeys:
+            body.append(f'{indent}if type({name}) is dict:')
+            for key in objectKeys:
+                child = names[prefix + (key,)] = f'n{len(names)}'
+                body.append(f'{indent}    {child} = {name}.get({key!r})')
+                visit(node[key], prefix + (key,), child, indent + '    ')
+        if arrayIndexes:
+            body.append(f'{indent}if type({name}) is list:')
+            for key in arrayIndexes:
+                child = names[prefix + (key,)] = f'n{len(names)}'
+                body.append(f'{indent}    if len({name}) > {key if key >= 0 else -key - 1}:')
+                body.append(f'{indent}        {child} = {name}[{key}]')
+                visit(node[key], prefix + (key,), child, indent + '        ')
+
+    visit(trie, (), 'value', '    ')
+    outputs = sorted({names[path] for path in paths if path}, key = lambda name: int(name[1:]))
+    lines = ['def extract(value):']
+    if outputs:
+        lines.append('    ' + ' = '.join(outputs) + ' = None')
+    return lines + body, names
+
+
+def _compile(lines: List[str]) -> Extractor:
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['extract']
+
+
+def _schemaPaths(schema: Schema) -> List[Tuple[Union[str, int], ...]]:
+    paths = []
+    for field in schema.values():
+        if isinstance(field, Mapping):
+            paths.extend(_schemaPaths(field))
+        elif isinstance(field, (list, tuple)):
+            paths.append(tuple(field))
+    return paths
+
+
+def _schemaExpression(schema: Schema, names: Dict[tuple, str]) -> str:
+    fields = []
+    for key, field in schema.items():
+        if isinstance(field, Mapping):
+            fields.append(f'{key!r}: {_schemaExpression(field, names)}')
+        elif isinstance(field, (list, tuple)):
+            fields.append(f'{key!r}: {names[tuple(field)]}')
+        elif field is None or type(field) in (str, int, float, bool):
+            fields.append(f'{key!r}: {field!r}')
+        else:
+            raise TypeError(f'Schema fields must be paths, schemas or constants, got {field!r}')
+    return '{' + ', '.join(fields) + '}'
+
+
+def compilePath(path: Path) -> Extractor:
+    '''Returns a function reading the value at `path` in a parsed JSON response, or None when it is missing.
+
+    `path` is made of object keys (str) & array indexes (int, negative ones counting from the end). The function
+    is specialized for the shape of the path once, and then shared by every caller of the same path. Unlike a
+    plain lookup, it never raises: a missing key, an index out of range or a value of another type than
+    expected anywhere along the path gives None.
+
+    Examples:
+        >>> videoTitle = compilePath(['title', 'runs', 0, 'text'])
+        >>> videoTitle({'title': {'runs': [{'text': 'Watermelon Sugar'}]}})
+        'Watermelon Sugar'
+        >>> videoTitle({'title': {'simpleText': 'Watermelon Sugar'}}) is None
+        True
+    '''
+    key = tuple(path)
+    extractor = _extractors.get(key)
+    if extractor is None:
+        lines, names = _generate([key])
+        lines.append(f'    return {names[key]}')
+        extractor = _extractors.setdefault(key, _compile(lines))
+    return extractor
+
+
+def compileSchema(schema: Schema) -> Extractor:
+    '''Returns a function turning a renderer of a parsed JSON response into a dict shaped like `schema`.
+
+    Each field of `schema` is either a path, read like `compilePath` does, a nested schema giving a nested dict,
+    or a constant (str, int, float, bool or None) copied as it is. The paths of every field are merged into a
+    trie, so that their common prefixes are walked once per renderer, and the output dict is built in one go,
+    with its keys in the order of `schema`. Compile schemas once, at import.
+
+    Examples:
+        >>> channel = compileSchema({
+        ...     'type': 'channel',
+        ...     'title': ['title', 'runs', 0, 'text'],
+        ...     'accessibility': {'title': ['title', 'accessibility', 'accessibilityData', 'label']},
+        ... })
+        >>> channel({'title': {'runs': [{'text': 'NoCopyrightSounds'}]}})
+        {'type': 'channel', 'title': 'NoCopyrightSounds', 'accessibility': {'title': None}}
+    '''
+    lines, names = _generate(_schemaPaths(schema))
+    lines.append(f'    return {_schemaExpression(schema, names)}')
+    return _compile(lines)
+
+
+def getValue(source: Any, path: Path) -> Any:
+    '''Returns the value at `path` in `source`, or None when it is missing. See `compilePath`.'''
+    key = tuple(path)
+    extractor = _extractors.get(key)
+    if extractor is None:
+        extractor = compilePath(key)
+    return extractor(source)
@@ -1,22 +1,24 @@
 import copy
 import json
 from typing import Union, Optional
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
 
 import httpx
 
 from youtubesearchpython.core.constants import *
 from youtubesearchpython.core.componenthandler import ComponentHandler
-from youtubesearchpython.core.exceptions import YouTubeRequestError, YouTubeParseError
+from youtubesearchpython.core.requests import RequestCore, innertubeUrl
+from youtubesearchpython.core.session import Session
+from youtubesearchpython.core.exceptions import YouTubeRequestError, YouTubeParseError, YouTubeSearchError
+from youtubesearchpython.core.jsonbackend import dumps, loads
+from youtubesearchpython.core.results import searchResults
 
 
-class HashtagCore(ComponentHandler):
+class HashtagCore(RequestCore, ComponentHandler):
     response = None
     resultComponents = []
 
-    def __init__(self, hashtag: str, limit: int, language: str, region: str, timeout: Optional[int]):
+    def __init__(self, hashtag: str, limit: int, language: str, region: str, timeout: Optional[int], session: Optional[Session] = None):
+        super().__init__(timeout=timeout, session=session)
         self.hashtag = hashtag
         self.limit = limit
         self.language = language
@@ -30,17 +32,25 @@ class HashtagCore(ComponentHandler):
         self._makeRequest()
         self._getComponents()
 
+    async def async_create(self):
+        await self._asyncGetParams()
+        await self._asyncMakeRequest()
+        self._getComponents()
+
     def result(self, mode: int = ResultMode.dict) -> Union[str, dict]:
         '''Returns the hashtag videos.
         Args:
             mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
         Returns:
-            Union[str, dict]: Returns JSON or dictionary.
+            Union[str, dict]: Returns JSON or dictionary, whose results are `VideoResult`, `ChannelResult` &
+            `PlaylistResult` objects with `ResultMode.objects`.
         '''
-        if mode == ResultMode.json:
-            return json.dumps({'result': self.resultComponents}, indent = 4)
+        if mode in (ResultMode.json, ResultMode.compactJson):
+            return dumps({'result': self.resultComponents}, mode)
         elif mode == ResultMode.dict:
             return {'result': self.resultComponents}
+        elif mode == ResultMode.objects:
+            return {'result': searchResults(self.resultComponents)}
 
     def next(self) -> bool:
         '''Gets the videos from the next page. Call result
@@ -56,97 +66,74 @@ class HashtagCore(ComponentHandler):
             return True
         return False
 
-    def _getParams(self) -> None:
+    def _getParamsRequestBody(self) -> None:
         requestBody = copy.deepcopy(requestPayload)
         requestBody['query'] = "#" + self.hashtag
         requestBody['client'] = {
             'hl': self.language,
             'gl': self.region,
         }
-        requestBodyBytes = json.dumps(requestBody).encode('utf_8')
-        request = Request(
-            'https://www.youtube.com/youtubei/v1/search' + '?' + urlencode({
-                'key': searchKey,
-            }),
-            data = requestBodyBytes,
-            headers = {
-                'Content-Type': 'application/json; charset=utf-8',
-                'Content-Length': len(requestBodyBytes),
-                'User-Agent': userAgent,
-            }
-        )
-        try:
-            response = urlopen(request, timeout=self.timeout).read().decode('utf_8')
-        except (URLError, HTTPError, TimeoutError) as e:
-            raise YouTubeRequestError(f'Failed to make request: {str(e)}')
-        except Exception as e:
-            raise YouTubeRequestError(f'Unexpected error making request: {str(e)}')
-        content = self._getValue(json.loads(response), contentPath)
-        for item in self._getValue(content, [0, 'itemSectionRenderer', 'contents']):
-            if hashtagElementKey in item.keys():
-                self.params = self._getValue(item[hashtagElementKey], ['onTapCommand', 'browseEndpoint', 'params'])
-                return
+        self.url = innertubeUrl('search')
+        self.data = requestBody
 
-    async def _asyncGetParams(self) -> None:
+    def _getBrowseRequestBody(self) -> None:
         requestBody = copy.deepcopy(requestPayload)
-        requestBody['query'] = "#" + self.hashtag
+        requestBody['browseId'] = hashtagBrowseKey
+        requestBody['params'] = self.params
         requestBody['client'] = {
             'hl': self.language,
             'gl': self.region,
         }
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    'https://www.youtube.com/youtubei/v1/search',
-                    params = {
-                        'key': searchKey,
-                    },
-                    headers = {
-                        'User-Agent': userAgent,
-                    },
-                    json = requestBody,
-                    timeout = self.timeout
-                )
-                response = response.json()
-        except httpx.RequestError as e:
-            raise YouTubeRequestError(f'Failed to make request: {str(e)}')
-        except httpx.HTTPStatusError as e:
-            raise YouTubeRequestError(f'HTTP error {e.response.status_code}: {str(e)}')
-        except Exception as e:
-            raise YouTubeRequestError(f'Unexpected error making request: {str(e)}')
+        if self.continuationKey:
+            requestBody['continuation'] = self.continuationKey
+        self.url = innertubeUrl('browse')
+        self.data = requestBody
+
+    def _checkResponse(self, response: httpx.Response) -> httpx.Response:
+        if response.status_code != 200:
+            raise YouTubeRequestError(f'Request failed with status code {response.status_code}. URL: {self.url}')
+        return response
+
+    def _parseParams(self, response: dict) -> None:
         content = self._getValue(response, contentPath)
         for item in self._getValue(content, [0, 'itemSectionRenderer', 'contents']):
             if hashtagElementKey in item.keys():
                 self.params = self._getValue(item[hashtagElementKey], ['onTapCommand', 'browseEndpoint', 'params'])
                 return
 
+    def _getParams(self) -> None:
+        self._getParamsRequestBody()
+        try:
+            response = loads(self._checkResponse(self.syncPostRequest()).content)
+        except YouTubeSearchError:
+            raise
+        except httpx.RequestError as e:
+            raise YouTubeRequestError(f'Failed to make request: {str(e)}')
+        except Exception as e:
+            raise YouTubeRequestError(f'Unexpected error making request: {str(e)}')
+        self._parseParams(response)
+
+    async def _asyncGetParams(self) -> None:
+        self._getParamsRequestBody()
+        try:
+            response = loads(self._checkResponse(await self.asyncPostRequest()).content)
+        except YouTubeSearchError:
+            raise
+        except httpx.RequestError as e:
+            raise YouTubeRequestError(f'Failed to make request: {str(e)}')
+        except Exception as e:
+            raise YouTubeRequestError(f'Unexpected error making request: {str(e)}')
+        self._parseParams(response)
+
     def _makeRequest(self) -> None:
         if self.params == None:
             return
-        requestBody = copy.deepcopy(requestPayload)
-        requestBody['browseId'] = hashtagBrowseKey
-        requestBody['params'] = self.params
-        requestBody['client'] = {
-            'hl': self.language,
-            'gl': self.region,
-        }
-        if self.continuationKey:
-            requestBody['continuation'] = self.continuationKey
-        requestBodyBytes = json.dumps(requestBody).encode('utf_8')
-        request = Request(
-            'https://www.youtube.com/youtubei/v1/browse' + '?' + urlencode({
-                'key': searchKey,
-            }),
-            data = requestBodyBytes,
-            headers = {
-                'Content-Type': 'application/json; charset=utf-8',
-                'Content-Length': len(requestBodyBytes),
-                'User-Agent': userAgent,
-            }
-        )
+        self._getBrowseRequestBody()
         try:
-            self.response = urlopen(request, timeout=self.timeout).read().decode('utf_8')
-        except (URLError, HTTPError, TimeoutError) as e:
+            self.response = self._checkResponse(self.syncPostRequest()).content
+        except YouTubeSearchError:
+            raise
+        except httpx.RequestError as e:
             raise YouTubeRequestError(f'Failed to make request: {str(e)}')
         except Exception as e:
             raise YouTubeRequestError(f'Unexpected error making request: {str(e)}')
@@ -154,33 +141,13 @@ class HashtagCore(ComponentHandler):
     async def _asyncMakeRequest(self) -> None:
         if self.params == None:
             return
-        requestBody = copy.deepcopy(requestPayload)
-        requestBody['browseId'] = hashtagBrowseKey
-        requestBody['params'] = self.params
-        requestBody['client'] = {
-            'hl': self.language,
-            'gl': self.region,
-        }
-        if self.continuationKey:
-            requestBody['continuation'] = self.continuationKey
+        self._getBrowseRequestBody()
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    'https://www.youtube.com/youtubei/v1/browse',
-                    params = {
-                        'key': searchKey,
-                    },
-                    headers = {
-                        'User-Agent': userAgent,
-                    },
-                    json = requestBody,
-                    timeout = self.timeout
-                )
-                self.response = response.content
+            self.response = self._checkResponse(await self.asyncPostRequest()).content
+        except YouTubeSearchError:
+            raise
         except httpx.RequestError as e:
             raise YouTubeRequestError(f'Failed to make request: {str(e)}')
-        except httpx.HTTPStatusError as e:
-            raise YouTubeRequestError(f'HTTP error {e.response.status_code}: {str(e)}')
         except Exception as e:
             raise YouTubeRequestError(f'Unexpected error making request: {str(e)}')
 
@@ -189,10 +156,11 @@ class HashtagCore(ComponentHandler):
             return
         self.resultComponents = []
         try:
+            response = loads(self.response)
             if not self.continuationKey:
-                responseSource = self._getValue(json.loads(self.response), hashtagVideosPath)
+                responseSource = self._getValue(response, hashtagVideosPath)
             else:
-                responseSource = self._getValue(json.loads(self.response), hashtagContinuationVideosPath)
+                responseSource = self._getValue(response, hashtagContinuationVideosPath)
             if responseSource:
                 for element in responseSource:
                     if richItemKey in element.keys():
@@ -207,5 +175,7 @@ class HashtagCore(ComponentHandler):
             raise YouTubeParseError(f'Failed to parse JSON response: {str(e)}')
         except KeyError as e:
             raise YouTubeParseError(f'Missing expected key in response: {str(e)}')
+        except YouTubeSearchError:
+            raise
         except Exception as e:
             raise YouTubeParseError(f'Failed to parse YouTube response: {str(e)}')
\ No newline at end of file
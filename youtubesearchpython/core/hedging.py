@@ -0,0 +1,79 @@
+import threading
+from collections import deque
+from typing import Iterable, Optional
+
+from youtubesearchpython.core.ratelimit import RateLimiter
+
+
+class HedgingPolicy:
+    '''Sends a duplicate of a slow asynchronous request, and keeps whichever response arrives first.
+
+    Recent latencies are tracked per endpoint (keyed like `RateLimiter`). When a request has not been answered
+    after the `percentile` of them, the same request is sent once more, and the slower of the two is cancelled
+    as soon as the other one gets a response. Only idempotent requests are hedged, and at most `budget` extra
+    requests are sent per request, so hedging cannot multiply the load on YouTube during an incident.
+
+    Args:
+        percentile (float, optional): Percentile of recent latencies after which a request is hedged. Defaults to 0.95.
+        budget (float, optional): Maximum share of extra requests, e.g. 0.05 for one hedge per 20 requests.
+            Defaults to 0.05.
+        endpoints (iterable, optional): Endpoints hedged. Defaults to ('player', 'search').
+        window (int, optional): Number of recent latencies kept per endpoint. Defaults to 200.
+        minSamples (int, optional): Latencies needed before an endpoint is hedged. Defaults to 20.
+        minDelay (float, optional): Shortest wait before hedging, in seconds. Defaults to 0.01.
+
+    Examples:
+        >>> session = Session(hedging = HedgingPolicy(percentile = 0.9, budget = 0.1))
+        >>> result = await VideosSearch('NoCopyrightSounds', session = session).next()
+    '''
+
+    def __init__(self, percentile: float = 0.95, budget: float = 0.05, endpoints: Iterable[str] = ('player', 'search'),
+                 window: int = 200, minSamples: int = 20, minDelay: float = 0.01):
+        self.percentile = percentile
+        self.budget = budget
+        self.endpoints = set(endpoints)
+        self.window = window
+        self.minSamples = max(1, minSamples)
+        self.minDelay = minDelay
+        self.latencies = {}
+        self.requests = 0
+        self.hedges = 0
+        self.wins = 0
+        self._lock = threading.Lock()
+
+    def delay(self, url: str) -> Optional[float]:
+        '''Returns the seconds after which a request to `url` is hedged, or None when it is not.'''
+        endpoint = RateLimiter.endpoint(url)
+        if endpoint not in self.endpoints:
+            return None
+        with self._lock:
+            latencies = sorted(self.latencies.get(endpoint, ()))
+        if len(latencies) < self.minSamples:
+            return None
+        index = min(len(latencies) - 1, int(len(latencies) * self.percentile))
+        return max(self.minDelay, latencies[index])
+
+    def record(self, url: str, latency: float) -> None:
+        '''Records the latency of a request to `url`, as seen by its caller.'''
+        endpoint = RateLimiter.endpoint(url)
+        if endpoint not in self.endpoints:
+            return
+        with self._lock:
+            self.requests += 1
+            latencies = self.latencies.get(endpoint)
+            if latencies is None:
+                latencies = self.latencies[endpoint] = deque(maxlen=self.window)
+            latencies.append(latency)
+
+    def allow(self) -> bool:
+        '''Takes a hedge from the budget, and returns whether one was left.'''
+        with self._lock:
+            if self.hedges + 1 > self.budget * max(self.requests, 1):
+                return False
+            self.hedges += 1
+            return True
+
+    def won(self) -> None:
+        '''Counts a hedge that answered before the request it duplicated.'''
+        with self._lock:
+            self.wins += 1
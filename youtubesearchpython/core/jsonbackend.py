@@ -0,0 +1,111 @@
+import json
+from typing import Any, List, Union
+
+from youtubesearchpython.core.constants import ResultMode
+from youtubesearchpython.core.exceptions import YouTubeSearchError
+from youtubesearchpython.core.thumbnails import ThumbnailResolver
+
+isOrjsonInstalled = False
+
+try:
+    import orjson
+
+    isOrjsonInstalled = True
+except ImportError:
+    isOrjsonInstalled = False
+
+isMsgspecInstalled = False
+
+try:
+    import msgspec
+
+    isMsgspecInstalled = True
+except ImportError:
+    isMsgspecInstalled = False
+
+isUjsonInstalled = False
+
+try:
+    import ujson
+
+    isUjsonInstalled = True
+except ImportError:
+    isUjsonInstalled = False
+
+
+def availableJsonBackends() -> List[str]:
+    '''Returns the JSON backends that can be used with the installed packages, fastest first.'''
+    backends = []
+    if isOrjsonInstalled:
+        backends.append('orjson')
+    if isMsgspecInstalled:
+        backends.append('msgspec')
+    if isUjsonInstalled:
+        backends.append('ujson')
+    backends.append('json')
+    return backends
+
+
+_backend = availableJsonBackends()[0]
+
+
+def getJsonBackend() -> str:
+    '''Returns the name of the JSON backend responses are parsed with.'''
+    return _backend
+
+
+def setJsonBackend(backend: str) -> None:
+    '''Parses responses & encodes `ResultMode.compactJson` results with another JSON backend.
+
+    The fastest installed one is used by default: 'orjson', then 'msgspec', then 'ujson', then the standard
+    library's 'json'. Every backend gives the same values, so switching only changes the time spent.
+
+    Args:
+        backend (str): One of `availableJsonBackends()`.
+    '''
+    global _backend
+    if backend not in availableJsonBackends():
+        raise YouTubeSearchError(f'JSON backend {backend!r} is not available, use one of {availableJsonBackends()}')
+    _backend = backend
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, ThumbnailResolver):
+        return value.resolve()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    '''Parses a JSON document, preferably given as the `bytes` of a response so that it is never decoded to a
+    `str` first. Invalid documents raise `json.JSONDecodeError`, whatever the backend.
+    '''
+    if _backend == 'orjson':
+        # orjson.JSONDecodeError already subclasses json.JSONDecodeError.
+        return orjson.loads(data)
+    if _backend == 'msgspec':
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as error:
+            raise json.JSONDecodeError(str(error), data if isinstance(data, str) else '', 0) from None
+    if _backend == 'ujson':
+        try:
+            return ujson.loads(data)
+        except ValueError as error:
+            raise json.JSONDecodeError(str(error), data if isinstance(data, str) else '', 0) from None
+    return json.loads(data)
+
+
+def dumps(value: Any, mode: int = ResultMode.json) -> str:
+    '''Encodes a result for `ResultMode.json`, indented by 4 spaces, or for `ResultMode.compactJson`, on a single
+    line with no whitespace and non-ASCII characters kept as they are.
+    '''
+    if mode != ResultMode.compactJson:
+        # Neither orjson nor msgspec indent by 4 spaces, the standard library keeps this output unchanged.
+        return json.dumps(value, indent=4, default=_default)
+    if _backend == 'orjson':
+        return orjson.dumps(value, default=_default).decode()
+    if _backend == 'msgspec':
+        return msgspec.json.encode(value, enc_hook=_default).decode()
+    if _backend == 'ujson':
+        return ujson.dumps(value, ensure_ascii=False, escape_forward_slashes=False, default=_default)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=_default)
@@ -4,12 +4,15 @@ import itertools
 import json
 import re
 from typing import Iterable, Mapping, Tuple, TypeVar, Union, List, Optional
-from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
 from youtubesearchpython.core.constants import *
-from youtubesearchpython.core.requests import RequestCore
-from youtubesearchpython.core.exceptions import YouTubeRequestError, YouTubeParseError
+from youtubesearchpython.core.extractor import compileSchema, getValue
+from youtubesearchpython.core.requests import RequestCore, innertubeUrl
+from youtubesearchpython.core.session import Session
+from youtubesearchpython.core.exceptions import YouTubeRequestError, YouTubeParseError, YouTubeSearchError
+from youtubesearchpython.core.jsonbackend import dumps, loads
+from youtubesearchpython.core.results import PlaylistVideoResult, withObjects
 import httpx
 
 
@@ -17,13 +20,61 @@ K = TypeVar("K")
 T = TypeVar("T")
 
 
+# Schemas of a playlistVideoRenderer, compiled once at import. See `compileSchema`.
+_videoAccessibilitySchema = {
+    "title": ["title", "accessibility", "accessibilityData", "label"],
+    "duration": ["lengthText", "accessibility", "accessibilityData", "label"],
+}
+
+_videoSchema = compileSchema({
+    "id": ["videoId"],
+    "thumbnails": ["thumbnail", "thumbnails"],
+    "title": ["title", "runs", 0, "text"],
+    "channel": {
+        "name": ["shortBylineText", "runs", 0, "text"],
+        "id": ["shortBylineText", "runs", 0, "navigationEndpoint", "browseEndpoint", "browseId"],
+        "link": ["shortBylineText", "runs", 0, "navigationEndpoint", "browseEndpoint", "canonicalBaseUrl"],
+    },
+    "duration": ["lengthText", "simpleText"],
+    "accessibility": _videoAccessibilitySchema,
+    "link": ["navigationEndpoint", "commandMetadata", "webCommandMetadata", "url"],
+    "isPlayable": ["isPlayable"],
+})
+
+_nextVideoSchema = compileSchema({
+    "id": ["videoId"],
+    "title": ["title", "runs", 0, "text"],
+    "thumbnails": ["thumbnail", "thumbnails"],
+    "link": ["navigationEndpoint", "commandMetadata", "webCommandMetadata", "url"],
+    "channel": {
+        "name": ["shortBylineText", "runs", 0, "text"],
+        "id": ["shortBylineText", "runs", 0, "navigationEndpoint", "browseEndpoint", "browseId"],
+        "link": ["shortBylineText", "runs", 0, "navigationEndpoint", "browseEndpoint", "canonicalBaseUrl"],
+    },
+    "duration": ["lengthText", "simpleText"],
+    "accessibility": _videoAccessibilitySchema,
+})
+
+_videosSchema = compileSchema({
+    "id": ["videoId"],
+    "title": ["title", "runs", 0, "text"],
+    "thumbnails": ["thumbnail", "thumbnails"],
+    "channel": {
+        "name": ["shortBylineText", "runs", 0, "text"],
+        "id": ["shortBylineText", "runs", 0, "navigationEndpoint", "browseEndpoint", "browseId"],
+    },
+    "duration": ["lengthText", "simpleText"],
+    "accessibility": _videoAccessibilitySchema,
+})
+
+
 class PlaylistCore(RequestCore):
     playlistComponent = None
     result = None
     continuationKey = None
 
-    def __init__(self, playlistLink: str, componentMode: str, resultMode: int, timeout: Optional[int]):
-        super().__init__(timeout=timeout)
+    def __init__(self, playlistLink: str, componentMode: str, resultMode: int, timeout: Optional[int], session: Optional[Session] = None):
+        super().__init__(timeout=timeout, session=session)
         self.componentMode = componentMode
         self.resultMode = resultMode
         self.timeout = timeout
@@ -32,8 +83,10 @@ class PlaylistCore(RequestCore):
     def post_processing(self):
         self.__parseSource()
         self.__getComponents()
-        if self.resultMode == ResultMode.json:
-            self.result = json.dumps(self.playlistComponent, indent=4)
+        if self.resultMode in (ResultMode.json, ResultMode.compactJson):
+            self.result = dumps(self.playlistComponent, self.resultMode)
+        elif self.resultMode == ResultMode.objects:
+            self.result = withObjects(self.playlistComponent, 'videos', PlaylistVideoResult)
         else:
             self.result = self.playlistComponent
 
@@ -57,8 +110,10 @@ class PlaylistCore(RequestCore):
     def next_post_processing(self):
         self.__parseSource()
         self.__getNextComponents()
-        if self.resultMode == ResultMode.json:
-            self.result = json.dumps(self.playlistComponent, indent=4)
+        if self.resultMode in (ResultMode.json, ResultMode.compactJson):
+            self.result = dumps(self.playlistComponent, self.resultMode)
+        elif self.resultMode == ResultMode.objects:
+            self.result = withObjects(self.playlistComponent, 'videos', PlaylistVideoResult)
         else:
             self.result = self.playlistComponent
 
@@ -66,7 +121,7 @@ class PlaylistCore(RequestCore):
         self.prepare_next_request()
         if self.continuationKey:
             statusCode = self.syncPostRequest()
-            self.response = statusCode.text
+            self.response = statusCode.content
             if statusCode.status_code == 200:
                 self.next_post_processing()
             else:
@@ -76,7 +131,7 @@ class PlaylistCore(RequestCore):
         if self.continuationKey:
             self.prepare_next_request()
             statusCode = await self.asyncPostRequest()
-            self.response = statusCode.text
+            self.response = statusCode.content
             if statusCode.status_code == 200:
                 self.next_post_processing()
             else:
@@ -95,9 +150,7 @@ class PlaylistCore(RequestCore):
         
         browseId = "VL" + id if not id.startswith("VL") else id
 
-        self.url = 'https://www.youtube.com/youtubei/v1/browse' + '?' + urlencode({
-            'key': searchKey,
-        })
+        self.url = innertubeUrl('browse')
         self.data = {
             "browseId": browseId,
         }
@@ -106,38 +159,40 @@ class PlaylistCore(RequestCore):
     def __makeRequest(self) -> int:
         self.prepare_first_request()
         request = self.syncPostRequest()
-        self.response = request.text
+        self.response = request.content
         return request.status_code
     
     async def __makeAsyncRequest(self) -> int:
         self.prepare_first_request()
         request = await self.asyncPostRequest()
-        self.response = request.text
+        self.response = request.content
         return request.status_code
 
     def prepare_next_request(self):
         requestBody = copy.deepcopy(requestPayload)
         requestBody['continuation'] = self.continuationKey
         self.data = requestBody
-        self.url = 'https://www.youtube.com/youtubei/v1/browse' + '?' + urlencode({
-            'key': searchKey,
-        })
+        self.url = innertubeUrl('browse')
 
     def __makeNextRequest(self) -> int:
         response = self.syncPostRequest()
         try:
-            self.response = response.text
+            self.response = response.content
             return response.status_code
         except (AttributeError, httpx.RequestError) as e:
             raise YouTubeRequestError(f'Failed to make playlist request: {str(e)}')
+        except YouTubeSearchError:
+            raise
         except Exception as e:
             raise YouTubeRequestError(f'Unexpected error making playlist request: {str(e)}')
 
     def __parseSource(self) -> None:
         try:
-            self.responseSource = json.loads(self.response)
+            self.responseSource = loads(self.response)
         except json.JSONDecodeError as e:
             raise YouTubeParseError(f'Failed to parse JSON response for playlist: {str(e)}')
+        except YouTubeSearchError:
+            raise
         except Exception as e:
             raise YouTubeParseError(f'Failed to parse YouTube playlist response: {str(e)}')
 
@@ -151,24 +206,8 @@ class PlaylistCore(RequestCore):
         videos = []
         for video in videorenderer:
             try:
-                video = video["playlistVideoRenderer"]
-                j = {
-                    "id": self.__getValue(video, ["videoId"]),
-                    "thumbnails": self.__getValue(video, ["thumbnail", "thumbnails"]),
-                    "title": self.__getValue(video, ["title", "runs", 0, "text"]),
-                    "channel": {
-                        "name": self.__getValue(video, ["shortBylineText", "runs", 0, "text"]),
-                        "id": self.__getValue(video, ["shortBylineText", "runs", 0, "navigationEndpoint", "browseEndpoint", "browseId"]),
-                        "link": self.__getValue(video, ["shortBylineText", "runs", 0, "navigationEndpoint", "browseEndpoint", "canonicalBaseUrl"]),
-                    },
-                    "duration": self.__getValue(video, ["lengthText", "simpleText"]),
-                    "accessibility": {
-                        "title": self.__getValue(video, ["title", "accessibility", "accessibilityData", "label"]),
-                        "duration": self.__getValue(video, ["lengthText", "accessibility", "accessibilityData", "label"]),
-                    },
-                    "link": "https://www.youtube.com" + self.__getValue(video, ["navigationEndpoint", "commandMetadata", "webCommandMetadata", "url"]),
-                    "isPlayable": self.__getValue(video, ["isPlayable"]),
-                }
+                j = _videoSchema(video["playlistVideoRenderer"])
+                j["link"] = "https://www.youtube.com" + j["link"]
                 videos.append(j)
             except (KeyError, AttributeError, IndexError, TypeError):
                 pass
@@ -212,27 +251,9 @@ class PlaylistCore(RequestCore):
             return
         for videoElement in continuationElements:
             if playlistVideoKey in videoElement.keys():
-                videoComponent = {
-                    'id': self.__getValue(videoElement, [playlistVideoKey, 'videoId']),
-                    'title': self.__getValue(videoElement, [playlistVideoKey, 'title', 'runs', 0, 'text']),
-                    'thumbnails': self.__getValue(videoElement, [playlistVideoKey, 'thumbnail', 'thumbnails']),
-                    'link': "https://www.youtube.com" + self.__getValue(videoElement, [playlistVideoKey, "navigationEndpoint", "commandMetadata", "webCommandMetadata", "url"]),
-                    'channel': {
-                        'name': self.__getValue(videoElement, [playlistVideoKey, 'shortBylineText', 'runs', 0, 'text']),
-                        'id': self.__getValue(videoElement,
-                                              [playlistVideoKey, 'shortBylineText', 'runs', 0, 'navigationEndpoint',
-                                               'browseEndpoint', 'browseId']),
-                        "link": "https://www.youtube.com" + self.__getValue(videoElement, [playlistVideoKey, "shortBylineText", "runs", 0, "navigationEndpoint", "browseEndpoint", "canonicalBaseUrl"])
-                    },
-                    'duration': self.__getValue(videoElement, [playlistVideoKey, 'lengthText', 'simpleText']),
-                    'accessibility': {
-                        'title': self.__getValue(videoElement,
-                                                 [playlistVideoKey, 'title', 'accessibility', 'accessibilityData',
-                                                  'label']),
-                        'duration': self.__getValue(videoElement, [playlistVideoKey, 'lengthText', 'accessibility',
-                                                                   'accessibilityData', 'label']),
-                    },
-                }
+                videoComponent = _nextVideoSchema(videoElement[playlistVideoKey])
+                videoComponent['link'] = "https://www.youtube.com" + videoComponent['link']
+                videoComponent['channel']['link'] = "https://www.youtube.com" + videoComponent['channel']['link']
                 playlistComponent['videos'].append(
                     videoComponent
                 )
@@ -284,26 +305,7 @@ class PlaylistCore(RequestCore):
             playlistComponent['videos'] = []
             for videoElement in element['videos']:
                 if playlistVideoKey in videoElement.keys():
-                    videoComponent = {
-                        'id': self.__getValue(videoElement, [playlistVideoKey, 'videoId']),
-                        'title': self.__getValue(videoElement, [playlistVideoKey, 'title', 'runs', 0, 'text']),
-                        'thumbnails': self.__getValue(videoElement, [playlistVideoKey, 'thumbnail', 'thumbnails']),
-                        'channel': {
-                            'name': self.__getValue(videoElement,
-                                                    [playlistVideoKey, 'shortBylineText', 'runs', 0, 'text']),
-                            'id': self.__getValue(videoElement,
-                                                  [playlistVideoKey, 'shortBylineText', 'runs', 0, 'navigationEndpoint',
-                                                   'browseEndpoint', 'browseId']),
-                        },
-                        'duration': self.__getValue(videoElement, [playlistVideoKey, 'lengthText', 'simpleText']),
-                        'accessibility': {
-                            'title': self.__getValue(videoElement,
-                                                     [playlistVideoKey, 'title', 'accessibility', 'accessibilityData',
-                                                      'label']),
-                            'duration': self.__getValue(videoElement, [playlistVideoKey, 'lengthText', 'accessibility',
-                                                                       'accessibilityData', 'label']),
-                        },
-                    }
+                    videoComponent = _videosSchema(videoElement[playlistVideoKey])
                     videoComponent['link'] = 'https://www.youtube.com/watch?v=' + videoComponent['id']
                     videoComponent['channel']['link'] = 'https://www.youtube.com/channel/' + videoComponent['channel'][
                         'id']
@@ -317,25 +319,11 @@ class PlaylistCore(RequestCore):
     def __result(self, mode: int) -> Union[dict, str]:
         if mode == ResultMode.dict:
             return self.playlistComponent
-        elif mode == ResultMode.json:
-            return json.dumps(self.playlistComponent, indent=4)
-
-    def __getValue(self, source: dict, path: Iterable[str]) -> Union[str, int, dict, None]:
-        value = source
-        for key in path:
-            if type(key) is str:
-                if key in value.keys():
-                    value = value[key]
-                else:
-                    value = None
-                    break
-            elif type(key) is int:
-                if len(value) != 0:
-                    value = value[key]
-                else:
-                    value = None
-                    break
-        return value
+        elif mode in (ResultMode.json, ResultMode.compactJson):
+            return dumps(self.playlistComponent, mode)
+
+    # Shared with every parser, see `compilePath`.
+    __getValue = staticmethod(getValue)
 
     def __getAllWithKey(self, source: Iterable[Mapping[K, T]], key: K) -> Iterable[T]:
         for item in source:
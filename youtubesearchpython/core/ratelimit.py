@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from youtubesearchpython.core.deadline import Deadline
+from youtubesearchpython.core.exceptions import YouTubeDeadlineExceeded, YouTubeSearchError
+
+
+class TokenBucket:
+    '''Token bucket refilled at `rate` tokens per second, holding at most `burst` tokens.
+
+    Every request takes a token. When the bucket is empty the token is borrowed from the future instead,
+    and the caller is told how long to wait for it, so concurrent callers are served in arrival order.
+    The bucket only holds its lock to do this arithmetic, never while waiting, which keeps it safe to share
+    between threads & event loops.
+    '''
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise YouTubeSearchError(f'Rate limit must be positive, got {rate}')
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        '''Takes a token, and returns the seconds to wait before using it.'''
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def cancel(self) -> None:
+        '''Gives back a token taken by `reserve` that will not be used.'''
+        with self._lock:
+            self.tokens = min(self.burst, self.tokens + 1)
+
+
+class RateLimiter:
+    '''Client-side rate limit of the requests sent by a `Session`, with a separate token bucket per endpoint.
+
+    InnerTube requests are keyed by their endpoint, e.g. 'search', 'player', 'browse', 'next' or 'get_transcript',
+    and other requests by their host, e.g. 'clients1.google.com' for suggestions or 'i.ytimg.com' for thumbnails.
+    A single limiter can be shared between sessions, threads & event loops.
+
+    Args:
+        rate (float, optional): Requests per second allowed for every endpoint missing from `endpoints`.
+            Defaults to None, which leaves those unlimited.
+        burst (int, optional): Number of requests that can be sent at once after being idle, for `rate`.
+            Defaults to 1.
+        endpoints (dict, optional): Maps an endpoint to its own rate, or to a `(rate, burst)` tuple.
+            Defaults to None.
+
+    Examples:
+        >>> limiter = RateLimiter(rate = 10, burst = 20, endpoints = {'player': (2, 5), 'clients1.google.com': 5})
+        >>> session = Session(rateLimiter = limiter)
+    '''
+
+    def __init__(self, rate: Optional[float] = None, burst: int = 1,
+                 endpoints: Optional[Dict[str, Union[float, Tuple[float, int]]]] = None):
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}
+        for endpoint, limit in (endpoints or {}).items():
+            if isinstance(limit, tuple):
+                self.buckets[endpoint] = TokenBucket(*limit)
+            else:
+                self.buckets[endpoint] = TokenBucket(limit, burst)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint(url: str) -> str:
+        '''Returns the key `url` is rate limited under.'''
+        parts = urlsplit(url)
+        if parts.path.startswith('/youtubei/v1/'):
+            return parts.path[len('/youtubei/v1/'):]
+        return parts.netloc
+
+    def bucket(self, url: str) -> Optional[TokenBucket]:
+        '''Returns the bucket of the endpoint of `url`, or None when it is not limited.'''
+        endpoint = self.endpoint(url)
+        bucket = self.buckets.get(endpoint)
+        if bucket is None and self.rate is not None:
+            with self._lock:
+                bucket = self.buckets.get(endpoint)
+                if bucket is None:
+                    bucket = self.buckets[endpoint] = TokenBucket(self.rate, self.burst)
+        return bucket
+
+    def _reserve(self, url: str, deadline: Optional[Deadline]) -> float:
+        bucket = self.bucket(url)
+        delay = bucket.reserve() if bucket is not None else 0.0
+        # A request that could only be sent after its deadline is given up on before waiting for nothing.
+        if delay > 0 and deadline is not None and delay >= deadline.remaining():
+            bucket.cancel()
+            raise YouTubeDeadlineExceeded(f'Deadline of {deadline.seconds} s exceeded.')
+        return delay
+
+    def wait(self, url: str, deadline: Optional[Deadline] = None) -> float:
+        '''Blocks until a request to `url` is allowed, and returns the seconds waited. Raises
+        YouTubeDeadlineExceeded right away, without taking a token, when `deadline` runs out before then.
+        '''
+        delay = self._reserve(url, deadline)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def asyncWait(self, url: str, deadline: Optional[Deadline] = None) -> float:
+        '''Waits without blocking the event loop until a request to `url` is allowed, and returns the seconds waited.
+        Raises YouTubeDeadlineExceeded right away, without taking a token, when `deadline` runs out before then.
+        '''
+        delay = self._reserve(url, deadline)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
@@ -1,35 +1,93 @@
 import httpx
-from typing import Optional
+from typing import Optional, Union
+from urllib.parse import urlencode
+
+from youtubesearchpython.core.constants import searchKey
+from youtubesearchpython.core.deadline import Deadline
+from youtubesearchpython.core.session import Session, getDefaultSession
+
+
+def innertubeUrl(endpoint: str, **params) -> str:
+    '''Builds the URL of an InnerTube endpoint, e.g. `innertubeUrl('player', videoId = 'E07s5ZYygMg')`.
+    Compact JSON is always requested with prettyPrint=false, which makes responses smaller and faster to decode.
+    '''
+    return 'https://www.youtube.com/youtubei/v1/' + endpoint + '?' + urlencode({
+        'key': searchKey,
+        **params,
+        'prettyPrint': 'false',
+    })
 
-from youtubesearchpython.core.constants import userAgent
 
 class RequestCore:
-    def __init__(self, timeout: Optional[int] = None):
+    def __init__(self, timeout: Optional[int] = None, session: Optional[Session] = None):
         self.url = None
         self.data = None
         self.timeout = timeout if timeout is not None else 10
+        self.session = session
+        # Comma separated response fields sent as X-Goog-FieldMask, e.g. 'videoDetails,microformat'.
+        # Everything else is left out of the response by the server.
+        self.fieldMask = None
+        # Every InnerTube request of the library only reads data, so the session can safely retry it,
+        # continuations included.
+        self.idempotent = True
+        # Time budget of the whole public call, shared by every request it makes.
+        self.deadline: Optional[Deadline] = None
+
+    def _getSession(self) -> Session:
+        return self.session if self.session is not None else getDefaultSession()
+
+    def _postHeaders(self) -> dict:
+        return {'X-Goog-FieldMask': self.fieldMask} if self.fieldMask else {}
+
+    def _requestTimeout(self, timeout: Optional[float] = None) -> float:
+        '''Returns the timeout of the next request, shortened to the time left before `deadline`.'''
+        if timeout is None:
+            timeout = self.timeout if self.timeout is not None else 10
+        return self.deadline.timeout(timeout) if self.deadline is not None else timeout
+
+    def _allows(self, hop: str) -> bool:
+        '''Returns whether the optional request `hop` still fits before `deadline`.'''
+        return self.deadline is None or self.deadline.allows(hop)
+
+    def _knownMissing(self, videoId: str, feature: str) -> Optional[dict]:
+        '''Returns the empty result the session's `negativeCache` remembers for `feature` of `videoId`, raises
+        the error it remembers, or returns None.
+        '''
+        negativeCache = self._getSession().negativeCache
+        return negativeCache.get(videoId, feature) if negativeCache is not None else None
+
+    def _rememberMissing(self, videoId: str, feature: str, value: Union[dict, Exception]) -> None:
+        '''Remembers in the session's `negativeCache` that `feature` of `videoId` gives the empty result, or
+        raises the error, `value`.
+        '''
+        negativeCache = self._getSession().negativeCache
+        if negativeCache is not None:
+            negativeCache.put(videoId, feature, value)
 
     def syncPostRequest(self) -> httpx.Response:
-        timeout = self.timeout if self.timeout is not None else 10
-        return httpx.post(
+        return self._getSession().request(
+            'POST',
             self.url,
-            headers={"User-Agent": userAgent},
             json=self.data,
-            timeout=timeout,
+            headers=self._postHeaders(),
+            timeout=self._requestTimeout(),
+            idempotent=self.idempotent,
+            deadline=self.deadline,
         )
 
     async def asyncPostRequest(self) -> httpx.Response:
-        timeout = self.timeout if self.timeout is not None else 10
-        async with httpx.AsyncClient() as client:
-            r = await client.post(self.url, headers={"User-Agent": userAgent}, json=self.data, timeout=timeout)
-            return r
+        return await self._getSession().asyncRequest(
+            'POST',
+            self.url,
+            json=self.data,
+            headers=self._postHeaders(),
+            timeout=self._requestTimeout(),
+            idempotent=self.idempotent,
+            deadline=self.deadline,
+        )
 
     def syncGetRequest(self) -> httpx.Response:
-        timeout = self.timeout if self.timeout is not None else 10
-        return httpx.get(self.url, headers={"User-Agent": userAgent}, timeout=timeout, cookies={'CONSENT': 'YES+1'})
+        return self._getSession().request('GET', self.url, headers={'Cookie': 'CONSENT=YES+1'}, timeout=self._requestTimeout(), deadline=self.deadline)
 
     async def asyncGetRequest(self) -> httpx.Response:
-        timeout = self.timeout if self.timeout is not None else 10
-        async with httpx.AsyncClient() as client:
-            r = await client.get(self.url, headers={"User-Agent": userAgent}, timeout=timeout, cookies={'CONSENT': 'YES+1'})
-            return r
\ No newline at end of file
+        return await self._getSession().asyncRequest('GET', self.url, headers={'Cookie': 'CONSENT=YES+1'}, timeout=self._requestTimeout(), deadline=self.deadline)
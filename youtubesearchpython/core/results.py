@@ -0,0 +1,318 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class Result(ABC):
+    '''Base of the compact result objects returned with `ResultMode.objects`.
+
+    Every field is an attribute stored in `__slots__`, so an object takes a fraction of the memory of the dict
+    returned with `ResultMode.dict`, which is worth it when holding many results. Fields derived from others,
+    such as `link`, are computed when read. `toDict()` gives the fields back in the layout of `ResultMode.dict`.
+    '''
+    __slots__ = ()
+
+    @abstractmethod
+    def toDict(self) -> dict:
+        '''Returns the fields in the layout of `ResultMode.dict`.'''
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+
+class Thumbnail(Result):
+    __slots__ = ('url', 'width', 'height')
+
+    def __init__(self, url: str, width: Optional[int], height: Optional[int]):
+        self.url = url
+        self.width = width
+        self.height = height
+
+    def toDict(self) -> dict:
+        return {'url': self.url, 'width': self.width, 'height': self.height}
+
+
+def _thumbnails(thumbnails: Optional[List[dict]]) -> Tuple[Thumbnail, ...]:
+    if not thumbnails:
+        return ()
+    return tuple(Thumbnail(thumbnail.get('url'), thumbnail.get('width'), thumbnail.get('height')) for thumbnail in thumbnails)
+
+
+def _thumbnailDicts(thumbnails: Tuple[Thumbnail, ...]) -> List[dict]:
+    return [thumbnail.toDict() for thumbnail in thumbnails]
+
+
+def _text(runs: Optional[List[dict]]) -> Optional[str]:
+    if runs is None:
+        return None
+    return ''.join(run.get('text', '') for run in runs)
+
+
+def _channelLink(channelId: Optional[str]) -> Optional[str]:
+    return 'https://www.youtube.com/channel/' + channelId if channelId else None
+
+
+class VideoResult(Result):
+    '''A video found by a search. `descriptionSnippet` is plain text, and `accessibility` is left out.'''
+    __slots__ = ('id', 'title', 'publishedTime', 'duration', 'viewCount', 'shortViewCount', 'thumbnails',
+                 'richThumbnail', 'descriptionSnippet', 'channelName', 'channelId', 'channelThumbnails', 'shelfTitle')
+
+    def __init__(self, id: str, title: Optional[str], publishedTime: Optional[str], duration: Optional[str],
+                 viewCount: Optional[str], shortViewCount: Optional[str], thumbnails: Tuple[Thumbnail, ...],
+                 richThumbnail: Optional[Thumbnail], descriptionSnippet: Optional[str], channelName: Optional[str],
+                 channelId: Optional[str], channelThumbnails: Tuple[Thumbnail, ...], shelfTitle: Optional[str] = None):
+        self.id = id
+        self.title = title
+        self.publishedTime = publishedTime
+        self.duration = duration
+        self.viewCount = viewCount
+        self.shortViewCount = shortViewCount
+        self.thumbnails = thumbnails
+        self.richThumbnail = richThumbnail
+        self.descriptionSnippet = descriptionSnippet
+        self.channelName = channelName
+        self.channelId = channelId
+        self.channelThumbnails = channelThumbnails
+        self.shelfTitle = shelfTitle
+
+    @property
+    def link(self) -> str:
+        return 'https://www.youtube.com/watch?v=' + self.id
+
+    @property
+    def channelLink(self) -> Optional[str]:
+        return _channelLink(self.channelId)
+
+    @classmethod
+    def fromDict(cls, video: dict) -> 'VideoResult':
+        channel = video['channel']
+        richThumbnail = video['richThumbnail']
+        return cls(
+            video['id'], video['title'], video['publishedTime'], video['duration'], video['viewCount']['text'],
+            video['viewCount']['short'], _thumbnails(video['thumbnails']),
+            _thumbnails([richThumbnail])[0] if richThumbnail else None, _text(video['descriptionSnippet']),
+            channel['name'], channel['id'], _thumbnails(channel['thumbnails']), video.get('shelfTitle'),
+        )
+
+    def toDict(self) -> dict:
+        return {
+            'type': 'video',
+            'id': self.id,
+            'title': self.title,
+            'publishedTime': self.publishedTime,
+            'duration': self.duration,
+            'viewCount': {'text': self.viewCount, 'short': self.shortViewCount},
+            'thumbnails': _thumbnailDicts(self.thumbnails),
+            'richThumbnail': self.richThumbnail.toDict() if self.richThumbnail else None,
+            'descriptionSnippet': self.descriptionSnippet,
+            'channel': {
+                'name': self.channelName,
+                'id': self.channelId,
+                'thumbnails': _thumbnailDicts(self.channelThumbnails),
+                'link': self.channelLink,
+            },
+            'link': self.link,
+            'shelfTitle': self.shelfTitle,
+        }
+
+
+class ChannelResult(Result):
+    '''A channel found by a search. `descriptionSnippet` is plain text.'''
+    __slots__ = ('id', 'title', 'thumbnails', 'videoCount', 'descriptionSnippet', 'subscribers')
+
+    def __init__(self, id: str, title: Optional[str], thumbnails: Tuple[Thumbnail, ...], videoCount: Optional[str],
+                 descriptionSnippet: Optional[str], subscribers: Optional[str]):
+        self.id = id
+        self.title = title
+        self.thumbnails = thumbnails
+        self.videoCount = videoCount
+        self.descriptionSnippet = descriptionSnippet
+        self.subscribers = subscribers
+
+    @property
+    def link(self) -> str:
+        return 'https://www.youtube.com/channel/' + self.id
+
+    @classmethod
+    def fromDict(cls, channel: dict) -> 'ChannelResult':
+        return cls(channel['id'], channel['title'], _thumbnails(channel['thumbnails']), channel['videoCount'],
+                   _text(channel['descriptionSnippet']), channel['subscribers'])
+
+    def toDict(self) -> dict:
+        return {
+            'type': 'channel',
+            'id': self.id,
+            'title': self.title,
+            'thumbnails': _thumbnailDicts(self.thumbnails),
+            'videoCount': self.videoCount,
+            'descriptionSnippet': self.descriptionSnippet,
+            'subscribers': self.subscribers,
+            'link': self.link,
+        }
+
+
+class PlaylistResult(Result):
+    '''A playlist found by a search.'''
+    __slots__ = ('id', 'title', 'videoCount', 'channelName', 'channelId', 'thumbnails')
+
+    def __init__(self, id: str, title: Optional[str], videoCount: Optional[str], channelName: Optional[str],
+                 channelId: Optional[str], thumbnails: Tuple[Thumbnail, ...]):
+        self.id = id
+        self.title = title
+        self.videoCount = videoCount
+        self.channelName = channelName
+        self.channelId = channelId
+        self.thumbnails = thumbnails
+
+    @property
+    def link(self) -> str:
+        return 'https://www.youtube.com/playlist?list=' + self.id
+
+    @property
+    def channelLink(self) -> Optional[str]:
+        return _channelLink(self.channelId)
+
+    @classmethod
+    def fromDict(cls, playlist: dict) -> 'PlaylistResult':
+        channel = playlist['channel']
+        return cls(playlist['id'], playlist['title'], playlist['videoCount'], channel['name'], channel['id'],
+                   _thumbnails(playlist['thumbnails']))
+
+    def toDict(self) -> dict:
+        return {
+            'type': 'playlist',
+            'id': self.id,
+            'title': self.title,
+            'videoCount': self.videoCount,
+            'channel': {'name': self.channelName, 'id': self.channelId, 'link': self.channelLink},
+            'thumbnails': _thumbnailDicts(self.thumbnails),
+            'link': self.link,
+        }
+
+
+class PlaylistVideoResult(Result):
+    '''A video of a playlist. `accessibility` is left out, and `link` does not carry the playlist.'''
+    __slots__ = ('id', 'title', 'thumbnails', 'channelName', 'channelId', 'duration', 'isPlayable')
+
+    def __init__(self, id: str, title: Optional[str], thumbnails: Tuple[Thumbnail, ...], channelName: Optional[str],
+                 channelId: Optional[str], duration: Optional[str], isPlayable: Optional[bool] = None):
+        self.id = id
+        self.title = title
+        self.thumbnails = thumbnails
+        self.channelName = channelName
+        self.channelId = channelId
+        self.duration = duration
+        self.isPlayable = isPlayable
+
+    @property
+    def link(self) -> str:
+        return 'https://www.youtube.com/watch?v=' + self.id
+
+    @property
+    def channelLink(self) -> Optional[str]:
+        return _channelLink(self.channelId)
+
+    @classmethod
+    def fromDict(cls, video: dict) -> 'PlaylistVideoResult':
+        channel = video['channel']
+        return cls(video['id'], video['title'], _thumbnails(video['thumbnails']), channel['name'], channel['id'],
+                   video['duration'], video.get('isPlayable'))
+
+    def toDict(self) -> dict:
+        return {
+            'id': self.id,
+            'title': self.title,
+            'thumbnails': _thumbnailDicts(self.thumbnails),
+            'channel': {'name': self.channelName, 'id': self.channelId, 'link': self.channelLink},
+            'duration': self.duration,
+            'link': self.link,
+            'isPlayable': self.isPlayable,
+        }
+
+
+class CommentResult(Result):
+    '''A comment of a video. The accessibility label of `votes` is left out.'''
+    __slots__ = ('id', 'authorId', 'authorName', 'authorThumbnails', 'content', 'published', 'isLiked',
+                 'authorIsChannelOwner', 'voteStatus', 'votes', 'replyCount')
+
+    def __init__(self, id: str, authorId: Optional[str], authorName: Optional[str],
+                 authorThumbnails: Tuple[Thumbnail, ...], content: Optional[str], published: Optional[str],
+                 isLiked: Optional[bool], authorIsChannelOwner: Optional[bool], voteStatus: Optional[str],
+                 votes: Optional[str], replyCount: Optional[int]):
+        self.id = id
+        self.authorId = authorId
+        self.authorName = authorName
+        self.authorThumbnails = authorThumbnails
+        self.content = content
+        self.published = published
+        self.isLiked = isLiked
+        self.authorIsChannelOwner = authorIsChannelOwner
+        self.voteStatus = voteStatus
+        self.votes = votes
+        self.replyCount = replyCount
+
+    @property
+    def authorLink(self) -> Optional[str]:
+        return _channelLink(self.authorId)
+
+    @classmethod
+    def fromDict(cls, comment: dict) -> 'CommentResult':
+        author = comment['author']
+        return cls(comment['id'], author['id'], author['name'], _thumbnails(author['thumbnails']),
+                   comment['content'], comment['published'], comment['isLiked'], comment['authorIsChannelOwner'],
+                   comment['voteStatus'], comment['votes']['simpleText'], comment['replyCount'])
+
+    def toDict(self) -> dict:
+        return {
+            'id': self.id,
+            'author': {
+                'id': self.authorId,
+                'name': self.authorName,
+                'thumbnails': _thumbnailDicts(self.authorThumbnails),
+            },
+            'content': self.content,
+            'published': self.published,
+            'isLiked': self.isLiked,
+            'authorIsChannelOwner': self.authorIsChannelOwner,
+            'voteStatus': self.voteStatus,
+            'votes': {'simpleText': self.votes},
+            'replyCount': self.replyCount,
+        }
+
+
+class TranscriptSegment(Result):
+    '''A segment of a transcript.'''
+    __slots__ = ('startMs', 'endMs', 'text', 'startTime')
+
+    def __init__(self, startMs: Optional[str], endMs: Optional[str], text: Optional[str], startTime: Optional[str]):
+        self.startMs = startMs
+        self.endMs = endMs
+        self.text = text
+        self.startTime = startTime
+
+    @classmethod
+    def fromDict(cls, segment: dict) -> 'TranscriptSegment':
+        return cls(segment['startMs'], segment['endMs'], segment['text'], segment['startTime'])
+
+    def toDict(self) -> dict:
+        return {'startMs': self.startMs, 'endMs': self.endMs, 'text': self.text, 'startTime': self.startTime}
+
+
+_searchResults = {'video': VideoResult, 'channel': ChannelResult, 'playlist': PlaylistResult}
+
+
+def searchResults(components: List[dict]) -> List[Result]:
+    '''Turns the components of a search into `VideoResult`, `ChannelResult` & `PlaylistResult` objects.'''
+    return [_searchResults[component['type']].fromDict(component) for component in components]
+
+
+def withObjects(result: Dict[str, Any], key: str, resultType: type) -> Dict[str, Any]:
+    '''Returns a copy of `result` whose list at `key`, if any, is made of `resultType` objects.'''
+    if key not in result:
+        return result
+    return {**result, key: [resultType.fromDict(item) for item in result[key]]}
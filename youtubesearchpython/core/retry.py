@@ -0,0 +1,163 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import httpx
+
+from youtubesearchpython.core.deadline import Deadline
+
+
+class RetryPolicy:
+    '''Decides whether a failed request is sent again, and how long to wait before doing so.
+
+    Waits grow exponentially from `backoffBase` up to `backoffCap`, with full jitter (a random wait between
+    zero and the computed one) so that many clients failing at once do not retry in lockstep. A `Retry-After`
+    header sent by YouTube takes precedence over the computed wait.
+
+    Only idempotent requests are retried after they may have reached YouTube: GET & HEAD requests, and requests
+    explicitly sent with `idempotent = True` (every InnerTube read of this library, continuations included).
+    Other requests are only retried when they never left the client (connection errors & pool timeouts) or were
+    refused with 429.
+
+    Args:
+        maxAttempts (int, optional): Maximum number of times a request is sent, first attempt included.
+            1 disables retries. Defaults to 3.
+        backoffBase (float, optional): Wait before the first retry, in seconds. Defaults to 0.5.
+        backoffCap (float, optional): Upper bound of a single wait, in seconds. Defaults to 8.
+        jitter (bool, optional): Randomizes every wait between zero and the computed one. Defaults to True.
+        statusRules (dict, optional): Maps a status code to the number of retries allowed for it. Statuses
+            missing from it are never retried. Defaults to `RetryPolicy.defaultStatusRules`.
+        respectRetryAfter (bool, optional): Waits for the `Retry-After` header of a response, when present.
+            Defaults to True.
+        maxRetryAfter (float, optional): Longest `Retry-After` honoured, in seconds. Longer ones give up on the
+            request instead. Defaults to 30.
+        deadline (float, optional): Overall time budget of a request across all of its attempts & waits, in
+            seconds. No retry is attempted past it. Defaults to None.
+
+    Examples:
+        >>> session = Session(retry = RetryPolicy(maxAttempts = 5, statusRules = {429: 4, 503: 2}, deadline = 20))
+        >>> session = Session(retry = RetryPolicy(maxAttempts = 1))  # No retries.
+    '''
+
+    defaultStatusRules = {429: 4, 500: 2, 502: 2, 503: 2, 504: 2}
+    idempotentMethods = ('GET', 'HEAD', 'OPTIONS')
+    # Failures of requests that were never written to the connection, safe to retry for any request.
+    unsentErrors = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+    sentErrors = (httpx.ReadError, httpx.ReadTimeout, httpx.WriteError, httpx.WriteTimeout, httpx.RemoteProtocolError)
+
+    def __init__(self, maxAttempts: int = 3, backoffBase: float = 0.5, backoffCap: float = 8.0, jitter: bool = True,
+                 statusRules: Optional[Dict[int, int]] = None, respectRetryAfter: bool = True,
+                 maxRetryAfter: float = 30.0, deadline: Optional[float] = None):
+        self.maxAttempts = max(1, maxAttempts)
+        self.backoffBase = backoffBase
+        self.backoffCap = backoffCap
+        self.jitter = jitter
+        self.statusRules = dict(self.defaultStatusRules if statusRules is None else statusRules)
+        self.respectRetryAfter = respectRetryAfter
+        self.maxRetryAfter = maxRetryAfter
+        self.deadline = deadline
+        self.random = random.Random()
+
+    def isIdempotent(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        '''Returns whether a request can be sent twice without side effects.'''
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.idempotentMethods
+
+    def backoff(self, retry: int) -> float:
+        '''Returns the wait before the `retry`-th retry (starting at 1), in seconds.'''
+        wait = min(self.backoffCap, self.backoffBase * (2 ** (retry - 1)))
+        if self.jitter:
+            wait = self.random.uniform(0, wait)
+        return wait
+
+    @staticmethod
+    def retryAfter(response: httpx.Response) -> Optional[float]:
+        '''Returns the wait requested by the `Retry-After` header of `response` in seconds, if any.'''
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    def start(self, method: str, idempotent: Optional[bool] = None, deadline: Optional[Deadline] = None) -> 'RetryState':
+        '''Returns the state tracking the attempts of a single request, bounded by the `deadline` of its call.'''
+        return RetryState(self, self.isIdempotent(method, idempotent), deadline)
+
+
+class RetryState:
+    '''Attempts & retries spent by a single request under a `RetryPolicy`.'''
+
+    def __init__(self, policy: RetryPolicy, idempotent: bool, deadline: Optional[Deadline] = None):
+        self.policy = policy
+        self.idempotent = idempotent
+        self.deadline = deadline
+        self.attempts = 0
+        self.statusRetries = {}
+        self.started = time.monotonic()
+
+    def remaining(self) -> Optional[float]:
+        '''Returns the seconds left before the policy or call deadline, or None without a deadline.'''
+        remaining = None
+        if self.policy.deadline is not None:
+            remaining = self.policy.deadline - (time.monotonic() - self.started)
+        if self.deadline is not None:
+            left = self.deadline.remaining()
+            remaining = left if remaining is None else min(remaining, left)
+        return remaining
+
+    def timeout(self, timeout):
+        '''Returns the request timeout of the next attempt, shortened to fit in the deadline.'''
+        if self.deadline is not None:
+            # Raises YouTubeDeadlineExceeded when the call has no time left for another attempt.
+            self.deadline.timeout(None)
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if timeout is None or isinstance(timeout, httpx.Timeout):
+            return timeout if timeout is not None else max(remaining, 0.001)
+        return max(min(timeout, remaining), 0.001)
+
+    def _fits(self, wait: float) -> Optional[float]:
+        if self.attempts >= self.policy.maxAttempts:
+            return None
+        remaining = self.remaining()
+        if remaining is not None and wait >= remaining:
+            return None
+        return wait
+
+    def onResponse(self, response: httpx.Response) -> Optional[float]:
+        '''Returns the seconds to wait before retrying after `response`, or None to keep it.'''
+        status = response.status_code
+        allowed = self.policy.statusRules.get(status)
+        if not allowed or self.statusRetries.get(status, 0) >= allowed:
+            return None
+        # A 429 means the request was refused before being processed, any other status may not.
+        if status != 429 and not self.idempotent:
+            return None
+        wait = self.policy.backoff(self.attempts)
+        if self.policy.respectRetryAfter:
+            retryAfter = self.policy.retryAfter(response)
+            if retryAfter is not None:
+                if retryAfter > self.policy.maxRetryAfter:
+                    return None
+                wait = retryAfter
+        wait = self._fits(wait)
+        if wait is not None:
+            self.statusRetries[status] = self.statusRetries.get(status, 0) + 1
+        return wait
+
+    def onError(self, error: Exception) -> Optional[float]:
+        '''Returns the seconds to wait before retrying after `error`, or None to raise it.'''
+        if isinstance(error, self.policy.unsentErrors):
+            pass
+        elif not (isinstance(error, self.policy.sentErrors) and self.idempotent):
+            return None
+        return self._fits(self.policy.backoff(self.attempts))
@@ -1,11 +1,13 @@
 import copy
 from typing import Union, Optional
-from urllib.parse import urlencode
 
-from youtubesearchpython.core.requests import RequestCore
+from youtubesearchpython.core.requests import RequestCore, innertubeUrl
+from youtubesearchpython.core.session import Session
 from youtubesearchpython.core.componenthandler import ComponentHandler
 from youtubesearchpython.core.constants import *
-from youtubesearchpython.core.exceptions import YouTubeRequestError, YouTubeParseError
+from youtubesearchpython.core.exceptions import YouTubeRequestError, YouTubeParseError, YouTubeSearchError
+from youtubesearchpython.core.jsonbackend import dumps, loads
+from youtubesearchpython.core.results import searchResults
 
 import json
 import httpx
@@ -16,8 +18,8 @@ class SearchCore(RequestCore, ComponentHandler):
     responseSource = None
     resultComponents = []
 
-    def __init__(self, query: str, limit: int, language: str, region: str, searchPreferences: str, timeout: Optional[int]):
-        super().__init__(timeout=timeout)
+    def __init__(self, query: str, limit: int, language: str, region: str, searchPreferences: str, timeout: Optional[int], session: Optional[Session] = None):
+        super().__init__(timeout=timeout, session=session)
         self.query = query
         self.limit = limit
         self.language = language
@@ -42,9 +44,8 @@ class SearchCore(RequestCore, ComponentHandler):
             requestBody['params'] = self.searchPreferences
         if self.continuationKey:
             requestBody['continuation'] = self.continuationKey
-        self.url = 'https://www.youtube.com/youtubei/v1/search' + '?' + urlencode({
-            'key': searchKey,
-        })
+        self.url = innertubeUrl('search')
+        self.fieldMask = searchFieldMask
         self.data = requestBody
 
     def _makeRequest(self) -> None:
@@ -53,11 +54,13 @@ class SearchCore(RequestCore, ComponentHandler):
             request = self.syncPostRequest()
             if request.status_code != 200:
                 raise YouTubeRequestError(f'Request failed with status code {request.status_code}. URL: {self.url}')
-            self.response = request.text
+            self.response = request.content
         except httpx.RequestError as e:
             raise YouTubeRequestError(f'Failed to make request to {self.url}: {str(e)}')
         except httpx.HTTPStatusError as e:
             raise YouTubeRequestError(f'HTTP error {e.response.status_code} for {self.url}: {str(e)}')
+        except YouTubeSearchError:
+            raise
         except Exception as e:
             raise YouTubeRequestError(f'Unexpected error making request: {str(e)}')
 
@@ -67,20 +70,23 @@ class SearchCore(RequestCore, ComponentHandler):
             request = await self.asyncPostRequest()
             if request.status_code != 200:
                 raise YouTubeRequestError(f'Request failed with status code {request.status_code}. URL: {self.url}')
-            self.response = request.text
+            self.response = request.content
         except httpx.RequestError as e:
             raise YouTubeRequestError(f'Failed to make request to {self.url}: {str(e)}')
         except httpx.HTTPStatusError as e:
             raise YouTubeRequestError(f'HTTP error {e.response.status_code} for {self.url}: {str(e)}')
+        except YouTubeSearchError:
+            raise
         except Exception as e:
             raise YouTubeRequestError(f'Unexpected error making request: {str(e)}')
 
     def _parseSource(self) -> None:
         try:
+            response = loads(self.response)
             if not self.continuationKey:
-                responseContent = self._getValue(json.loads(self.response), contentPath)
+                responseContent = self._getValue(response, contentPath)
             else:
-                responseContent = self._getValue(json.loads(self.response), continuationContentPath)
+                responseContent = self._getValue(response, continuationContentPath)
             if responseContent:
                 for element in responseContent:
                     if itemSectionKey in element.keys():
@@ -88,12 +94,14 @@ class SearchCore(RequestCore, ComponentHandler):
                     if continuationItemKey in element.keys():
                         self.continuationKey = self._getValue(element, continuationKeyPath)
             else:
-                self.responseSource = self._getValue(json.loads(self.response), fallbackContentPath)
+                self.responseSource = self._getValue(response, fallbackContentPath)
                 self.continuationKey = self._getValue(self.responseSource[-1], continuationKeyPath)
         except json.JSONDecodeError as e:
             raise YouTubeParseError(f'Failed to parse JSON response: {str(e)}')
         except KeyError as e:
             raise YouTubeParseError(f'Missing expected key in response: {str(e)}')
+        except YouTubeSearchError:
+            raise
         except Exception as e:
             raise YouTubeParseError(f'Failed to parse YouTube response: {str(e)}')
 
@@ -104,12 +112,15 @@ class SearchCore(RequestCore, ComponentHandler):
             mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
 
         Returns:
-            Union[str, dict]: Returns JSON or dictionary.
+            Union[str, dict]: Returns JSON or dictionary, whose results are `VideoResult`, `ChannelResult` &
+            `PlaylistResult` objects with `ResultMode.objects`.
         '''
-        if mode == ResultMode.json:
-            return json.dumps({'result': self.resultComponents}, indent=4)
+        if mode in (ResultMode.json, ResultMode.compactJson):
+            return dumps({'result': self.resultComponents}, mode)
         elif mode == ResultMode.dict:
             return {'result': self.resultComponents}
+        elif mode == ResultMode.objects:
+            return {'result': searchResults(self.resultComponents)}
 
     def _next(self) -> bool:
         '''Gets the subsequent search result. Call result
@@ -131,16 +142,19 @@ class SearchCore(RequestCore, ComponentHandler):
         else:
             return False
 
-    async def _nextAsync(self) -> dict:
+    async def _nextAsync(self, mode: int = ResultMode.dict) -> Union[str, dict]:
+        '''Gets the subsequent search result, and returns it like `result`.
+
+        Args:
+            mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
+        '''
         self.response = None
         self.responseSource = None
         self.resultComponents = []
         await self._makeAsyncRequest()
         self._parseSource()
         self._getComponents(*self.searchMode)
-        return {
-            'result': self.resultComponents,
-        }
+        return self.result(mode)
 
     def _getComponents(self, findVideos: bool, findChannels: bool, findPlaylists: bool) -> None:
         self.resultComponents = []
@@ -152,9 +166,9 @@ class SearchCore(RequestCore, ComponentHandler):
             if playlistElementKey in element.keys() and findPlaylists:
                 self.resultComponents.append(self._getPlaylistComponent(element))
             if shelfElementKey in element.keys() and findVideos:
-                for shelfElement in self._getShelfComponent(element)['elements']:
-                    self.resultComponents.append(
-                        self._getVideoComponent(shelfElement, shelfTitle=self._getShelfComponent(element)['title']))
+                shelf = self._getShelfComponent(element)
+                for shelfElement in shelf['elements']:
+                    self.resultComponents.append(self._getVideoComponent(shelfElement, shelfTitle=shelf['title']))
             if richItemKey in element.keys() and findVideos:
                 richItemElement = self._getValue(element, [richItemKey, 'content'])
                 ''' Initial fallback handling for VideosSearch '''
@@ -0,0 +1,516 @@
+import asyncio
+import atexit
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from youtubesearchpython.core.constants import userAgent
+from youtubesearchpython.core.breaker import CircuitBreaker
+from youtubesearchpython.core.cache import LookupCache, NegativeCache, ResponseCache
+from youtubesearchpython.core.concurrency import AdaptiveConcurrency
+from youtubesearchpython.core.deadline import Deadline
+from youtubesearchpython.core.exceptions import YouTubeDeadlineExceeded, YouTubeSearchError
+from youtubesearchpython.core.hedging import HedgingPolicy
+from youtubesearchpython.core.ratelimit import RateLimiter
+from youtubesearchpython.core.retry import RetryPolicy, RetryState
+from youtubesearchpython.core.singleflight import SingleFlight
+from youtubesearchpython.core.transport import Transport, HttpxTransport, RecordReplayTransport
+
+isH2installed = False
+
+try:
+    import h2
+
+    isH2installed = True
+except ImportError:
+    isH2installed = False
+
+isBrotliInstalled = False
+
+try:
+    import brotli
+
+    isBrotliInstalled = True
+except ImportError:
+    try:
+        import brotlicffi
+
+        isBrotliInstalled = True
+    except ImportError:
+        isBrotliInstalled = False
+
+isZstdInstalled = False
+
+try:
+    import zstandard
+
+    isZstdInstalled = True
+except ImportError:
+    isZstdInstalled = False
+
+
+def availableEncodings() -> List[str]:
+    '''Returns the content encodings that can be decoded with the installed packages, most compact first.'''
+    encodings = []
+    if isZstdInstalled:
+        encodings.append('zstd')
+    if isBrotliInstalled:
+        encodings.append('br')
+    encodings.extend(['gzip', 'deflate'])
+    return encodings
+
+
+class Session:
+    '''Pooled HTTP session shared by the core classes.
+
+    Keeps a single keep-alive `httpx.Client` for synchronous calls and one `httpx.AsyncClient`
+    per running event loop for asynchronous calls, so that consecutive requests to YouTube reuse
+    already established TCP & TLS connections instead of opening new ones every time. Requests can
+    be sent through another backend instead, see `transport`.
+
+    A process-wide session is created on first use (see `getDefaultSession`). A separate session
+    can be passed to any class through its `session` argument, or installed globally with
+    `setDefaultSession`.
+
+    Args:
+        maxConnections (int, optional): Maximum number of concurrent connections. Defaults to 100.
+        maxKeepAliveConnections (int, optional): Maximum number of idle connections kept open. Defaults to 20.
+        keepAliveExpiry (float, optional): Seconds after which an idle connection is closed. Defaults to 30.
+        http2 (bool, optional): Negotiates HTTP/2, so that concurrent requests to the same host are multiplexed
+            over a few connections instead of opening one socket each. Requires the `h2` package. Defaults to False.
+        http1 (bool, optional): Allows HTTP/1.1. Set to False together with `http2` to speak HTTP/2 with prior
+            knowledge, e.g. to a local cleartext server. Defaults to True.
+        hostOverrides (dict, optional): Maps an origin such as 'https://www.youtube.com' to another origin
+            every request for it is sent to instead, e.g. a local stub server. Defaults to None.
+        encodings (list, optional): Content encodings offered in `Accept-Encoding`, e.g. ['br', 'gzip']. 'br' needs
+            the `brotli` package and 'zstd' the `zstandard` package. An empty list asks for uncompressed responses.
+            Defaults to every encoding that can be decoded (see `availableEncodings`).
+        transport (Transport, optional): Backend the requests are sent through, e.g. a `RecordReplayTransport`.
+            The connection options above apply to the default `HttpxTransport`, and to the live transport a
+            `RecordReplayTransport` created without one records through. Defaults to None.
+        retry (RetryPolicy, optional): Decides which failed requests are sent again & how long to wait in between,
+            e.g. after 429 or 503 responses & connection resets. `RetryPolicy(maxAttempts = 1)` disables retries.
+            Defaults to `RetryPolicy()`.
+        rateLimiter (RateLimiter, optional): Token buckets every request, retries included, waits on before being
+            sent, keyed per endpoint. Can be shared between sessions. Defaults to None.
+        circuitBreaker (CircuitBreaker, optional): Fails requests to an endpoint right away with
+            YouTubeCircuitOpenError while it keeps failing, instead of waiting out their timeouts. Defaults to None.
+        concurrency (AdaptiveConcurrency, optional): Limits concurrent requests per endpoint, lowering the limit
+            as latency rises & raising it back as it recovers. Defaults to None.
+        hedging (HedgingPolicy, optional): Sends a duplicate of asynchronous idempotent requests that take longer
+            than most recent ones, and keeps the first response. Defaults to None.
+        singleFlight (SingleFlight, optional): Sends identical idempotent requests in flight at the same time only
+            once, and shares the response between their callers. Defaults to None.
+        cache (ResponseCache, optional): Keeps successful responses for a time to live per endpoint, and serves
+            identical requests from it. Stale responses it allows are served at once & refreshed in the
+            background, from a worker thread or the running event loop. Defaults to None.
+        negativeCache (NegativeCache, optional): Remembers videos known to be unavailable, or to have no
+            transcript, comments or streams, so that looking them up again makes no request. Defaults to None.
+        lookupCache (LookupCache, optional): Remembers the publish times found by searching for videos, and the
+            thumbnails found to exist. Defaults to a new `LookupCache`.
+
+    Every response gets `compressedBytes` (bytes received on the wire) and `decodedBytes` (bytes after
+    decompression) attributes, and the totals per endpoint are kept in `transferStats`.
+
+    Examples:
+        >>> with Session(maxConnections = 10) as session:
+        >>>     search = VideosSearch('NoCopyrightSounds', session = session)
+        >>>     video = Video.get('E07s5ZYygMg', session = session)
+    '''
+
+    def __init__(self, maxConnections: int = 100, maxKeepAliveConnections: int = 20, keepAliveExpiry: float = 30.0,
+                 http2: bool = False, http1: bool = True, hostOverrides: Optional[Dict[str, str]] = None,
+                 encodings: Optional[List[str]] = None, transport: Optional[Transport] = None,
+                 retry: Optional[RetryPolicy] = None, rateLimiter: Optional[RateLimiter] = None,
+                 circuitBreaker: Optional[CircuitBreaker] = None, concurrency: Optional[AdaptiveConcurrency] = None,
+                 hedging: Optional[HedgingPolicy] = None, singleFlight: Optional[SingleFlight] = None,
+                 cache: Optional[ResponseCache] = None, negativeCache: Optional[NegativeCache] = None,
+                 lookupCache: Optional[LookupCache] = None):
+        if http2 and not isH2installed:
+            raise YouTubeSearchError('h2 is not installed. To use HTTP/2 with youtube-search-python, install it with `pip install httpx[http2]`.')
+        if encodings is None:
+            encodings = availableEncodings()
+        for encoding in encodings:
+            if encoding == 'br' and not isBrotliInstalled:
+                raise YouTubeSearchError('brotli is not installed. To use brotli compression, install it with `pip install httpx[brotli]`.')
+            if encoding == 'zstd' and not isZstdInstalled:
+                raise YouTubeSearchError('zstandard is not installed. To use zstd compression, install it with `pip install httpx[zstd]`.')
+            if encoding not in ('zstd', 'br', 'gzip', 'deflate', 'identity'):
+                raise YouTubeSearchError(f'Unsupported content encoding: {encoding}')
+        self.encodings = list(encodings)
+        self.transferStats = {}
+        self.limits = httpx.Limits(
+            max_connections=maxConnections,
+            max_keepalive_connections=maxKeepAliveConnections,
+            keepalive_expiry=keepAliveExpiry,
+        )
+        self.http2 = http2
+        self.http1 = http1
+        self.hostOverrides = hostOverrides
+        self.closed = False
+        self._lock = threading.Lock()
+        if transport is None:
+            transport = HttpxTransport(hostOverrides=self.hostOverrides, **self._clientOptions())
+        elif isinstance(transport, RecordReplayTransport) and transport.transport is None:
+            # Records through a live transport configured like this session.
+            transport.transport = HttpxTransport(hostOverrides=self.hostOverrides, **self._clientOptions())
+        self.transport = transport
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rateLimiter = rateLimiter
+        self.circuitBreaker = circuitBreaker
+        self.concurrency = concurrency
+        self.hedging = hedging
+        self.singleFlight = singleFlight
+        self.cache = cache
+        self.negativeCache = negativeCache
+        self.lookupCache = lookupCache if lookupCache is not None else LookupCache()
+        self._executor = None
+        self._lookups = None
+        self._refreshTasks = set()
+
+    def _clientOptions(self) -> dict:
+        # Cookies are never persisted between requests, every request is sent as a new visitor.
+        return {
+            'limits': self.limits,
+            'http1': self.http1,
+            'http2': self.http2,
+            'headers': {
+                'User-Agent': userAgent,
+                'Accept-Encoding': ', '.join(self.encodings) if self.encodings else 'identity',
+            },
+            'cookies': CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        }
+
+    @property
+    def client(self) -> httpx.Client:
+        '''Returns the pooled synchronous client of the transport, creating it on first use. Raises
+        YouTubeSearchError for a transport that does not send requests with httpx.
+        '''
+        return self.transport.client
+
+    @property
+    def asyncClient(self) -> httpx.AsyncClient:
+        '''Returns the pooled asynchronous client of the transport bound to the running event loop. Raises
+        YouTubeSearchError for a transport that does not send requests with httpx.
+        '''
+        return self.transport.asyncClient
+
+    def request(self, method: str, url: str, idempotent: Optional[bool] = None, deadline: Optional[Deadline] = None,
+                **kwargs) -> httpx.Response:
+        '''Sends a request through the transport synchronously, retrying it as allowed by `retry`.
+        `idempotent` marks a request that is safe to send twice (and to share with `singleFlight`), regardless of
+        its method, and `deadline` bounds all of its attempts by the time budget of the calling operation.
+        '''
+        self.closed = False
+        cacheKey = self._cacheKey(method, url, idempotent, kwargs)
+        if cacheKey is not None:
+            response = self.cache.get(cacheKey)
+            if response is not None:
+                if response.stale and self.cache.startRefresh(cacheKey):
+                    try:
+                        self._refreshExecutor().submit(self._refresh, cacheKey, method, url, idempotent, kwargs)
+                    except RuntimeError:
+                        # The session was closed meanwhile, the stale response is still served.
+                        self.cache.endRefresh(cacheKey)
+                return response
+        if self.singleFlight is not None and self.retry.isIdempotent(method, idempotent):
+            key = self.singleFlight.key(method, url, **kwargs)
+            response = self.singleFlight.do(key, lambda: self._request(method, url, idempotent, deadline, **kwargs), deadline)
+        else:
+            response = self._request(method, url, idempotent, deadline, **kwargs)
+        if cacheKey is not None:
+            self.cache.put(cacheKey, method, url, response)
+        return response
+
+    def _request(self, method: str, url: str, idempotent: Optional[bool], deadline: Optional[Deadline],
+                 **kwargs) -> httpx.Response:
+        state = self.retry.start(method, idempotent, deadline)
+        while True:
+            state.attempts += 1
+            if self.rateLimiter is not None:
+                self.rateLimiter.wait(url, deadline)
+            try:
+                response = self._send(method, url, **self._attemptOptions(state, kwargs))
+            except httpx.TransportError as error:
+                wait = state.onError(error)
+                if wait is None:
+                    self._raiseExceeded(error, deadline)
+                    raise
+                time.sleep(wait)
+                continue
+            self._recordTransfer(url, response)
+            wait = state.onResponse(response)
+            if wait is None:
+                response.attempts = state.attempts
+                return response
+            time.sleep(wait)
+
+    async def asyncRequest(self, method: str, url: str, idempotent: Optional[bool] = None, deadline: Optional[Deadline] = None,
+                           **kwargs) -> httpx.Response:
+        '''Sends a request through the transport from the running event loop, retrying it as allowed by `retry`.
+        `idempotent` marks a request that is safe to send twice (and to share with `singleFlight`), regardless of
+        its method, and `deadline` bounds all of its attempts by the time budget of the calling operation.
+        '''
+        self.closed = False
+        cacheKey = self._cacheKey(method, url, idempotent, kwargs)
+        if cacheKey is not None:
+            response = self.cache.get(cacheKey)
+            if response is not None:
+                if response.stale and self.cache.startRefresh(cacheKey):
+                    task = asyncio.ensure_future(self._asyncRefresh(cacheKey, method, url, idempotent, kwargs))
+                    # Keeps a reference to the task until it is done, so it is not garbage collected midway.
+                    self._refreshTasks.add(task)
+                    task.add_done_callback(self._refreshTasks.discard)
+                return response
+        if self.singleFlight is not None and self.retry.isIdempotent(method, idempotent):
+            key = self.singleFlight.key(method, url, **kwargs)
+            response = await self.singleFlight.asyncDo(key, lambda: self._asyncRequest(method, url, idempotent, deadline, **kwargs), deadline)
+        else:
+            response = await self._asyncRequest(method, url, idempotent, deadline, **kwargs)
+        if cacheKey is not None:
+            self.cache.put(cacheKey, method, url, response)
+        return response
+
+    def _refreshExecutor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='youtubesearchpython-refresh')
+            return self._executor
+
+    def _lookupExecutor(self) -> ThreadPoolExecutor:
+        # Threads the search lookups of `Video.get` run on, bounded for every video looked up at the same time.
+        with self._lock:
+            if self._lookups is None:
+                self._lookups = ThreadPoolExecutor(max_workers=8, thread_name_prefix='youtubesearchpython-lookup')
+            return self._lookups
+
+    def _refresh(self, cacheKey: str, method: str, url: str, idempotent: Optional[bool], kwargs: dict) -> None:
+        # Refreshes a stale cached response in the background. A failure keeps serving the stale one.
+        try:
+            self.cache.put(cacheKey, method, url, self._request(method, url, idempotent, None, **kwargs))
+        except Exception:
+            pass
+        finally:
+            self.cache.endRefresh(cacheKey)
+
+    async def _asyncRefresh(self, cacheKey: str, method: str, url: str, idempotent: Optional[bool], kwargs: dict) -> None:
+        try:
+            self.cache.put(cacheKey, method, url, await self._asyncRequest(method, url, idempotent, None, **kwargs))
+        except Exception:
+            pass
+        finally:
+            self.cache.endRefresh(cacheKey)
+
+    def _cacheKey(self, method: str, url: str, idempotent: Optional[bool], kwargs: dict) -> Optional[str]:
+        # Only reads are cached, a request with side effects always reaches YouTube.
+        if self.cache is None or not self.retry.isIdempotent(method, idempotent):
+            return None
+        return self.cache.key(method, url, **kwargs)
+
+    async def _asyncRequest(self, method: str, url: str, idempotent: Optional[bool], deadline: Optional[Deadline],
+                            **kwargs) -> httpx.Response:
+        state = self.retry.start(method, idempotent, deadline)
+        while True:
+            state.attempts += 1
+            if self.rateLimiter is not None:
+                await self.rateLimiter.asyncWait(url, deadline)
+            try:
+                if self.hedging is not None and state.idempotent:
+                    response = await self._asyncHedgedSend(method, url, **self._attemptOptions(state, kwargs))
+                else:
+                    response = await self._asyncSend(method, url, **self._attemptOptions(state, kwargs))
+            except httpx.TransportError as error:
+                wait = state.onError(error)
+                if wait is None:
+                    self._raiseExceeded(error, deadline)
+                    raise
+                await asyncio.sleep(wait)
+                continue
+            self._recordTransfer(url, response)
+            wait = state.onResponse(response)
+            if wait is None:
+                response.attempts = state.attempts
+                return response
+            await asyncio.sleep(wait)
+
+    @staticmethod
+    def _raiseExceeded(error: httpx.TransportError, deadline: Optional[Deadline]) -> None:
+        # A request timing out because its call ran out of time reports the deadline, not the socket.
+        if deadline is not None and deadline.expired and isinstance(error, httpx.TimeoutException):
+            raise YouTubeDeadlineExceeded(f'Deadline of {deadline.seconds} s exceeded.') from error
+
+    def _admit(self, url: str) -> tuple:
+        circuit = self.circuitBreaker.circuit(url) if self.circuitBreaker is not None else None
+        probe = circuit.acquire() if circuit is not None else False
+        gate = self.concurrency.gate(url) if self.concurrency is not None else None
+        return circuit, probe, gate
+
+    def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        circuit, probe, gate = self._admit(url)
+        start, statusCode, completed = None, None, False
+        try:
+            if gate is not None:
+                gate.acquire()
+            start = time.monotonic()
+            response = self.transport.request(method, url, **kwargs)
+            statusCode, completed = response.status_code, True
+            return response
+        except httpx.TransportError:
+            completed = True
+            raise
+        finally:
+            self._recordOutcome(circuit, probe, gate, start, statusCode, completed)
+
+    async def _asyncSend(self, method: str, url: str, **kwargs) -> httpx.Response:
+        circuit, probe, gate = self._admit(url)
+        start, statusCode, completed = None, None, False
+        try:
+            if gate is not None:
+                await gate.asyncAcquire()
+            start = time.monotonic()
+            response = await self.transport.asyncRequest(method, url, **kwargs)
+            statusCode, completed = response.status_code, True
+            return response
+        except httpx.TransportError:
+            completed = True
+            raise
+        finally:
+            self._recordOutcome(circuit, probe, gate, start, statusCode, completed)
+
+    async def _asyncHedgedSend(self, method: str, url: str, **kwargs) -> httpx.Response:
+        hedging = self.hedging
+        delay = hedging.delay(url)
+        start = time.monotonic()
+        primary = asyncio.ensure_future(self._asyncSend(method, url, **kwargs))
+        tasks = {primary}
+        try:
+            if delay is not None:
+                await asyncio.wait(tasks, timeout=delay)
+                if not primary.done() and hedging.allow():
+                    tasks.add(asyncio.ensure_future(self._asyncSend(method, url, **kwargs)))
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # The first usable response wins, an error only does once every request has failed.
+                for task in done:
+                    if task.exception() is None and task.result().status_code < 500:
+                        return self._hedgeWinner(task, primary, url, start)
+                if not pending:
+                    winner = next((task for task in tasks if task.exception() is None), primary)
+                    return self._hedgeWinner(winner, primary, url, start)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _hedgeWinner(self, task: asyncio.Future, primary: asyncio.Future, url: str, start: float) -> httpx.Response:
+        response = task.result()
+        self.hedging.record(url, time.monotonic() - start)
+        response.hedged = task is not primary
+        if response.hedged:
+            self.hedging.won()
+        return response
+
+    @staticmethod
+    def _recordOutcome(circuit, probe: bool, gate, start: Optional[float], statusCode: Optional[int], completed: bool) -> None:
+        # Requests that were cancelled or never sent say nothing about the health of the endpoint.
+        failed = CircuitBreaker.isFailure(statusCode)
+        if circuit is not None:
+            if completed:
+                circuit.record(failed, probe)
+            else:
+                circuit.release(probe)
+        if gate is not None and start is not None:
+            gate.release(time.monotonic() - start if completed else None, failed)
+
+    @staticmethod
+    def _attemptOptions(state: RetryState, kwargs: dict) -> dict:
+        if 'timeout' not in kwargs and state.remaining() is None:
+            return kwargs
+        return dict(kwargs, timeout=state.timeout(kwargs.get('timeout')))
+
+    def _recordTransfer(self, url: str, response: httpx.Response) -> None:
+        response.compressedBytes = response.num_bytes_downloaded
+        response.decodedBytes = len(response.content)
+        endpoint = urlparse(url).path
+        with self._lock:
+            stats = self.transferStats.setdefault(endpoint, {'requests': 0, 'compressedBytes': 0, 'decodedBytes': 0})
+            stats['requests'] += 1
+            stats['compressedBytes'] += response.compressedBytes
+            stats['decodedBytes'] += response.decodedBytes
+
+    def resetTransferStats(self) -> None:
+        '''Clears the per endpoint byte counters in `transferStats`.'''
+        with self._lock:
+            self.transferStats = {}
+
+    def close(self) -> None:
+        '''Closes the transport and the cache's connection, if any. Asynchronous clients should be closed with
+        `aclose` from their own event loop, when possible. A closed session reconnects on its next request.
+        '''
+        self.transport.close()
+        self._shutdownExecutors()
+        self._closeCache()
+        self.closed = True
+
+    def _closeCache(self) -> None:
+        # A cache holding a connection, e.g. `SQLiteCache`, opens it again on its next use.
+        close = getattr(self.cache, 'close', None)
+        if close is not None:
+            close()
+
+    def _shutdownExecutors(self) -> None:
+        with self._lock:
+            executors, self._executor, self._lookups = (self._executor, self._lookups), None, None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    async def aclose(self) -> None:
+        '''Closes the transport from the running event loop.'''
+        await self.transport.aclose()
+        self._shutdownExecutors()
+        self._closeCache()
+        self.closed = True
+
+    def __enter__(self) -> 'Session':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    async def __aenter__(self) -> 'Session':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+
+_defaultSession = None
+_defaultSessionLock = threading.Lock()
+
+
+def getDefaultSession() -> Session:
+    '''Returns the process-wide session, creating it on first use.'''
+    global _defaultSession
+    if _defaultSession is None:
+        with _defaultSessionLock:
+            if _defaultSession is None:
+                _defaultSession = Session()
+                atexit.register(_defaultSession.close)
+    return _defaultSession
+
+
+def setDefaultSession(session: Session) -> None:
+    '''Replaces the process-wide session used by classes created without a `session` argument.
+    The previous session is left open, closing it is up to the caller.
+    '''
+    global _defaultSession
+    with _defaultSessionLock:
+        _defaultSession = session
@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import weakref
+from concurrent.futures import CancelledError, Future, TimeoutError as FutureTimeoutError
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+from youtubesearchpython.core.deadline import Deadline
+from youtubesearchpython.core.exceptions import YouTubeDeadlineExceeded
+from youtubesearchpython.core.transport import RecordReplayTransport
+
+
+class SingleFlight:
+    '''Coalesces identical requests in flight at the same time into a single one.
+
+    Requests are keyed by their method, endpoint, field mask & canonical JSON body (see
+    `RecordReplayTransport.fingerprint`). While a request is being sent, every identical request waits for
+    it instead of being sent too, and gets the same response, or the same error. Threads share requests
+    with each other, and coroutines with the others running on the same event loop. Only idempotent requests
+    are coalesced, retries included: a request is sent again only once the previous one has finished.
+
+    Only the errors of the request itself are shared. When the caller who sent it runs out of time or is
+    cancelled, the callers still waiting send it again themselves.
+
+    A caller stops waiting when its own `deadline` runs out, without cancelling the request for the others.
+    An asynchronous request is only cancelled once no coroutine is waiting for it any more.
+
+    Examples:
+        >>> session = Session(singleFlight = SingleFlight())
+        >>> videos = await asyncio.gather(*[Video.get('E07s5ZYygMg', session = session) for _ in range(10)])
+        >>> session.singleFlight.coalesced
+        9
+    '''
+
+    def __init__(self):
+        self.calls = {}
+        self.asyncCalls = weakref.WeakKeyDictionary()
+        # Requests actually sent, and duplicates served by one of them.
+        self.requests = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(method: str, url: str, **kwargs) -> str:
+        '''Returns the key identical requests share.'''
+        return RecordReplayTransport.fingerprint(method, url, **kwargs)
+
+    def do(self, key: str, function: Callable[[], httpx.Response], deadline: Optional[Deadline] = None) -> httpx.Response:
+        '''Calls `function` unless an identical request is in flight, and returns its response.'''
+        while True:
+            with self._lock:
+                future = self.calls.get(key)
+                leader = future is None
+                if leader:
+                    future = self.calls[key] = Future()
+                    self.requests += 1
+                else:
+                    self.coalesced += 1
+            if leader:
+                try:
+                    future.set_result(function())
+                except BaseException as error:
+                    future.set_exception(error)
+                finally:
+                    with self._lock:
+                        self.calls.pop(key, None)
+            try:
+                return future.result(timeout=deadline.remaining() if deadline is not None else None)
+            except FutureTimeoutError:
+                raise YouTubeDeadlineExceeded(f'Deadline of {deadline.seconds} s exceeded.') from None
+            except BaseException as error:
+                if leader or not self._isCallerError(error):
+                    raise
+
+    async def asyncDo(self, key: str, function: Callable[[], Awaitable[httpx.Response]],
+                      deadline: Optional[Deadline] = None) -> httpx.Response:
+        '''Awaits `function` unless an identical request is in flight on the running event loop, and returns its
+        response.
+        '''
+        loop = asyncio.get_running_loop()
+        calls = self.asyncCalls.setdefault(loop, {})
+        while True:
+            call = calls.get(key)
+            leader = call is None
+            if leader:
+                task = asyncio.ensure_future(function())
+                call = calls[key] = [task, 0]
+                task.add_done_callback(lambda _, call=call: calls.pop(key, None) if calls.get(key) is call else None)
+                self.requests += 1
+            else:
+                self.coalesced += 1
+            task = call[0]
+            call[1] += 1
+            try:
+                return await asyncio.wait_for(asyncio.shield(task), deadline.remaining() if deadline is not None else None)
+            except asyncio.TimeoutError:
+                raise YouTubeDeadlineExceeded(f'Deadline of {deadline.seconds} s exceeded.') from None
+            except asyncio.CancelledError:
+                # Only the shared request being cancelled is retried, not this caller being cancelled.
+                if leader or not task.cancelled():
+                    raise
+            except YouTubeDeadlineExceeded:
+                if leader:
+                    raise
+            finally:
+                call[1] -= 1
+                # Nobody is left waiting for a request that was given up on.
+                if call[1] == 0 and not task.done():
+                    task.cancel()
+                    if calls.get(key) is call:
+                        del calls[key]
+
+    @staticmethod
+    def _isCallerError(error: BaseException) -> bool:
+        # The deadline or cancellation of the caller who sent the request says nothing about the request of
+        # the others, who send it again themselves.
+        if isinstance(error, (YouTubeDeadlineExceeded, CancelledError, asyncio.CancelledError)):
+            return True
+        return not isinstance(error, Exception)
@@ -3,11 +3,14 @@ import urllib.request
 import urllib.parse
 
 import re
+from typing import Optional, Union
 
 from youtubesearchpython.core.constants import ResultMode
 from youtubesearchpython.core.video import VideoCore
 from youtubesearchpython.core.componenthandler import getValue
 from youtubesearchpython.core.requests import RequestCore
+from youtubesearchpython.core.session import Session
+from youtubesearchpython.core.deadline import Deadline
 from youtubesearchpython.core.exceptions import YouTubeRequestError, YouTubeParseError, YouTubeSearchError
 
 isYtDLPinstalled = False
@@ -23,9 +26,9 @@ except ImportError:
 
 
 class StreamURLFetcherCore(RequestCore):
-    def __init__(self):
+    def __init__(self, session: Optional[Session] = None):
         if isYtDLPinstalled:
-            super().__init__()
+            super().__init__(session=session)
             self._js_url = None
             self._js = None
             self.ytie = YoutubeIE()
@@ -34,26 +37,35 @@ class StreamURLFetcherCore(RequestCore):
         else:
             raise YouTubeSearchError('yt-dlp is not installed. To use this functionality of youtube-search-python, yt-dlp must be installed.')
 
-    def _getDecipheredURLs(self, videoFormats: dict, formatId: int = None) -> None:
+    def _getDecipheredURLs(self, videoFormats: dict, formatId: int = None, deadline: Union[Deadline, float, None] = None) -> None:
         self._streams = []
+        # The player refetches & iframe_api request below all share the deadline of the call.
+        self.deadline = Deadline.of(deadline)
 
         self.video_id = videoFormats["id"]
         if not videoFormats["streamingData"]:
+            # Raises again the error of a video no stream was found for recently, without refetching it.
+            self._knownMissing(self.video_id, 'streams')
             # Try ANDROID client first (provides direct URLs)
             try:
-                vc = VideoCore(self.video_id, None, ResultMode.dict, None, False, overridedClient="ANDROID")
+                vc = VideoCore(self.video_id, "getFormats", ResultMode.dict, None, False, overridedClient="ANDROID", session=self.session, deadline=self.deadline)
                 vc.sync_create()
                 videoFormats = vc.result
             except (YouTubeRequestError, YouTubeParseError, Exception):
-                # Fallback to TV_EMBED if ANDROID fails
-                try:
-                    vc = VideoCore(self.video_id, None, ResultMode.dict, None, False, overridedClient="TV_EMBED")
-                    vc.sync_create()
-                    videoFormats = vc.result
-                except Exception:
-                    pass
+                # Fallback to TV_EMBED if ANDROID fails, when there is still time for it
+                if self._allows('TV_EMBED'):
+                    try:
+                        vc = VideoCore(self.video_id, "getFormats", ResultMode.dict, None, False, overridedClient="TV_EMBED", session=self.session, deadline=self.deadline)
+                        vc.sync_create()
+                        videoFormats = vc.result
+                    except Exception:
+                        pass
             if not videoFormats.get("streamingData"):
-                raise YouTubeRequestError("streamingData is not present in Video.get. This is most likely an age-restricted video")
+                error = YouTubeRequestError("streamingData is not present in Video.get. This is most likely an age-restricted video")
+                # Only remembered once every client was tried.
+                if self.deadline is None or not self.deadline.timedOut:
+                    self._rememberMissing(self.video_id, 'streams', error)
+                raise error
         
         self._streaming_data = copy.deepcopy(videoFormats["streamingData"])
         self._player_response = copy.deepcopy(videoFormats["streamingData"]["formats"])
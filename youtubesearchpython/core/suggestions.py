@@ -7,7 +7,9 @@ import httpx
 
 from youtubesearchpython.core.constants import ResultMode, userAgent
 from youtubesearchpython.core.requests import RequestCore
-from youtubesearchpython.core.exceptions import YouTubeParseError
+from youtubesearchpython.core.session import Session
+from youtubesearchpython.core.exceptions import YouTubeParseError, YouTubeSearchError
+from youtubesearchpython.core.jsonbackend import dumps, loads
 
 
 class SuggestionsCore(RequestCore):
@@ -42,8 +44,8 @@ class SuggestionsCore(RequestCore):
         }
     '''
 
-    def __init__(self, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
-        super().__init__(timeout=timeout)
+    def __init__(self, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, session: Optional[Session] = None):
+        super().__init__(timeout=timeout, session=session)
         self.language = language
         self.region = region
         self.timeout = timeout
@@ -59,8 +61,8 @@ class SuggestionsCore(RequestCore):
                 break
         if mode == ResultMode.dict:
             return {'result': searchSuggestions}
-        elif mode == ResultMode.json:
-            return json.dumps({'result': searchSuggestions}, indent=4)
+        elif mode in (ResultMode.json, ResultMode.compactJson):
+            return dumps({'result': searchSuggestions}, mode)
 
     def _get(self, query: str, mode: int = ResultMode.dict) -> Union[dict, str]:
         self.url = 'https://clients1.google.com/complete/search' + '?' + urlencode({
@@ -96,11 +98,11 @@ class SuggestionsCore(RequestCore):
             
             if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
                 json_str = self.response[start_idx + 1:end_idx]
-                self.responseSource = json.loads(json_str)
+                self.responseSource = loads(json_str)
             else:
                 # Try parsing the entire response as JSON
                 try:
-                    self.responseSource = json.loads(self.response)
+                    self.responseSource = loads(self.response)
                 except json.JSONDecodeError:
                     # Try to extract JSON array directly
                     # Look for array pattern like [["query1", ...], ["query2", ...]]
@@ -108,11 +110,13 @@ class SuggestionsCore(RequestCore):
                     # Find JSON array pattern
                     match = re.search(r'\[\[.*?\]\]', self.response, re.DOTALL)
                     if match:
-                        self.responseSource = json.loads(match.group())
+                        self.responseSource = loads(match.group())
                     else:
                         raise YouTubeParseError('Could not find JSON in response')
         except (json.JSONDecodeError, KeyError, AttributeError) as e:
             raise YouTubeParseError(f'Failed to parse YouTube suggestions response: {str(e)}')
+        except YouTubeSearchError:
+            raise
         except Exception as e:
             raise YouTubeParseError(f'Unexpected error parsing suggestions: {str(e)}')
 
@@ -0,0 +1,82 @@
+import threading
+from typing import Awaitable, Callable, List, Optional
+
+
+def standardThumbnails(videoId: str, guaranteedOnly: bool = False) -> List[dict]:
+    '''Returns the thumbnails YouTube generates for every video at fixed URLs, from the smallest to the largest.
+    The largest ones (sddefault, maxresdefault & hq720) only exist when the video was uploaded in a high enough
+    resolution, `guaranteedOnly` leaves them out.
+    '''
+    thumbnails = [
+        {"url": f"https://i.ytimg.com/vi/{videoId}/default.jpg", "width": 120, "height": 90},
+        {"url": f"https://i.ytimg.com/vi/{videoId}/mqdefault.jpg", "width": 320, "height": 180},
+        {"url": f"https://i.ytimg.com/vi/{videoId}/hqdefault.jpg", "width": 480, "height": 360},
+    ]
+    if guaranteedOnly:
+        return thumbnails
+    return thumbnails + [
+        {"url": f"https://i.ytimg.com/vi/{videoId}/sddefault.jpg", "width": 640, "height": 480},
+        {"url": f"https://i.ytimg.com/vi/{videoId}/maxresdefault.jpg", "width": 1920, "height": 1080},
+        {"url": f"https://i.ytimg.com/vi/{videoId}/hq720.jpg", "width": 1280, "height": 720},
+    ]
+
+
+class ThumbnailResolver:
+    '''Thumbnails of a video whose standard thumbnails are only probed when they are first read.
+
+    Returned as `thumbnails` by `ThumbnailMode.lazy`. Iterating over it, indexing it or taking its length probes
+    the standard thumbnails YouTube may have for the video, once, and keeps those that exist. From a coroutine,
+    `await thumbnails.asyncResolve()` probes them without blocking the event loop.
+
+    Examples:
+        >>> video = Video.get('E07s5ZYygMg', thumbnailMode = ThumbnailMode.lazy)
+        >>> video['thumbnails'].known
+        [{'url': 'https://i.ytimg.com/vi/E07s5ZYygMg/hqdefault.jpg?sqp=...', 'width': 168, 'height': 94}, ...]
+        >>> largest = video['thumbnails'][-1]  # Probes the standard thumbnails.
+    '''
+
+    def __init__(self, known: List[dict], candidates: List[dict], probe: Callable[[List[dict]], List[dict]],
+                 asyncProbe: Callable[[List[dict]], Awaitable[List[dict]]], extra: Optional[List[dict]] = None):
+        self.known = list(known)
+        self.candidates = list(candidates)
+        self.extra = list(extra) if extra else []
+        self._probe = probe
+        self._asyncProbe = asyncProbe
+        self._thumbnails = None
+        self._lock = threading.Lock()
+
+    @property
+    def resolved(self) -> bool:
+        return self._thumbnails is not None
+
+    def resolve(self) -> List[dict]:
+        '''Probes the standard thumbnails if not done yet, and returns every thumbnail that exists.'''
+        with self._lock:
+            if self._thumbnails is None:
+                self._thumbnails = self.known + self._probe(self.candidates) + self.extra
+        return self._thumbnails
+
+    async def asyncResolve(self) -> List[dict]:
+        '''Probes the standard thumbnails asynchronously if not done yet, and returns every thumbnail that exists.'''
+        if self._thumbnails is None:
+            verified = await self._asyncProbe(self.candidates)
+            if self._thumbnails is None:
+                self._thumbnails = self.known + verified + self.extra
+        return self._thumbnails
+
+    def __iter__(self):
+        return iter(self.resolve())
+
+    def __len__(self) -> int:
+        return len(self.resolve())
+
+    def __getitem__(self, index):
+        return self.resolve()[index]
+
+    def __eq__(self, other) -> bool:
+        return self.resolve() == list(other) if isinstance(other, (list, ThumbnailResolver)) else NotImplemented
+
+    def __repr__(self) -> str:
+        if self._thumbnails is not None:
+            return repr(self._thumbnails)
+        return f'ThumbnailResolver(known={len(self.known)}, candidates={len(self.candidates)})'
@@ -1,31 +1,29 @@
 import copy
 import json
-from typing import Union, List
-from urllib.parse import urlencode
+from typing import Union, List, Optional
 
 from youtubesearchpython.core.constants import *
-from youtubesearchpython.core.requests import RequestCore
+from youtubesearchpython.core.requests import RequestCore, innertubeUrl
+from youtubesearchpython.core.session import Session
 from youtubesearchpython.core.componenthandler import getValue, getVideoId
 from youtubesearchpython.core.exceptions import YouTubeRequestError
+from youtubesearchpython.core.jsonbackend import loads
 
 
 
 class TranscriptCore(RequestCore):
-    def __init__(self, videoLink: str, key: str):
-        super().__init__()
+    def __init__(self, videoLink: str, key: str, session: Optional[Session] = None):
+        super().__init__(session=session)
         self.videoLink = videoLink
         self.key = key
 
     def prepare_params_request(self):
-        self.url = 'https://www.youtube.com/youtubei/v1/next' + "?" + urlencode({
-            'key': searchKey,
-            "prettyPrint": "false"
-        })
+        self.url = innertubeUrl('next')
         self.data = copy.deepcopy(requestPayload)
         self.data["videoId"] = getVideoId(self.videoLink)
 
     def extract_continuation_key(self, r):
-        j = r.json()
+        j = loads(r.content)
         panels = getValue(j, ["engagementPanels"])
         if not panels:
             raise YouTubeRequestError("Failed to create first request - No engagementPanels is present.")
@@ -36,15 +34,21 @@ class TranscriptCore(RequestCore):
                 key = getValue(panel, ["content", "continuationItemRenderer", "continuationEndpoint", "getTranscriptEndpoint", "params"])
         if key == "" or not key:
             self.result = {"segments": [], "languages": []}
+            self._rememberMissing(getVideoId(self.videoLink), 'transcript', self.result)
             return True
         self.key = key
         return False
     
+    def is_known_missing(self) -> bool:
+        # Videos without a transcript panel are remembered by the session's negative cache.
+        result = self._knownMissing(getVideoId(self.videoLink), 'transcript')
+        if result is None:
+            return False
+        self.result = result
+        return True
+
     def prepare_transcript_request(self):
-        self.url = 'https://www.youtube.com/youtubei/v1/get_transcript' + "?" + urlencode({
-            'key': searchKey,
-            "prettyPrint": "false"
-        })
+        self.url = innertubeUrl('get_transcript')
         # clientVersion must be newer than in requestPayload
         self.data = {
             "context": {
@@ -61,7 +65,7 @@ class TranscriptCore(RequestCore):
         }
     
     def extract_transcript(self):
-        response = self.data.json()
+        response = loads(self.data.content)
         transcripts = getValue(response, ["actions", 0, "updateEngagementPanelAction", "content", "transcriptRenderer", "content", "transcriptSearchPanelRenderer", "body", "transcriptSegmentListRenderer", "initialSegments"])
         segments = []
         languages = []
@@ -94,6 +98,8 @@ class TranscriptCore(RequestCore):
 
     async def async_create(self):
         if not self.key:
+            if self.is_known_missing():
+                return
             self.prepare_params_request()
             r = await self.asyncPostRequest()
             end = self.extract_continuation_key(r)
@@ -105,6 +111,8 @@ class TranscriptCore(RequestCore):
     
     def sync_create(self):
         if not self.key:
+            if self.is_known_missing():
+                return
             self.prepare_params_request()
             r = self.syncPostRequest()
             end = self.extract_continuation_key(r)
@@ -0,0 +1,318 @@
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import warnings
+import weakref
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+from youtubesearchpython.core.exceptions import YouTubeRequestError, YouTubeSearchError
+
+
+class Transport:
+    '''Sends the requests of a `Session` over the network, or anywhere else.
+
+    Every request of the library goes through `request` or `asyncRequest` of the session's transport,
+    which receive the same arguments as `httpx.Client.request` and return an `httpx.Response`.
+    Subclasses implement both to plug in another backend.
+    '''
+
+    def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        raise NotImplementedError
+
+    async def asyncRequest(self, method: str, url: str, **kwargs) -> httpx.Response:
+        raise NotImplementedError
+
+    @property
+    def client(self) -> httpx.Client:
+        '''Returns the `httpx.Client` requests are sent with, for transports that have one.'''
+        raise YouTubeSearchError(f'{type(self).__name__} does not send requests with an httpx client')
+
+    @property
+    def asyncClient(self) -> httpx.AsyncClient:
+        '''Returns the `httpx.AsyncClient` requests are sent with from the running event loop, for transports that
+        have one.
+        '''
+        raise YouTubeSearchError(f'{type(self).__name__} does not send requests with an httpx client')
+
+    def close(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        self.close()
+
+
+class HttpxTransport(Transport):
+    '''Live transport, keeps a single keep-alive `httpx.Client` for synchronous calls and one
+    `httpx.AsyncClient` per running event loop for asynchronous calls.
+
+    Args:
+        hostOverrides (dict, optional): Maps an origin such as 'https://www.youtube.com' to another origin
+            every request for it is sent to instead, e.g. a local stub server. Defaults to None.
+        **options: Keyword arguments passed to `httpx.Client` & `httpx.AsyncClient`.
+    '''
+
+    def __init__(self, hostOverrides: Optional[Dict[str, str]] = None, **options):
+        self.hostOverrides = {origin.rstrip('/'): target.rstrip('/') for origin, target in (hostOverrides or {}).items()}
+        self.options = options
+        self._client = None
+        self._asyncClients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        '''Returns the pooled synchronous client, creating it on first use.'''
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(**self.options)
+        return self._client
+
+    @property
+    def asyncClient(self) -> httpx.AsyncClient:
+        '''Returns the pooled asynchronous client bound to the running event loop.'''
+        loop = asyncio.get_running_loop()
+        client = self._asyncClients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(**self.options)
+            self._asyncClients[loop] = client
+        return client
+
+    def resolve(self, url: str) -> str:
+        '''Returns the URL a request for `url` is actually sent to, after applying `hostOverrides`.'''
+        for origin, target in self.hostOverrides.items():
+            if url.startswith(origin) and url[len(origin):len(origin) + 1] in ('', '/', '?'):
+                return target + url[len(origin):]
+        return url
+
+    def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        return self.client.request(method, self.resolve(url), **kwargs)
+
+    async def asyncRequest(self, method: str, url: str, **kwargs) -> httpx.Response:
+        return await self.asyncClient.request(method, self.resolve(url), **kwargs)
+
+    def close(self) -> None:
+        '''Closes the synchronous client and every asynchronous client. An asynchronous client is closed on its own
+        event loop: right away if the loop is idle, soon after if it is running. The connections of a client whose
+        loop was already closed cannot be closed anymore, and a ResourceWarning is emitted for them instead.
+        '''
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+            asyncClients = list(self._asyncClients.items())
+            self._asyncClients.clear()
+        for loop, client in asyncClients:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            elif not loop.is_closed():
+                loop.run_until_complete(client.aclose())
+            else:
+                warnings.warn(f'{client!r} could not be closed, its event loop was closed first. Close sessions with '
+                              'aclose() from their event loop.', ResourceWarning)
+
+    async def aclose(self) -> None:
+        '''Closes the asynchronous client of the running event loop, and the synchronous client.'''
+        client = self._asyncClients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+        self.close()
+
+
+class RecordReplayTransport(Transport):
+    '''Records responses to a local directory or SQLite file, and replays them later without network access.
+
+    Requests are identified by a fingerprint of their method, URL (with sorted query parameters), field mask
+    and JSON body (with sorted keys), so the same call always maps to the same recording.
+
+    Args:
+        path (str): Directory to store one JSON file per request in, or a SQLite database file
+            when it ends with '.sqlite' or '.db'.
+        mode (str, optional): 'replay' only serves recordings & raises YouTubeRequestError for unknown requests,
+            'record' always sends requests through `transport` & stores the responses, 'auto' replays known
+            requests & records the rest. Defaults to 'replay'.
+        transport (Transport, optional): Transport used to send requests while recording. Defaults to a new
+            `HttpxTransport`.
+
+    Examples:
+        >>> session = Session(transport = RecordReplayTransport('recordings', mode = 'record'))
+        >>> search = VideosSearch('NoCopyrightSounds', session = session)
+        >>> session = Session(transport = RecordReplayTransport('recordings'))
+        >>> search = VideosSearch('NoCopyrightSounds', session = session)  # served from recordings/
+    '''
+
+    modes = ('replay', 'record', 'auto')
+
+    def __init__(self, path: str, mode: str = 'replay', transport: Optional[Transport] = None):
+        if mode not in self.modes:
+            raise YouTubeRequestError(f'Unknown record/replay mode: {mode}')
+        self.mode = mode
+        self.transport = transport
+        if path.endswith(('.sqlite', '.db')):
+            self.store = SQLiteStore(path)
+        else:
+            self.store = DirectoryStore(path)
+
+    @staticmethod
+    def fingerprint(method: str, url: str, **kwargs) -> str:
+        '''Returns the key a request is stored under.'''
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        headers = httpx.Headers(kwargs.get('headers') or {})
+        if kwargs.get('json') is not None:
+            body = json.dumps(kwargs['json'], sort_keys=True, separators=(',', ':'))
+        else:
+            body = kwargs.get('content') or kwargs.get('data') or ''
+            if isinstance(body, bytes):
+                body = body.decode('utf_8', 'replace')
+        key = '\n'.join([
+            method.upper(),
+            urlunsplit((parts.scheme, parts.netloc, parts.path, query, '')),
+            headers.get('X-Goog-FieldMask', ''),
+            str(body),
+        ])
+        return hashlib.sha256(key.encode('utf_8')).hexdigest()
+
+    @property
+    def client(self) -> httpx.Client:
+        '''Returns the client of the transport recordings are made through.'''
+        return self._getTransport().client
+
+    @property
+    def asyncClient(self) -> httpx.AsyncClient:
+        '''Returns the asynchronous client of the transport recordings are made through.'''
+        return self._getTransport().asyncClient
+
+    def _getTransport(self) -> Transport:
+        if self.transport is None:
+            self.transport = HttpxTransport()
+        return self.transport
+
+    def _replay(self, key: str, method: str, url: str) -> Optional[httpx.Response]:
+        if self.mode == 'record':
+            return None
+        record = self.store.get(key)
+        if record is None:
+            if self.mode == 'replay':
+                raise YouTubeRequestError(f'No recording for {method} {url}')
+            return None
+        if record['encoding'] == 'base64':
+            content = base64.b64decode(record['body'])
+        else:
+            content = record['body'].encode('utf_8')
+        return httpx.Response(
+            record['status'],
+            headers=record['headers'],
+            content=content,
+            request=httpx.Request(method, url),
+        )
+
+    def _record(self, key: str, method: str, url: str, response: httpx.Response) -> None:
+        content = response.content
+        try:
+            body, encoding = content.decode('utf_8'), 'utf_8'
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode('ascii'), 'base64'
+        # The body is stored decoded, headers describing the wire format no longer apply to it.
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in ('content-encoding', 'content-length', 'transfer-encoding', 'set-cookie')
+        }
+        self.store.put(key, {
+            'method': method,
+            'url': url,
+            'status': response.status_code,
+            'headers': headers,
+            'encoding': encoding,
+            'body': body,
+        })
+
+    def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        key = self.fingerprint(method, url, **kwargs)
+        response = self._replay(key, method, url)
+        if response is None:
+            response = self._getTransport().request(method, url, **kwargs)
+            self._record(key, method, url, response)
+        return response
+
+    async def asyncRequest(self, method: str, url: str, **kwargs) -> httpx.Response:
+        key = self.fingerprint(method, url, **kwargs)
+        response = self._replay(key, method, url)
+        if response is None:
+            response = await self._getTransport().asyncRequest(method, url, **kwargs)
+            self._record(key, method, url, response)
+        return response
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
+        self.store.close()
+
+    async def aclose(self) -> None:
+        if self.transport is not None:
+            await self.transport.aclose()
+        self.store.close()
+
+
+class DirectoryStore:
+    '''Keeps each recording as `<fingerprint>.json` inside a directory.'''
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def get(self, key: str) -> Optional[dict]:
+        try:
+            with open(os.path.join(self.path, key + '.json'), 'r', encoding='utf_8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, record: dict) -> None:
+        path = os.path.join(self.path, key + '.json')
+        temporaryPath = '%s.%d.%d.tmp' % (path, os.getpid(), threading.get_ident())
+        with open(temporaryPath, 'w', encoding='utf_8') as file:
+            json.dump(record, file, ensure_ascii=False, indent=1)
+        os.replace(temporaryPath, path)
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteStore:
+    '''Keeps every recording in a single SQLite database file.'''
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            with self._connection:
+                self._connection.execute('CREATE TABLE IF NOT EXISTS recordings (key TEXT PRIMARY KEY, record TEXT NOT NULL)')
+        return self._connection
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._connect().execute('SELECT record FROM recordings WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def put(self, key: str, record: dict) -> None:
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute('INSERT OR REPLACE INTO recordings (key, record) VALUES (?, ?)', (key, json.dumps(record)))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
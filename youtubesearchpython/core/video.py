@@ -1,13 +1,19 @@
+import asyncio
 import copy
 import json
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Union, List, Optional
-from urllib.parse import urlencode
 import httpx
 
 from youtubesearchpython.core.constants import *
-from youtubesearchpython.core.requests import RequestCore
+from youtubesearchpython.core.requests import RequestCore, innertubeUrl
+from youtubesearchpython.core.session import Session
+from youtubesearchpython.core.deadline import Deadline
 from youtubesearchpython.core.componenthandler import getValue, getVideoId
-from youtubesearchpython.core.exceptions import YouTubeRequestError, YouTubeParseError
+from youtubesearchpython.core.exceptions import YouTubeCircuitOpenError, YouTubeDeadlineExceeded, YouTubeRequestError, YouTubeParseError, YouTubeSearchError
+from youtubesearchpython.core.jsonbackend import dumps, loads
+from youtubesearchpython.core.thumbnails import ThumbnailResolver, standardThumbnails
 from youtubesearchpython.core.utils import (
     get_cleaned_url,
     format_view_count,
@@ -66,14 +72,24 @@ CLIENTS = {
 
 
 class VideoCore(RequestCore):
-    def __init__(self, videoLink: str, componentMode: str, resultMode: int, timeout: Optional[int], enableHTML: bool, overridedClient: str = "ANDROID"):
-        super().__init__(timeout=timeout)
+    def __init__(self, videoLink: str, componentMode: str, resultMode: int, timeout: Optional[int], enableHTML: bool, overridedClient: str = "ANDROID", session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None, thumbnailMode: int = ThumbnailMode.synthesized, searchEnrichment: bool = True):
+        super().__init__(timeout=timeout, session=session)
         self.timeout = timeout
+        self.deadline = Deadline.of(deadline)
         self.resultMode = resultMode
         self.componentMode = componentMode
         self.videoLink = get_cleaned_url(videoLink)
         self.enableHTML = enableHTML
         self.overridedClient = overridedClient
+        self.thumbnailMode = thumbnailMode
+        self.searchEnrichment = searchEnrichment
+        self.checkResultMode(resultMode)
+
+    @staticmethod
+    def checkResultMode(resultMode: int) -> None:
+        '''Raises YouTubeSearchError for `ResultMode.objects`, which videos have no compact objects for.'''
+        if resultMode == ResultMode.objects:
+            raise YouTubeSearchError('ResultMode.objects is not supported for videos, use ResultMode.dict')
     
     def post_request_only_html_processing(self):
         self.__getVideoComponent(self.componentMode)
@@ -90,16 +106,28 @@ class VideoCore(RequestCore):
         self.result = self.__videoComponent
 
     def prepare_innertube_request(self):
-        self.url = 'https://www.youtube.com/youtubei/v1/player' + "?" + urlencode({
-            'key': searchKey,
-            'contentCheckOk': True,
-            'racyCheckOk': True,
-            "videoId": getVideoId(self.videoLink)
-        })
+        self.url = innertubeUrl(
+            'player',
+            contentCheckOk=True,
+            racyCheckOk=True,
+            videoId=getVideoId(self.videoLink),
+        )
+        # getFormats only reads streamingData, getInfo only the metadata, and neither reads the ads, tracking,
+        # captions & storyboards making up most of the player response, which are skipped. Metadata without
+        # signed stream URLs can also be kept by a `ResponseCache`.
+        if self.componentMode == 'getFormats':
+            self.fieldMask = 'playabilityStatus,streamingData'
+        elif self.componentMode == 'getInfo':
+            self.fieldMask = 'playabilityStatus,videoDetails,microformat'
+        else:
+            self.fieldMask = 'playabilityStatus,videoDetails,microformat,streamingData'
         self.data = copy.deepcopy(CLIENTS[self.overridedClient])
 
     async def async_create(self):
         self.prepare_innertube_request()
+        if self.__isKnownMissing():
+            await self.async_post_request_processing()
+            return
         response = await self.asyncPostRequest()
         if response is None:
             video_link = getattr(self, "videoLink", None)
@@ -109,18 +137,25 @@ class VideoCore(RequestCore):
                 f"Video link: {video_link}, Request parameters: {request_params}"
             )
 
-        self.response = response.text
+        self.response = response.content
         if response.status_code == 200:
             await self.async_post_request_processing()
+            self.__rememberUnavailable()
         else:
-            raise YouTubeRequestError(f"Invalid status code {response.status_code} for video {self.videoLink}")
+            error = YouTubeRequestError(f"Invalid status code {response.status_code} for video {self.videoLink}")
+            self.__rememberRejected(response.status_code, error)
+            raise error
 
     def sync_create(self):
         self.prepare_innertube_request()
+        if self.__isKnownMissing():
+            self.post_request_processing()
+            return
         response = self.syncPostRequest()
-        self.response = response.text
+        self.response = response.content
         if response.status_code == 200:
             self.post_request_processing()
+            self.__rememberUnavailable()
         else:
             try:
                 # Get full error response for debugging
@@ -142,55 +177,113 @@ class VideoCore(RequestCore):
                     error_msg = error_msg[:500] + "..."
             except (AttributeError, KeyError):
                 error_msg = 'Could not read response text'
-            raise YouTubeRequestError(f'Invalid status code {response.status_code} for video {self.videoLink}. Response: {error_msg}')
+            error = YouTubeRequestError(f'Invalid status code {response.status_code} for video {self.videoLink}. Response: {error_msg}')
+            self.__rememberRejected(response.status_code, error)
+            raise error
+
+    def __isKnownMissing(self) -> bool:
+        # Unavailable videos are remembered by the session's negative cache, their player response is replayed
+        # from it (or their error raised again) instead of being requested.
+        playerResponse = self._knownMissing(getVideoId(self.videoLink), 'video')
+        if playerResponse is None:
+            return False
+        self.response = json.dumps(playerResponse)
+        return True
+
+    def __rememberUnavailable(self) -> None:
+        # 'ERROR' is returned for removed & nonexistent videos, whatever the client & field mask.
+        playabilityStatus = getValue(self.responseSource, ["playabilityStatus"])
+        if getValue(playabilityStatus, ["status"]) == "ERROR":
+            self._rememberMissing(getVideoId(self.videoLink), 'video', {"playabilityStatus": playabilityStatus})
+
+    def __rememberRejected(self, statusCode: int, error: YouTubeRequestError) -> None:
+        # 400 & 404 are answered to malformed or unknown video IDs, sending them again would not help.
+        if statusCode in (400, 404):
+            self._rememberMissing(getVideoId(self.videoLink), 'video', error)
 
     def prepare_html_request(self):
-        self.url = 'https://www.youtube.com/youtubei/v1/player' + "?" + urlencode({
-            'key': searchKey,
-            'contentCheckOk': True,
-            'racyCheckOk': True,
-            "videoId": getVideoId(self.videoLink)
-        })
+        self.url = innertubeUrl(
+            'player',
+            contentCheckOk=True,
+            racyCheckOk=True,
+            videoId=getVideoId(self.videoLink),
+        )
+        # Only videoDetails & microformat are read from this response, streamingData is never downloaded.
+        self.fieldMask = 'playabilityStatus,videoDetails,microformat'
         self.data = CLIENTS["MWEB"]
 
     def sync_html_create(self):
         self.prepare_html_request()
         response = self.syncPostRequest()
-        self.HTMLresponseSource = response.json()
+        self.HTMLresponseSource = loads(response.content)
 
     async def async_html_create(self):
         self.prepare_html_request()
         response = await self.asyncPostRequest()
-        self.HTMLresponseSource = response.json()
+        self.HTMLresponseSource = loads(response.content)
 
     def __parseSource(self) -> None:
         try:
-            self.responseSource = json.loads(self.response)
+            self.responseSource = loads(self.response)
         except json.JSONDecodeError as e:
             raise YouTubeParseError(f'Failed to parse JSON response for video {self.videoLink}: {str(e)}')
+        except YouTubeSearchError:
+            raise
         except Exception as e:
             raise YouTubeParseError(f'Failed to parse YouTube response: {str(e)}')
 
     def __result(self, mode: int) -> Union[dict, str]:
         if mode == ResultMode.dict:
             return self.__videoComponent
-        elif mode == ResultMode.json:
-            return json.dumps(self.__videoComponent, indent=4)
+        elif mode in (ResultMode.json, ResultMode.compactJson):
+            return dumps(self.__videoComponent, mode)
 
-    def __checkThumbnailExists(self, url: str) -> bool:
+    def __checkThumbnailExists(self, url: str, deadline: Optional[Deadline]) -> bool:
+        lookupCache = self._getSession().lookupCache
+        exists = lookupCache.get(url, 'thumbnail')
+        if exists is not None:
+            return exists
         try:
-            response = httpx.head(url, headers={"User-Agent": userAgent}, timeout=2, follow_redirects=True)
-            return response.status_code == 200
-        except (httpx.RequestError, httpx.HTTPStatusError, Exception):
+            timeout = deadline.timeout(2) if deadline is not None else 2
+            response = self._getSession().request('HEAD', url, timeout=timeout, follow_redirects=True, deadline=deadline)
+        except YouTubeDeadlineExceeded:
+            deadline.skip('thumbnails')
             return False
+        except (httpx.HTTPError, YouTubeCircuitOpenError):
+            # A failed probe is not remembered, the thumbnail may well exist.
+            return False
+        lookupCache.put(url, 'thumbnail', response.status_code == 200)
+        return response.status_code == 200
 
-    async def __checkThumbnailExistsAsync(self, url: str) -> bool:
+    async def __checkThumbnailExistsAsync(self, url: str, deadline: Optional[Deadline]) -> bool:
+        lookupCache = self._getSession().lookupCache
+        exists = lookupCache.get(url, 'thumbnail')
+        if exists is not None:
+            return exists
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.head(url, headers={"User-Agent": userAgent}, timeout=2, follow_redirects=True)
-                return response.status_code == 200
-        except (httpx.RequestError, httpx.HTTPStatusError, Exception):
+            timeout = deadline.timeout(2) if deadline is not None else 2
+            response = await self._getSession().asyncRequest('HEAD', url, timeout=timeout, follow_redirects=True, deadline=deadline)
+        except YouTubeDeadlineExceeded:
+            deadline.skip('thumbnails')
+            return False
+        except (httpx.HTTPError, YouTubeCircuitOpenError):
             return False
+        lookupCache.put(url, 'thumbnail', response.status_code == 200)
+        return response.status_code == 200
+
+    def __probeThumbnails(self, candidates: List[dict], deadline: Optional[Deadline] = None) -> List[dict]:
+        # Every thumbnail is probed at once on the pooled connections, instead of one HEAD request after another.
+        if not candidates or (deadline is not None and not deadline.allows('thumbnails')):
+            return []
+        with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            found = list(executor.map(lambda thumb: self.__checkThumbnailExists(thumb["url"], deadline), candidates))
+        return [thumb for thumb, exists in zip(candidates, found) if exists]
+
+    async def __probeThumbnailsAsync(self, candidates: List[dict], deadline: Optional[Deadline] = None) -> List[dict]:
+        if not candidates or (deadline is not None and not deadline.allows('thumbnails')):
+            return []
+        found = await asyncio.gather(*[self.__checkThumbnailExistsAsync(thumb["url"], deadline) for thumb in candidates])
+        return [thumb for thumb, exists in zip(candidates, found) if exists]
 
     def __getBestHq720FromThumbnails(self, thumbnails: List[dict]) -> Union[dict, None]:
         best_thumb = None
@@ -241,218 +334,243 @@ class VideoCore(RequestCore):
                     return video_data
         return None
 
-    def __getVideoDataFromSearch(self, video_id: str, video_title: Optional[str] = None) -> dict:
-        result = {'publishedTime': None, 'hq720Thumbnail': None}
-        
+    def __searchQueries(self, video_id: str, video_title: Optional[str]) -> List[str]:
         search_queries = []
         if video_title:
             search_queries.append(video_title)
         search_queries.append(f"https://www.youtube.com/watch?v={video_id}")
         search_queries.append(video_id)
-        
-        for query in search_queries:
-            try:
-                request_body = copy.deepcopy(requestPayload)
-                request_body['query'] = query
-                request_body['client'] = {
-                    'hl': 'en',
-                    'gl': 'US',
-                }
-                
-                url = 'https://www.youtube.com/youtubei/v1/search' + '?' + urlencode({'key': searchKey})
-                response = httpx.post(
-                    url,
-                    headers={"User-Agent": userAgent, "Content-Type": "application/json"},
-                    json=request_body,
-                    timeout=self.timeout if self.timeout else 5
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    contents = getValue(data, contentPath)
-                    fallback_contents = getValue(data, fallbackContentPath)
-                    
-                    search_contents = contents if contents else fallback_contents
-                    video_data = self.__findVideoDataInSearchResults(search_contents, video_id)
-                    
-                    if video_data:
-                        # Extract publishedTime - try multiple paths
-                        published_time = getValue(video_data, ['publishedTimeText', 'simpleText'])
-                        # Also try runs path (some videos use runs instead of simpleText)
-                        if not published_time:
-                            published_time = getValue(video_data, ['publishedTimeText', 'runs', 0, 'text'])
-                        # Try alternative paths in the video data structure
-                        if not published_time:
-                            published_time = getValue(video_data, ['publishedTimeText'])
-                        if not published_time:
-                            # Try to find in videoRenderer or other renderer types
-                            published_time = getValue(video_data, ['videoRenderer', 'publishedTimeText', 'simpleText'])
-                        if not published_time:
-                            published_time = getValue(video_data, ['videoRenderer', 'publishedTimeText', 'runs', 0, 'text'])
-                        if not published_time:
-                            # Try in overlay or other nested structures
-                            published_time = getValue(video_data, ['overlay', 'inlinePlaybackEndpointOverlayRenderer', 'publishedTimeText', 'simpleText'])
-                        if published_time:
-                            result['publishedTime'] = published_time
-                        
-                        # Extract hq720 thumbnail
-                        thumbnails = getValue(video_data, ['thumbnail', 'thumbnails'])
-                        if thumbnails:
-                            best_thumb = self.__getBestHq720FromThumbnails(thumbnails)
-                            if best_thumb:
-                                result['hq720Thumbnail'] = best_thumb
-                        
-                        # If we found publishedTime, we can stop trying other queries
-                        if result['publishedTime']:
-                            break
-            except Exception:
-                continue
-        
+        return search_queries
+
+    def __searchRequest(self, query: str) -> dict:
+        request_body = copy.deepcopy(requestPayload)
+        request_body['query'] = query
+        request_body['client'] = {
+            'hl': 'en',
+            'gl': 'US',
+        }
+        return {
+            'json': request_body,
+            'headers': {'X-Goog-FieldMask': searchFieldMask},
+            'timeout': self._requestTimeout(self.timeout if self.timeout else 5),
+            'idempotent': True,
+            'deadline': self.deadline,
+        }
+
+    def __parseSearchResponse(self, response: httpx.Response, video_id: str) -> Optional[dict]:
+        # None when the search failed, an empty result when it did not find the video.
+        if response.status_code != 200:
+            return None
+        result = {'publishedTime': None, 'hq720Thumbnail': None}
+        data = loads(response.content)
+        contents = getValue(data, contentPath)
+        fallback_contents = getValue(data, fallbackContentPath)
+
+        search_contents = contents if contents else fallback_contents
+        video_data = self.__findVideoDataInSearchResults(search_contents, video_id)
+
+        if video_data:
+            # Extract publishedTime - try multiple paths
+            published_time = getValue(video_data, ['publishedTimeText', 'simpleText'])
+            # Also try runs path (some videos use runs instead of simpleText)
+            if not published_time:
+                published_time = getValue(video_data, ['publishedTimeText', 'runs', 0, 'text'])
+            # Try alternative paths in the video data structure
+            if not published_time:
+                published_time = getValue(video_data, ['publishedTimeText'])
+            if not published_time:
+                # Try to find in videoRenderer or other renderer types
+                published_time = getValue(video_data, ['videoRenderer', 'publishedTimeText', 'simpleText'])
+            if not published_time:
+                published_time = getValue(video_data, ['videoRenderer', 'publishedTimeText', 'runs', 0, 'text'])
+            if not published_time:
+                # Try in overlay or other nested structures
+                published_time = getValue(video_data, ['overlay', 'inlinePlaybackEndpointOverlayRenderer', 'publishedTimeText', 'simpleText'])
+            if published_time:
+                result['publishedTime'] = published_time
+
+            # Extract hq720 thumbnail
+            thumbnails = getValue(video_data, ['thumbnail', 'thumbnails'])
+            if thumbnails:
+                best_thumb = self.__getBestHq720FromThumbnails(thumbnails)
+                if best_thumb:
+                    result['hq720Thumbnail'] = best_thumb
         return result
 
-    async def __getVideoDataFromSearchAsync(self, video_id: str, video_title: Optional[str] = None) -> dict:
+    def __searchForVideo(self, query: str, video_id: str) -> Optional[dict]:
+        response = self._getSession().request('POST', innertubeUrl('search'), **self.__searchRequest(query))
+        return self.__parseSearchResponse(response, video_id)
+
+    async def __searchForVideoAsync(self, query: str, video_id: str) -> Optional[dict]:
+        response = await self._getSession().asyncRequest('POST', innertubeUrl('search'), **self.__searchRequest(query))
+        return self.__parseSearchResponse(response, video_id)
+
+    @staticmethod
+    def __mergeSearchData(result: dict, found: Optional[dict]) -> bool:
+        # Returns whether the search found the video, and the other queries can be given up on.
+        if found is None:
+            return False
+        for key in ('publishedTime', 'hq720Thumbnail'):
+            if not result[key] and found[key]:
+                result[key] = found[key]
+        return bool(result['publishedTime'])
+
+    def __searchForVideoUnlessFound(self, query: str, video_id: str, found: threading.Event) -> Optional[dict]:
+        # A query whose turn comes after another one found the video is never sent.
+        if found.is_set():
+            return None
+        return self.__searchForVideo(query, video_id)
+
+    def __getVideoDataFromSearch(self, video_id: str, video_title: Optional[str] = None) -> dict:
+        # The video is searched for by title, link & ID, the first query finding it wins. What was found is
+        # remembered by the session's lookup cache, unless a query failed or was cut short by the deadline.
+        lookupCache = self._getSession().lookupCache
+        result = lookupCache.get(video_id, 'search')
+        if result is not None:
+            return result
         result = {'publishedTime': None, 'hq720Thumbnail': None}
-        
-        search_queries = []
-        if video_title:
-            search_queries.append(video_title)
-        search_queries.append(f"https://www.youtube.com/watch?v={video_id}")
-        search_queries.append(video_id)
-        
-        for query in search_queries:
-            try:
-                request_body = copy.deepcopy(requestPayload)
-                request_body['query'] = query
-                request_body['client'] = {
-                    'hl': 'en',
-                    'gl': 'US',
-                }
-                
-                url = 'https://www.youtube.com/youtubei/v1/search' + '?' + urlencode({'key': searchKey})
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        url,
-                        headers={"User-Agent": userAgent, "Content-Type": "application/json"},
-                        json=request_body,
-                        timeout=self.timeout if self.timeout else 5
-                    )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    contents = getValue(data, contentPath)
-                    fallback_contents = getValue(data, fallbackContentPath)
-                    
-                    search_contents = contents if contents else fallback_contents
-                    video_data = self.__findVideoDataInSearchResults(search_contents, video_id)
-                    
-                    if video_data:
-                        # Extract publishedTime - try multiple paths
-                        published_time = getValue(video_data, ['publishedTimeText', 'simpleText'])
-                        # Also try runs path (some videos use runs instead of simpleText)
-                        if not published_time:
-                            published_time = getValue(video_data, ['publishedTimeText', 'runs', 0, 'text'])
-                        # Try alternative paths in the video data structure
-                        if not published_time:
-                            published_time = getValue(video_data, ['publishedTimeText'])
-                        if not published_time:
-                            # Try to find in videoRenderer or other renderer types
-                            published_time = getValue(video_data, ['videoRenderer', 'publishedTimeText', 'simpleText'])
-                        if not published_time:
-                            published_time = getValue(video_data, ['videoRenderer', 'publishedTimeText', 'runs', 0, 'text'])
-                        if not published_time:
-                            # Try in overlay or other nested structures
-                            published_time = getValue(video_data, ['overlay', 'inlinePlaybackEndpointOverlayRenderer', 'publishedTimeText', 'simpleText'])
-                        if published_time:
-                            result['publishedTime'] = published_time
-                        
-                        # Extract hq720 thumbnail
-                        thumbnails = getValue(video_data, ['thumbnail', 'thumbnails'])
-                        if thumbnails:
-                            best_thumb = self.__getBestHq720FromThumbnails(thumbnails)
-                            if best_thumb:
-                                result['hq720Thumbnail'] = best_thumb
-                        
-                        # If we found publishedTime, we can stop trying other queries
-                        if result['publishedTime']:
-                            break
-            except Exception:
-                continue
-        
+        # A fallback that cannot finish before the deadline is skipped, the result stays partial.
+        if not self._allows('search'):
+            return result
+        # The queries run on the session's bounded lookup threads. The next one only starts once the previous one
+        # missed the video, or took longer than `searchStaggerDelay`, so a lookup usually sends a single request.
+        executor = self._getSession()._lookupExecutor()
+        queries = iter(self.__searchQueries(video_id, video_title))
+        found = threading.Event()
+        complete = True
+        pending = set()
+
+        def startNext() -> bool:
+            for query in queries:
+                pending.add(executor.submit(self.__searchForVideoUnlessFound, query, video_id, found))
+                return True
+            return False
+
+        try:
+            startNext()
+            while pending:
+                done, pending = wait(pending, timeout=searchStaggerDelay, return_when=FIRST_COMPLETED)
+                if not done:
+                    startNext()
+                    continue
+                for future in done:
+                    try:
+                        searched = future.result()
+                    except YouTubeDeadlineExceeded:
+                        self.deadline.skip('search')
+                        complete = False
+                        searched = None
+                    except Exception:
+                        complete = False
+                        searched = None
+                    else:
+                        complete = complete and searched is not None
+                    if self.__mergeSearchData(result, searched):
+                        found.set()
+                        complete = True
+                        break
+                    startNext()
+                if found.is_set():
+                    break
+        finally:
+            # Queries still queued are dropped, the ones already sent are not waited for.
+            found.set()
+            for future in pending:
+                future.cancel()
+        if complete and not (self.deadline is not None and self.deadline.timedOut):
+            lookupCache.put(video_id, 'search', result)
         return result
 
+    async def __getVideoDataFromSearchAsync(self, video_id: str, video_title: Optional[str] = None) -> dict:
+        # Staggered like `__getVideoDataFromSearch`, on the running event loop.
+        lookupCache = self._getSession().lookupCache
+        result = lookupCache.get(video_id, 'search')
+        if result is not None:
+            return result
+        result = {'publishedTime': None, 'hq720Thumbnail': None}
+        if not self._allows('search'):
+            return result
+        queries = iter(self.__searchQueries(video_id, video_title))
+        complete = True
+        found = False
+        pending = set()
 
-    def __enhanceThumbnails(self, thumbnails: List[dict], video_id: str, search_api_data: Optional[dict] = None) -> List[dict]:
-        if not thumbnails or not video_id:
-            return thumbnails
-        
-        enhanced = list(thumbnails)
-        existing_urls = {thumb.get("url", "") for thumb in enhanced if isinstance(thumb, dict)}
+        def startNext() -> bool:
+            for query in queries:
+                pending.add(asyncio.ensure_future(self.__searchForVideoAsync(query, video_id)))
+                return True
+            return False
+
+        try:
+            startNext()
+            while pending and not found:
+                done, pending = await asyncio.wait(pending, timeout=searchStaggerDelay, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    startNext()
+                    continue
+                for task in done:
+                    try:
+                        searched = task.result()
+                    except YouTubeDeadlineExceeded:
+                        self.deadline.skip('search')
+                        complete = False
+                        searched = None
+                    except Exception:
+                        complete = False
+                        searched = None
+                    else:
+                        complete = complete and searched is not None
+                    if self.__mergeSearchData(result, searched):
+                        found = complete = True
+                        break
+                    startNext()
+        finally:
+            # Queries still running are cancelled once the video is found.
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        if complete and not (self.deadline is not None and self.deadline.timedOut):
+            lookupCache.put(video_id, 'search', result)
+        return result
+
+    def __thumbnailCandidates(self, thumbnails: List[dict], video_id: str, search_api_data: Optional[dict]) -> tuple:
+        existing_urls = {thumb.get("url", "") for thumb in thumbnails if isinstance(thumb, dict)}
         existing_base_urls = {url.split('?')[0] if '?' in url else url for url in existing_urls}
-        
-        standard_thumbnails = [
-            {"url": f"https://i.ytimg.com/vi/{video_id}/default.jpg", "width": 120, "height": 90},
-            {"url": f"https://i.ytimg.com/vi/{video_id}/mqdefault.jpg", "width": 320, "height": 180},
-            {"url": f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg", "width": 480, "height": 360},
-            {"url": f"https://i.ytimg.com/vi/{video_id}/sddefault.jpg", "width": 640, "height": 480},
-            {"url": f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg", "width": 1920, "height": 1080},
-            {"url": f"https://i.ytimg.com/vi/{video_id}/hq720.jpg", "width": 1280, "height": 720},
-        ]
-        
-        for thumb in standard_thumbnails:
-            base_url = thumb["url"]
-            if base_url not in existing_base_urls:
-                if self.__checkThumbnailExists(base_url):
-                    enhanced.append(thumb)
-        
-        if search_api_data and search_api_data.get('hq720Thumbnail'):
-            optimized_hq720 = search_api_data['hq720Thumbnail']
-        else:
-            search_data = self.__getVideoDataFromSearch(video_id)
-            optimized_hq720 = search_data.get('hq720Thumbnail')
-        
+        # Unchecked URLs are limited to the thumbnails every video has, the larger ones are often missing.
+        guaranteedOnly = self.thumbnailMode == ThumbnailMode.synthesized
+        candidates = [thumb for thumb in standardThumbnails(video_id, guaranteedOnly) if thumb["url"] not in existing_base_urls]
+        extra = []
+        optimized_hq720 = search_api_data.get('hq720Thumbnail') if search_api_data else None
         if optimized_hq720:
             optimized_url = optimized_hq720["url"]
             if optimized_url not in existing_urls and optimized_url.split('?')[0] not in existing_base_urls:
-                enhanced.append(optimized_hq720)
-        
-        return enhanced
+                extra.append(optimized_hq720)
+        return candidates, extra
 
-    async def __enhanceThumbnailsAsync(self, thumbnails: List[dict], video_id: str, search_api_data: Optional[dict] = None) -> List[dict]:
-        if not thumbnails or not video_id:
+    def __enhanceThumbnails(self, thumbnails: List[dict], video_id: str, search_api_data: Optional[dict] = None, video_title: Optional[str] = None) -> Union[List[dict], ThumbnailResolver]:
+        if not thumbnails or not video_id or self.thumbnailMode == ThumbnailMode.none:
+            return thumbnails
+        if self.thumbnailMode == ThumbnailMode.probe and self.searchEnrichment and search_api_data is None:
+            search_api_data = self.__getVideoDataFromSearch(video_id, video_title)
+        candidates, extra = self.__thumbnailCandidates(thumbnails, video_id, search_api_data)
+        if self.thumbnailMode == ThumbnailMode.lazy:
+            return ThumbnailResolver(thumbnails, candidates, self.__probeThumbnails, self.__probeThumbnailsAsync, extra)
+        if self.thumbnailMode == ThumbnailMode.probe:
+            candidates = self.__probeThumbnails(candidates, self.deadline)
+        return list(thumbnails) + candidates + extra
+
+    async def __enhanceThumbnailsAsync(self, thumbnails: List[dict], video_id: str, search_api_data: Optional[dict] = None, video_title: Optional[str] = None) -> Union[List[dict], ThumbnailResolver]:
+        if not thumbnails or not video_id or self.thumbnailMode == ThumbnailMode.none:
             return thumbnails
-        
-        enhanced = list(thumbnails)
-        existing_urls = {thumb.get("url", "") for thumb in enhanced if isinstance(thumb, dict)}
-        existing_base_urls = {url.split('?')[0] if '?' in url else url for url in existing_urls}
-        
-        standard_thumbnails = [
-            {"url": f"https://i.ytimg.com/vi/{video_id}/default.jpg", "width": 120, "height": 90},
-            {"url": f"https://i.ytimg.com/vi/{video_id}/mqdefault.jpg", "width": 320, "height": 180},
-            {"url": f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg", "width": 480, "height": 360},
-            {"url": f"https://i.ytimg.com/vi/{video_id}/sddefault.jpg", "width": 640, "height": 480},
-            {"url": f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg", "width": 1920, "height": 1080},
-            {"url": f"https://i.ytimg.com/vi/{video_id}/hq720.jpg", "width": 1280, "height": 720},
-        ]
-        
-        for thumb in standard_thumbnails:
-            base_url = thumb["url"]
-            if base_url not in existing_base_urls:
-                if await self.__checkThumbnailExistsAsync(base_url):
-                    enhanced.append(thumb)
-        
         # Use search API data if already fetched in same call, otherwise fetch separately
-        if search_api_data and search_api_data.get('hq720Thumbnail'):
-            optimized_hq720 = search_api_data['hq720Thumbnail']
-        else:
-            search_data = await self.__getVideoDataFromSearchAsync(video_id)
-            optimized_hq720 = search_data.get('hq720Thumbnail')
-        
-        if optimized_hq720:
-            optimized_url = optimized_hq720["url"]
-            if optimized_url not in existing_urls and optimized_url.split('?')[0] not in existing_base_urls:
-                enhanced.append(optimized_hq720)
-        
-        return enhanced
+        if self.thumbnailMode == ThumbnailMode.probe and self.searchEnrichment and search_api_data is None:
+            search_api_data = await self.__getVideoDataFromSearchAsync(video_id, video_title)
+        candidates, extra = self.__thumbnailCandidates(thumbnails, video_id, search_api_data)
+        if self.thumbnailMode == ThumbnailMode.lazy:
+            return ThumbnailResolver(thumbnails, candidates, self.__probeThumbnails, self.__probeThumbnailsAsync, extra)
+        if self.thumbnailMode == ThumbnailMode.probe:
+            candidates = await self.__probeThumbnailsAsync(candidates, self.deadline)
+        return list(thumbnails) + candidates + extra
 
     def __getVideoComponent(self, mode: str) -> None:
         videoComponent = {}
@@ -529,8 +647,9 @@ class VideoCore(RequestCore):
                 component["publishedTime"] = format_published_time(live_broadcast_date)
             
             search_api_data = None
-            if component.get("id"):
-                needs_search_data = not component["publishedTime"] or (component.get("thumbnails") and component.get("id"))
+            if component.get("id") and self.searchEnrichment:
+                # Synthesized thumbnails need no search, only the modes checking thumbnails add its hq720 one.
+                needs_search_data = not component["publishedTime"] or (component.get("thumbnails") and self.thumbnailMode in (ThumbnailMode.lazy, ThumbnailMode.probe))
                 if needs_search_data:
                     search_api_data = self.__getVideoDataFromSearch(component["id"], component.get("title"))
                     if not component["publishedTime"] and search_api_data.get("publishedTime"):
@@ -569,7 +688,7 @@ class VideoCore(RequestCore):
                 component["channel"]["link"] = None
             
             if component.get("thumbnails") and component.get("id"):
-                component["thumbnails"] = self.__enhanceThumbnails(component["thumbnails"], component["id"], search_api_data)
+                component["thumbnails"] = self.__enhanceThumbnails(component["thumbnails"], component["id"], search_api_data, component.get("title"))
             
             videoComponent.update(component)
         if mode in ["getFormats", None]:
@@ -598,6 +717,8 @@ class VideoCore(RequestCore):
             del videoComponent["publishDate"]
         if "uploadDate" in videoComponent:
             del videoComponent["uploadDate"]
+        if self.deadline is not None:
+            videoComponent["timedOut"] = self.deadline.timedOut
         
         self.__videoComponent = videoComponent
 
@@ -676,8 +797,9 @@ class VideoCore(RequestCore):
                 component["publishedTime"] = format_published_time(live_broadcast_date)
             
             search_api_data = None
-            if component.get("id"):
-                needs_search_data = not component["publishedTime"] or (component.get("thumbnails") and component.get("id"))
+            if component.get("id") and self.searchEnrichment:
+                # Synthesized thumbnails need no search, only the modes checking thumbnails add its hq720 one.
+                needs_search_data = not component["publishedTime"] or (component.get("thumbnails") and self.thumbnailMode in (ThumbnailMode.lazy, ThumbnailMode.probe))
                 if needs_search_data:
                     search_api_data = await self.__getVideoDataFromSearchAsync(component["id"], component.get("title"))
                     if not component["publishedTime"] and search_api_data.get("publishedTime"):
@@ -716,7 +838,7 @@ class VideoCore(RequestCore):
                 component["channel"]["link"] = None
             
             if component.get("thumbnails") and component.get("id"):
-                component["thumbnails"] = await self.__enhanceThumbnailsAsync(component["thumbnails"], component["id"], search_api_data)
+                component["thumbnails"] = await self.__enhanceThumbnailsAsync(component["thumbnails"], component["id"], search_api_data, component.get("title"))
             
             videoComponent.update(component)
         if mode in ["getFormats", None]:
@@ -745,5 +867,7 @@ class VideoCore(RequestCore):
             del videoComponent["publishDate"]
         if "uploadDate" in videoComponent:
             del videoComponent["uploadDate"]
+        if self.deadline is not None:
+            videoComponent["timedOut"] = self.deadline.timedOut
         
         self.__videoComponent = videoComponent
@@ -1,19 +1,23 @@
 import copy
-from typing import Union
+from typing import Iterable, List, Optional, Union
 
 from youtubesearchpython.core import VideoCore
+from youtubesearchpython.core.batch import mapConcurrently
 from youtubesearchpython.core.comments import CommentsCore
 from youtubesearchpython.core.hashtag import HashtagCore
 from youtubesearchpython.core.playlist import PlaylistCore
+from youtubesearchpython.core.results import CommentResult, TranscriptSegment, withObjects
 from youtubesearchpython.core.suggestions import SuggestionsCore
 from youtubesearchpython.core.transcript import TranscriptCore
 from youtubesearchpython.core.channel import ChannelCore
+from youtubesearchpython.core.session import Session
+from youtubesearchpython.core.deadline import Deadline
 from youtubesearchpython.core.constants import *
 
 
 class Video:
     @staticmethod
-    def get(videoLink: str, mode: int = ResultMode.dict, timeout: int = None, get_upload_date: bool = False) -> Union[
+    def get(videoLink: str, mode: int = ResultMode.dict, timeout: int = None, get_upload_date: bool = False, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None, thumbnailMode: int = ThumbnailMode.synthesized, searchEnrichment: bool = True) -> Union[
         dict, str, None]:
         '''Fetches information and formats  for the given video link or ID.
         Returns None if video is unavailable.
@@ -21,6 +25,20 @@ class Video:
         Args:
             videoLink (str): link or ID of the video on YouTube.
             mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
+            session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
+            deadline (Deadline | float, optional): Time budget of the whole call in seconds, shared by the player request,
+                the search fallbacks & the thumbnail checks. Fallbacks that do not fit are skipped and the result gets
+                `timedOut` set to True. Defaults to None.
+            thumbnailMode (int, optional): How the standard thumbnails YouTube may have for the video are added to
+                `thumbnails`. `ThumbnailMode.synthesized` adds the URLs of those every video has (default,
+                mqdefault & hqdefault) without checking them, `ThumbnailMode.probe` checks all of them and
+                keeps those that exist, checked concurrently, `ThumbnailMode.lazy` returns a `ThumbnailResolver`
+                checking them when first read, and `ThumbnailMode.none` keeps the thumbnails of the player response
+                only. Defaults to ThumbnailMode.synthesized.
+            searchEnrichment (bool, optional): Searches for the video, by title, then link & ID while not found, to fill
+                `publishedTime` when the player response lacks it & add the hq720 thumbnail search results have
+                with `ThumbnailMode.probe` & `ThumbnailMode.lazy`. What is found is remembered by the session's
+                `lookupCache`. Defaults to True.
 
         Examples:
 
@@ -260,20 +278,34 @@ class Video:
                     ]
                 }
         '''
-        vc = VideoCore(videoLink, None, mode, timeout, get_upload_date, "ANDROID")
+        vc = VideoCore(videoLink, None, mode, timeout, get_upload_date, "ANDROID", session=session, deadline=deadline, thumbnailMode=thumbnailMode, searchEnrichment=searchEnrichment)
         if get_upload_date:
             vc.sync_html_create()
         vc.sync_create()
         return vc.result
 
     @staticmethod
-    def getInfo(videoLink: str, mode: int = ResultMode.dict, timeout: int = None) -> Union[dict, str, None]:
+    def getInfo(videoLink: str, mode: int = ResultMode.dict, timeout: int = None, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None, thumbnailMode: int = ThumbnailMode.synthesized, searchEnrichment: bool = True) -> Union[dict, str, None]:
         '''Fetches only information for the given video link or ID.
         Returns None if video is unavailable.
 
         Args:
             videoLink (str): link or ID of the video on YouTube.
             mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
+            session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
+            deadline (Deadline | float, optional): Time budget of the whole call in seconds, shared by the player request,
+                the search fallbacks & the thumbnail checks. Fallbacks that do not fit are skipped and the result gets
+                `timedOut` set to True. Defaults to None.
+            thumbnailMode (int, optional): How the standard thumbnails YouTube may have for the video are added to
+                `thumbnails`. `ThumbnailMode.synthesized` adds the URLs of those every video has (default,
+                mqdefault & hqdefault) without checking them, `ThumbnailMode.probe` checks all of them and
+                keeps those that exist, checked concurrently, `ThumbnailMode.lazy` returns a `ThumbnailResolver`
+                checking them when first read, and `ThumbnailMode.none` keeps the thumbnails of the player response
+                only. Defaults to ThumbnailMode.synthesized.
+            searchEnrichment (bool, optional): Searches for the video, by title, then link & ID while not found, to fill
+                `publishedTime` when the player response lacks it & add the hq720 thumbnail search results have
+                with `ThumbnailMode.probe` & `ThumbnailMode.lazy`. What is found is remembered by the session's
+                `lookupCache`. Defaults to True.
 
         Examples:
 
@@ -348,19 +380,21 @@ class Video:
                 "link": "https://www.youtube.com/watch?v=E07s5ZYygMg",
             }
         '''
-        vc = VideoCore(videoLink, "getInfo", mode, timeout, True)
+        vc = VideoCore(videoLink, "getInfo", mode, timeout, True, session=session, deadline=deadline, thumbnailMode=thumbnailMode, searchEnrichment=searchEnrichment)
         vc.sync_html_create()
         vc.post_request_only_html_processing()
         return vc.result
 
     @staticmethod
-    def getFormats(videoLink: str, mode: int = ResultMode.dict, timeout: int = None) -> Union[dict, str, None]:
+    def getFormats(videoLink: str, mode: int = ResultMode.dict, timeout: int = None, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None) -> Union[dict, str, None]:
         '''Fetches formats  for the given video link or ID.
         Returns None if video is unavailable.
 
         Args:
             videoLink (str): link or ID of the video on YouTube.
             mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
+            session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
+            deadline (Deadline | float, optional): Time budget of the whole call in seconds, including retries. Defaults to None.
 
         Examples:
 
@@ -535,55 +569,45 @@ class Video:
                 }
             }
         '''
-        vc = VideoCore(videoLink, "getFormats", mode, timeout, False)
+        vc = VideoCore(videoLink, "getFormats", mode, timeout, False, session=session, deadline=deadline)
         vc.sync_create()
         return vc.result
 
     @staticmethod
-    async def get(videoLink: str, mode: int = ResultMode.dict, timeout: int = None, get_upload_date: bool = False) -> Union[dict, str, None]:
-        '''Async version: Fetches information and formats for the given video link or ID.
-        Returns None if video is unavailable.
+    def getMany(videoLinks: Iterable[str], concurrency: int = 10, infoOnly: bool = False, mode: int = ResultMode.dict, timeout: int = None, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None, thumbnailMode: int = ThumbnailMode.synthesized, searchEnrichment: bool = True) -> List[Union[dict, Exception]]:
+        '''Fetches information and formats for many video links or IDs, from up to `concurrency` threads at a
+        time, on the pooled connections of the session.
 
         Args:
-            videoLink (str): link or ID of the video on YouTube.
-            mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
-            timeout (int, optional): Timeout for the request. Defaults to None.
-            get_upload_date (bool, optional): Whether to get upload date. Defaults to False.
-        '''
-        vc = VideoCore(videoLink, None, mode, timeout, get_upload_date)
-        if get_upload_date:
-            await vc.async_html_create()
-        await vc.async_create()
-        return vc.result
+            videoLinks (iterable): links or IDs of the videos on YouTube.
+            concurrency (int, optional): Maximum number of videos fetched at the same time. Defaults to 10.
+            infoOnly (bool, optional): Fetches only information, like `Video.getInfo`, without downloading
+                formats. Defaults to False.
+            session (Session, optional): Pooled session used for the requests. Defaults to the process-wide session.
+            deadline (Deadline | float, optional): Time budget of the whole batch in seconds. Videos not fetched
+                in time fail with `YouTubeDeadlineExceeded`. Defaults to None.
+            thumbnailMode (int, optional): See `Video.get`. Defaults to ThumbnailMode.synthesized.
+            searchEnrichment (bool, optional): See `Video.get`. Defaults to True.
 
-    @staticmethod
-    async def getInfo(videoLink: str, mode: int = ResultMode.dict, timeout: int = None) -> Union[dict, str, None]:
-        '''Async version: Fetches only information for the given video link or ID.
-        Returns None if video is unavailable.
+        Returns:
+            list: The result of every video, in the order of `videoLinks`. A video that could not be fetched is
+            replaced by the exception raised for it, the others are still returned.
 
-        Args:
-            videoLink (str): link or ID of the video on YouTube.
-            mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
-            timeout (int, optional): Timeout for the request. Defaults to None.
-        '''
-        vc = VideoCore(videoLink, "getInfo", mode, timeout, True)
-        await vc.async_html_create()
-        vc.post_request_only_html_processing()
-        return vc.result
-
-    @staticmethod
-    async def getFormats(videoLink: str, mode: int = ResultMode.dict, timeout: int = None) -> Union[dict, str, None]:
-        '''Async version: Fetches formats for the given video link or ID.
-        Returns None if video is unavailable.
+        Examples:
 
-        Args:
-            videoLink (str): link or ID of the video on YouTube.
-            mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
-            timeout (int, optional): Timeout for the request. Defaults to None.
+            >>> videos = Video.getMany(["E07s5ZYygMg", "K4DyBUG242c"], concurrency = 20)
+            >>> [video["title"] for video in videos if not isinstance(video, Exception)]
+            ['Harry Styles - Watermelon Sugar (Official Video)', 'Cartoon - On & On (feat. Daniel Levi) [NCS Release]']
         '''
-        vc = VideoCore(videoLink, "getFormats", mode, timeout, False)
-        await vc.async_create()
-        return vc.result
+        VideoCore.checkResultMode(mode)
+        # Every video of a batch shares the session & the deadline, but makes its own player request.
+        deadline = Deadline.of(deadline)
+
+        def fetch(videoLink: str) -> dict:
+            vc = VideoCore(videoLink, "getInfo" if infoOnly else None, mode, timeout, False, "ANDROID", session=session, deadline=deadline, thumbnailMode=thumbnailMode, searchEnrichment=searchEnrichment)
+            vc.sync_create()
+            return vc.result
+        return mapConcurrently(fetch, videoLinks, concurrency)
 
 
 class Playlist:
@@ -601,15 +625,16 @@ class Playlist:
 
     Args:
         playlistLink (str): link of the playlist on YouTube.
+        session (Session, optional): Pooled session used for the requests. Defaults to the process-wide session.
     '''
     __playlist = None
     videos = []
     info = None
     hasMoreVideos = False
 
-    def __init__(self, playlistLink: str, timeout: int = None):
+    def __init__(self, playlistLink: str, timeout: int = None, session: Optional[Session] = None):
         self.timeout = timeout
-        self.__playlist = PlaylistCore(playlistLink, None, ResultMode.dict, self.timeout)
+        self.__playlist = PlaylistCore(playlistLink, None, ResultMode.dict, self.timeout, session=session)
         self.__playlist.sync_create()
         self.info = copy.deepcopy(self.__playlist.result)
         self.videos = self.__playlist.result['videos']
@@ -626,13 +651,14 @@ class Playlist:
         self.hasMoreVideos = self.__playlist.continuationKey != None
 
     @staticmethod
-    def get(playlistLink: str, mode: int = ResultMode.dict, timeout: int = None) -> Union[dict, str, None]:
+    def get(playlistLink: str, mode: int = ResultMode.dict, timeout: int = None, session: Optional[Session] = None) -> Union[dict, str, None]:
         '''Fetches information and videos for the given playlist link.
         Returns None if playlist is unavailable.
 
         Args:
             playlistLink (str): link of the playlist on YouTube.
             mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
+            session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
 
         Examples:
 
@@ -1175,18 +1201,19 @@ class Playlist:
                 ]
             }
         '''
-        pc = PlaylistCore(playlistLink, None, mode, timeout)
+        pc = PlaylistCore(playlistLink, None, mode, timeout, session=session)
         pc.sync_create()
         return pc.result
 
     @staticmethod
-    def getInfo(playlistLink: str, mode: int = ResultMode.dict, timeout: int = None) -> Union[dict, str, None]:
+    def getInfo(playlistLink: str, mode: int = ResultMode.dict, timeout: int = None, session: Optional[Session] = None) -> Union[dict, str, None]:
         '''Fetches only information for the given playlist link.
         Returns None if playlist is unavailable.
 
         Args:
             playlistLink (str): link of the playlist on YouTube.
             mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
+            session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
 
         Examples:
 
@@ -1246,18 +1273,19 @@ class Playlist:
                 }
             }
         '''
-        ps = PlaylistCore(playlistLink, 'getInfo', mode, timeout)
+        ps = PlaylistCore(playlistLink, 'getInfo', mode, timeout, session=session)
         ps.sync_create()
         return ps.result
 
     @staticmethod
-    def getVideos(playlistLink: str, mode: int = ResultMode.dict, timeout: int = None) -> Union[dict, str, None]:
+    def getVideos(playlistLink: str, mode: int = ResultMode.dict, timeout: int = None, session: Optional[Session] = None) -> Union[dict, str, None]:
         '''Fetches only videos in the given playlist from link.
         Returns None if playlist is unavailable.
 
         Args:
             playlistLink (str): link of the playlist on YouTube.
             mode (int, optional): Sets the type of result. Defaults to ResultMode.dict.
+            session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
 
         Examples:
 
@@ -1749,7 +1777,7 @@ class Playlist:
                 ]
             }
         '''
-        ps = PlaylistCore(playlistLink, 'getVideos', mode, timeout)
+        ps = PlaylistCore(playlistLink, 'getVideos', mode, timeout, session=session)
         ps.sync_create()
         return ps.result
 
@@ -1762,6 +1790,7 @@ class Hashtag(HashtagCore):
         limit (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        session (Session, optional): Pooled session used for the requests. Defaults to the process-wide session.
     
     Examples:
         Calling `result` method gives the search result.
@@ -1831,14 +1860,14 @@ class Hashtag(HashtagCore):
         }
     '''
 
-    def __init__(self, hashtag: str, limit: int = 60, language: str = 'en', region: str = 'US', timeout: int = None):
-        super().__init__(hashtag, limit, language, region, timeout)
+    def __init__(self, hashtag: str, limit: int = 60, language: str = 'en', region: str = 'US', timeout: int = None, session: Optional[Session] = None):
+        super().__init__(hashtag, limit, language, region, timeout, session=session)
         self.sync_create()
 
 
 class Suggestions(SuggestionsCore):
-    def __init__(self, language: str = "en", region: str = "US", timeout: int = None):
-        super().__init__(language, region, timeout)
+    def __init__(self, language: str = "en", region: str = "US", timeout: int = None, session: Optional[Session] = None):
+        super().__init__(language, region, timeout, session=session)
 
     def get(self, query: str, mode: int = ResultMode.dict):
         return self._get(query, mode)
@@ -1848,43 +1877,49 @@ class Comments:
     comments = []
     hasMoreComments = False
 
-    def __init__(self, playlistLink: str, timeout: int = None):
+    def __init__(self, playlistLink: str, timeout: int = None, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None):
         self.timeout = timeout
-        self.__comments = CommentsCore(playlistLink)
+        self.deadline = deadline
+        self.__comments = CommentsCore(playlistLink, self.timeout, session=session, deadline=deadline)
         self.__comments.sync_create()
         self.comments = self.__comments.commentsComponent
         self.hasMoreComments = self.__comments.continuationKey is not None
 
-    def getNextComments(self) -> None:
+    def getNextComments(self, deadline: Union[Deadline, float, None] = None) -> None:
+        self.__comments.deadline = Deadline.of(deadline or self.deadline)
         self.__comments.sync_create_next()
         self.comments = self.__comments.commentsComponent
         self.hasMoreComments = self.__comments.continuationKey is not None
 
     @staticmethod
-    def get(playlistLink: str) -> Union[dict, str, None]:
-        pc = CommentsCore(playlistLink)
+    def get(playlistLink: str, timeout: int = None, session: Optional[Session] = None, deadline: Union[Deadline, float, None] = None, mode: int = ResultMode.dict) -> Union[dict, str, None]:
+        pc = CommentsCore(playlistLink, timeout, session=session, deadline=deadline)
         pc.sync_create()
+        if mode == ResultMode.objects:
+            return withObjects(pc.commentsComponent, 'result', CommentResult)
         return pc.commentsComponent
 
 
 class Transcript:
     @staticmethod
-    def get(videoLink: str, params: str = None):
-        transcript_core = TranscriptCore(videoLink, params)
+    def get(videoLink: str, params: str = None, session: Optional[Session] = None, mode: int = ResultMode.dict):
+        transcript_core = TranscriptCore(videoLink, params, session=session)
         transcript_core.sync_create()
+        if mode == ResultMode.objects:
+            return withObjects(transcript_core.result, 'segments', TranscriptSegment)
         return transcript_core.result
 
 
 class Channel(ChannelCore):
-    def __init__(self, channel_id: str, request_type: str = ChannelRequestType.playlists):
-        super().__init__(channel_id, request_type)
+    def __init__(self, channel_id: str, request_type: str = ChannelRequestType.playlists, session: Optional[Session] = None):
+        super().__init__(channel_id, request_type, session=session)
         self.sync_create()
 
     def next(self):
         self.sync_next()
 
     @staticmethod
-    def get(channel_id: str, request_type: str = ChannelRequestType.info):
-        channel_core = ChannelCore(channel_id, request_type)
+    def get(channel_id: str, request_type: str = ChannelRequestType.info, session: Optional[Session] = None):
+        channel_core = ChannelCore(channel_id, request_type, session=session)
         channel_core.sync_create()
         return channel_core.result
@@ -1,14 +1,14 @@
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
-from urllib.parse import urlencode
 import json
 import copy
+import httpx
 from youtubesearchpython.core.componenthandler import ComponentHandler
+from youtubesearchpython.core.requests import RequestCore, innertubeUrl
 from youtubesearchpython.core.constants import *
-from youtubesearchpython.core.exceptions import YouTubeRequestError, YouTubeParseError
+from youtubesearchpython.core.exceptions import YouTubeRequestError, YouTubeParseError, YouTubeSearchError
+from youtubesearchpython.core.jsonbackend import loads
 
 
-class RequestHandler(ComponentHandler):
+class RequestHandler(RequestCore, ComponentHandler):
     def _makeRequest(self) -> None:
         ''' Fixes #47 '''
         requestBody = copy.deepcopy(requestPayload)
@@ -21,31 +21,28 @@ class RequestHandler(ComponentHandler):
             requestBody['params'] = self.searchPreferences
         if self.continuationKey:
             requestBody['continuation'] = self.continuationKey
-        requestBodyBytes = json.dumps(requestBody).encode('utf_8')
-        request = Request(
-            'https://www.youtube.com/youtubei/v1/search' + '?' + urlencode({
-                'key': searchKey,
-            }),
-            data = requestBodyBytes,
-            headers = {
-                'Content-Type': 'application/json; charset=utf-8',
-                'Content-Length': len(requestBodyBytes),
-                'User-Agent': userAgent,
-            }
-        )
+        self.url = innertubeUrl('search')
+        self.fieldMask = searchFieldMask
+        self.data = requestBody
         try:
-            self.response = urlopen(request, timeout=self.timeout).read().decode('utf_8')
-        except (URLError, HTTPError, TimeoutError) as e:
+            request = self.syncPostRequest()
+            if request.status_code != 200:
+                raise YouTubeRequestError(f'Request failed with status code {request.status_code}. URL: {self.url}')
+            self.response = request.content
+        except YouTubeSearchError:
+            raise
+        except httpx.RequestError as e:
             raise YouTubeRequestError(f'Failed to make request: {str(e)}')
         except Exception as e:
             raise YouTubeRequestError(f'Unexpected error making request: {str(e)}')
     
     def _parseSource(self) -> None:
         try:
+            response = loads(self.response)
             if not self.continuationKey:
-                responseContent = self._getValue(json.loads(self.response), contentPath)
+                responseContent = self._getValue(response, contentPath)
             else:
-                responseContent = self._getValue(json.loads(self.response), continuationContentPath)
+                responseContent = self._getValue(response, continuationContentPath)
             if responseContent:
                 for element in responseContent:
                     if itemSectionKey in element.keys():
@@ -53,11 +50,13 @@ class RequestHandler(ComponentHandler):
                     if continuationItemKey in element.keys():
                         self.continuationKey = self._getValue(element, continuationKeyPath)
             else:
-                self.responseSource = self._getValue(json.loads(self.response), fallbackContentPath)
+                self.responseSource = self._getValue(response, fallbackContentPath)
                 self.continuationKey = self._getValue(self.responseSource[-1], continuationKeyPath)
         except json.JSONDecodeError as e:
             raise YouTubeParseError(f'Failed to parse JSON response: {str(e)}')
         except KeyError as e:
             raise YouTubeParseError(f'Missing expected key in response: {str(e)}')
+        except YouTubeSearchError:
+            raise
         except Exception as e:
             raise YouTubeParseError(f'Failed to parse YouTube response: {str(e)}')
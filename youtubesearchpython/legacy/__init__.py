@@ -1,8 +1,9 @@
 from typing import List, Union
 import json
-from youtubesearchpython.core.componenthandler import ComponentHandler
+from youtubesearchpython.core.componenthandler import ComponentHandler, _playlistSchema, _shelfSchema, _videoSchema
 from youtubesearchpython.handlers.requesthandler import RequestHandler
 from youtubesearchpython.core.constants import *
+from youtubesearchpython.core.extractor import compilePath
 
 
 def overrides(interface_class):
@@ -12,16 +13,19 @@ def overrides(interface_class):
     return overrider
 
 
+_thumbnailVideoId = compilePath(['navigationEndpoint', 'watchEndpoint', 'videoId'])
+
+
 class LegacyComponentHandler(RequestHandler, ComponentHandler):
     index = 0
 
     @overrides(ComponentHandler)
     def _getVideoComponent(self, element: dict, shelfTitle: str = None) -> dict:
-        video = element[videoElementKey]
-        videoId = self.__getValue(video, ['videoId'])
+        video = _videoSchema(element[videoElementKey])
+        videoId = self.__orLive(video['id'])
         viewCount = 0
         thumbnails = []
-        for character in self.__getValue(video, ['viewCountText', 'simpleText']):
+        for character in self.__orLive(video['viewCount']['text']):
             if character.isnumeric():
                 viewCount = viewCount * 10 + int(character)
         modes = ['default', 'hqdefault', 'mqdefault', 'sddefault', 'maxresdefault']
@@ -31,22 +35,22 @@ class LegacyComponentHandler(RequestHandler, ComponentHandler):
             'index':                          self.index,
             'id':                             videoId,
             'link':                           'https://www.youtube.com/watch?v=' + videoId,
-            'title':                          self.__getValue(video, ['title', 'runs', 0, 'text']),
-            'channel':                        self.__getValue(video, ['ownerText', 'runs', 0, 'text']),
-            'duration':                       self.__getValue(video, ['lengthText', 'simpleText']),
+            'title':                          self.__orLive(video['title']),
+            'channel':                        self.__orLive(video['channel']['name']),
+            'duration':                       self.__orLive(video['duration']),
             'views':                          viewCount,
             'thumbnails':                     thumbnails,
-            'channeId':                       self.__getValue(video, ['ownerText', 'runs', 0, 'navigationEndpoint', 'browseEndpoint', 'browseId']), 
-            'publishTime':                    self.__getValue(video, ['publishedTimeText', 'simpleText']),
+            'channeId':                       self.__orLive(video['channel']['id']), 
+            'publishTime':                    self.__orLive(video['publishedTime']),
         }
         self.index += 1
         return component
     
     @overrides(ComponentHandler)
     def _getPlaylistComponent(self, element: dict) -> dict:
-        playlist = element[playlistElementKey]
-        playlistId = self.__getValue(playlist, ['playlistId'])
-        thumbnailVideoId = self.__getValue(playlist, ['navigationEndpoint', 'watchEndpoint', 'videoId'])
+        playlist = _playlistSchema(element[playlistElementKey])
+        playlistId = self.__orLive(playlist['id'])
+        thumbnailVideoId = self.__orLive(_thumbnailVideoId(element[playlistElementKey]))
         thumbnails = []
         modes = ['default', 'hqdefault', 'mqdefault', 'sddefault', 'maxresdefault']
         for mode in modes:
@@ -55,45 +59,32 @@ class LegacyComponentHandler(RequestHandler, ComponentHandler):
             'index':                          self.index,
             'id':                             playlistId,
             'link':                           'https://www.youtube.com/playlist?list=' + playlistId,
-            'title':                          self.__getValue(playlist, ['title', 'simpleText']),
+            'title':                          self.__orLive(playlist['title']),
             'thumbnails':                     thumbnails,
-            'count':                          self.__getValue(playlist, ['videoCount']),
-            'channel':                        self.__getValue(playlist, ['shortBylineText', 'runs', 0, 'text']),
+            'count':                          self.__orLive(playlist['videoCount']),
+            'channel':                        self.__orLive(playlist['channel']['name']),
         }
         self.index += 1
         return component
 
     @overrides(ComponentHandler)
     def _getShelfComponent(self, element: dict) -> dict:
-        shelf = element[shelfElementKey]
+        shelf = _shelfSchema(element[shelfElementKey])
         return {
-            'title':                          self.__getValue(shelf, ['title', 'simpleText']),
-            'elements':                       self.__getValue(shelf, ['content', 'verticalListRenderer', 'items']),
+            'title':                          self.__orLive(shelf['title']),
+            'elements':                       self.__orLive(shelf['elements']),
         }
 
-    def __getValue(self, component: dict, path: List[str]) -> Union[str, int, dict]:
-        value = component
-        for key in path:
-            if type(key) is str:
-                if key in value.keys():
-                    value = value[key]
-                else:
-                    value = 'LIVE'
-                    break
-            elif type(key) is int:
-                if len(value) != 0:
-                    value = value[key]
-                else:
-                    value = 'LIVE'
-                    break
-        return value
+    def __orLive(self, value: Union[str, int, dict, None]) -> Union[str, int, dict]:
+        return 'LIVE' if value is None else value
 
 class LegacySearchInternal(LegacyComponentHandler):
     exception = False
     resultComponents = []
     responseSource = []
 
-    def __init__(self, keyword, offset, mode, max_results, language, region):
+    def __init__(self, keyword, offset, mode, max_results, language, region, session = None):
+        super().__init__(session = session)
         self.page = offset
         self.query = keyword
         self.mode = mode
@@ -141,6 +132,7 @@ class SearchVideos(LegacySearchInternal):
         max_results (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en-US'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
 
     Examples:
         Calling `result` method gives the search result.
@@ -167,8 +159,8 @@ class SearchVideos(LegacySearchInternal):
             ]
         }
     '''
-    def __init__(self, keyword, offset = 1, mode = 'json', max_results = 20, language = 'en', region = 'US'):
-        super().__init__(keyword, offset, mode, max_results, language, region)
+    def __init__(self, keyword, offset = 1, mode = 'json', max_results = 20, language = 'en', region = 'US', session = None):
+        super().__init__(keyword, offset, mode, max_results, language, region, session)
         self.searchPreferences = 'EgIQAQ%3D%3D'
         self._makeRequest()
         self._parseSource()
@@ -200,6 +192,7 @@ class SearchPlaylists(LegacySearchInternal):
         max_results (int, optional): Sets limit to the number of results. Defaults to 20.
         language (str, optional): Sets the result language. Defaults to 'en-US'.
         region (str, optional): Sets the result region. Defaults to 'US'.
+        session (Session, optional): Pooled session used for the request. Defaults to the process-wide session.
 
     Examples:
         Calling `result` method gives the search result.
@@ -229,8 +222,8 @@ class SearchPlaylists(LegacySearchInternal):
             ]
         }
     '''
-    def __init__(self, keyword, offset = 1, mode = 'json', max_results = 20, language = 'en', region = 'US'):
-        super().__init__(keyword, offset, mode, max_results, language, region)
+    def __init__(self, keyword, offset = 1, mode = 'json', max_results = 20, language = 'en', region = 'US', session = None):
+        super().__init__(keyword, offset, mode, max_results, language, region, session)
         self.searchPreferences = 'EgIQAw%3D%3D'
         self._makeRequest()
         self._parseSource()
@@ -1,6 +1,7 @@
 from typing import Optional
 from youtubesearchpython.core.constants import *
 from youtubesearchpython.core.search import SearchCore
+from youtubesearchpython.core.session import Session
 from youtubesearchpython.core.channelsearch import ChannelSearchCore
 
 
@@ -13,6 +14,7 @@ class Search(SearchCore):
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
         timeout (int, optional): Sets the request timeout in seconds. Defaults to 10 seconds. Pass None to use default.
+        session (Session, optional): Sets the pooled session used for the requests. Defaults to the process-wide session.
 
     Examples:
         Calling `result` method gives the search result.
@@ -70,9 +72,9 @@ class Search(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, session: Optional[Session] = None):
         self.searchMode = (True, True, True)
-        super().__init__(query, limit, language, region, None, timeout)
+        super().__init__(query, limit, language, region, None, timeout, session=session)
         self.sync_create()
         self._getComponents(*self.searchMode)
 
@@ -88,6 +90,7 @@ class VideosSearch(SearchCore):
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
         timeout (int, optional): Sets the request timeout in seconds. Defaults to 10 seconds. Pass None to use default.
+        session (Session, optional): Sets the pooled session used for the requests. Defaults to the process-wide session.
 
     Examples:
         Calling `result` method gives the search result.
@@ -145,9 +148,9 @@ class VideosSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, session: Optional[Session] = None):
         self.searchMode = (True, False, False)
-        super().__init__(query, limit, language, region, SearchMode.videos, timeout)
+        super().__init__(query, limit, language, region, SearchMode.videos, timeout, session=session)
         self.sync_create()
         self._getComponents(*self.searchMode)
 
@@ -164,6 +167,7 @@ class ChannelsSearch(SearchCore):
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
         timeout (int, optional): Sets the request timeout in seconds. Defaults to 10 seconds. Pass None to use default.
+        session (Session, optional): Sets the pooled session used for the requests. Defaults to the process-wide session.
 
     Examples:
         Calling `result` method gives the search result.
@@ -196,9 +200,9 @@ class ChannelsSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, session: Optional[Session] = None):
         self.searchMode = (False, True, False)
-        super().__init__(query, limit, language, region, SearchMode.channels, timeout)
+        super().__init__(query, limit, language, region, SearchMode.channels, timeout, session=session)
         self.sync_create()
         self._getComponents(*self.searchMode)
 
@@ -215,6 +219,7 @@ class PlaylistsSearch(SearchCore):
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
         timeout (int, optional): Sets the request timeout in seconds. Defaults to 10 seconds. Pass None to use default.
+        session (Session, optional): Sets the pooled session used for the requests. Defaults to the process-wide session.
 
     Examples:
         Calling `result` method gives the search result.
@@ -260,9 +265,9 @@ class PlaylistsSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, session: Optional[Session] = None):
         self.searchMode = (False, False, True)
-        super().__init__(query, limit, language, region, SearchMode.playlists, timeout)
+        super().__init__(query, limit, language, region, SearchMode.playlists, timeout, session=session)
         self.sync_create()
         self._getComponents(*self.searchMode)
 
@@ -279,6 +284,7 @@ class ChannelSearch(ChannelSearchCore):
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
         timeout (int, optional): Sets the request timeout in seconds. Defaults to 10 seconds. Pass None to use default.
+        session (Session, optional): Sets the pooled session used for the requests. Defaults to the process-wide session.
 
     Examples:
         Calling `result` method gives the search result.
@@ -343,8 +349,8 @@ class ChannelSearch(ChannelSearchCore):
         }
     '''
 
-    def __init__(self, query: str, browseId: str, language: str = 'en', region: str = 'US', searchPreferences: str = "EgZzZWFyY2g%3D", timeout: Optional[int] = None):
-        super().__init__(query, language, region, searchPreferences, browseId, timeout)
+    def __init__(self, query: str, browseId: str, language: str = 'en', region: str = 'US', searchPreferences: str = "EgZzZWFyY2g%3D", timeout: Optional[int] = None, session: Optional[Session] = None):
+        super().__init__(query, language, region, searchPreferences, browseId, timeout, session=session)
         self.sync_create()
 
 
@@ -368,6 +374,7 @@ class CustomSearch(SearchCore):
         language (str, optional): Sets the result language. Defaults to 'en'.
         region (str, optional): Sets the result region. Defaults to 'US'.
         timeout (int, optional): Sets the request timeout in seconds. Defaults to 10 seconds. Pass None to use default.
+        session (Session, optional): Sets the pooled session used for the requests. Defaults to the process-wide session.
     
     Examples:
         Calling `result` method gives the search result.
@@ -425,9 +432,9 @@ class CustomSearch(SearchCore):
             ]
         }
     '''
-    def __init__(self, query: str, searchPreferences: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None):
+    def __init__(self, query: str, searchPreferences: str, limit: int = 20, language: str = 'en', region: str = 'US', timeout: Optional[int] = None, session: Optional[Session] = None):
         self.searchMode = (True, True, True)
-        super().__init__(query, limit, language, region, searchPreferences, timeout)
+        super().__init__(query, limit, language, region, searchPreferences, timeout, session=session)
         self.sync_create()
         self._getComponents(*self.searchMode)
     
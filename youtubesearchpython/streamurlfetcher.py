@@ -1,4 +1,6 @@
-from typing import Union
+from typing import Optional, Union
+from youtubesearchpython.core.deadline import Deadline
+from youtubesearchpython.core.session import Session
 from youtubesearchpython.core.streamurlfetcher import StreamURLFetcherCore
 
 
@@ -25,15 +27,17 @@ class StreamURLFetcher(StreamURLFetcherCore):
         >>> print(url)
         "https://r6---sn-gwpa-5bgk.googlevideo.com/videoplayback?expire=1610798125&ei=zX8CYITXEIGKz7sP9MWL0AE&ip=2409%3A4053%3A803%3A2b22%3Adc68%3Adfb9%3Aa676%3A26a3&id=o-APBakKSE2_eMDMegtCmeWXfuhhUfAzJTmOCWj4lkEjAM&itag=251&source=youtube&requiressl=yes&mh=aP&mm=31%2C29&mn=sn-gwpa-5bgk%2Csn-gwpa-qxad&ms=au%2Crdu&mv=m&mvi=6&pl=36&initcwndbps=146250&vprv=1&mime=audio%2Fwebm&ns=ULL4mkMO31KDtEhOjkOrmpkF&gir=yes&clen=10210834&dur=634.601&lmt=1544629945422176&mt=1610776131&fvip=6&keepalive=yes&c=WEB&txp=5511222&n=uEjSqtzBZaJyVn&sparams=expire%2Cei%2Cip%2Cid%2Citag%2Csource%2Crequiressl%2Cvprv%2Cmime%2Cns%2Cgir%2Cclen%2Cdur%2Clmt&sig=AOq0QJ8wRAIgKKIEiwQTgXsdKPEyOckgVPs_LMH6KJoeaYmZic_lelECIHXHs1ZnSP5mgtpffNlIMJM3DhxcvDbA-4udFFE6AmVP&lsparams=mh%2Cmm%2Cmn%2Cms%2Cmv%2Cmvi%2Cpl%2Cinitcwndbps&lsig=AG3C_xAwRQIhAPmhL745RYeL_ffgUJk_xJLC-8riXKMylLTLA_pITYWWAiB2qUIXur8ThW7cLfQ73mIVK61mMZc2ncK6FZWjUHGcUw%3D%3D"
     '''
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: Optional[Session] = None):
+        super().__init__(session=session)
 
-    def get(self, videoFormats: dict, itag: int) -> Union[str, None]:
+    def get(self, videoFormats: dict, itag: int, deadline: Union[Deadline, float, None] = None) -> Union[str, None]:
         '''Gets direct stream URL for a YouTube video fetched using `Video.get` or `Video.getFormats`.
 
         Args:
             videoFormats (dict): Dictionary returned by `Video.get` or `Video.getFormats`.
             itag (int): Itag of the required stream.
+            deadline (Deadline | float, optional): Time budget in seconds of the requests made when `videoFormats`
+                lacks streams or the player JavaScript is needed. Defaults to None.
 
         Returns:
             Union[str, None]: Returns stream URL as string. None, if no stream is present for that itag.
@@ -48,16 +52,19 @@ class StreamURLFetcher(StreamURLFetcherCore):
             >>> print(url)
             "https://r6---sn-gwpa-5bgk.googlevideo.com/videoplayback?expire=1610798125&ei=zX8CYITXEIGKz7sP9MWL0AE&ip=2409%3A4053%3A803%3A2b22%3Adc68%3Adfb9%3Aa676%3A26a3&id=o-APBakKSE2_eMDMegtCmeWXfuhhUfAzJTmOCWj4lkEjAM&itag=251&source=youtube&requiressl=yes&mh=aP&mm=31%2C29&mn=sn-gwpa-5bgk%2Csn-gwpa-qxad&ms=au%2Crdu&mv=m&mvi=6&pl=36&initcwndbps=146250&vprv=1&mime=audio%2Fwebm&ns=ULL4mkMO31KDtEhOjkOrmpkF&gir=yes&clen=10210834&dur=634.601&lmt=1544629945422176&mt=1610776131&fvip=6&keepalive=yes&c=WEB&txp=5511222&n=uEjSqtzBZaJyVn&sparams=expire%2Cei%2Cip%2Cid%2Citag%2Csource%2Crequiressl%2Cvprv%2Cmime%2Cns%2Cgir%2Cclen%2Cdur%2Clmt&sig=AOq0QJ8wRAIgKKIEiwQTgXsdKPEyOckgVPs_LMH6KJoeaYmZic_lelECIHXHs1ZnSP5mgtpffNlIMJM3DhxcvDbA-4udFFE6AmVP&lsparams=mh%2Cmm%2Cmn%2Cms%2Cmv%2Cmvi%2Cpl%2Cinitcwndbps&lsig=AG3C_xAwRQIhAPmhL745RYeL_ffgUJk_xJLC-8riXKMylLTLA_pITYWWAiB2qUIXur8ThW7cLfQ73mIVK61mMZc2ncK6FZWjUHGcUw%3D%3D"
         '''
-        self._getDecipheredURLs(videoFormats, itag)
+        self._getDecipheredURLs(videoFormats, itag, deadline)
         if len(self._streams) == 1:
             return self._streams[0]["url"]
         return None
 
-    def getAll(self, videoFormats: dict) -> Union[dict, None]:
+    def getAll(self, videoFormats: dict, deadline: Union[Deadline, float, None] = None) -> Union[dict, None]:
         '''Gets all stream URLs for a YouTube video fetched using `Video.get` or `Video.getFormats`.
 
         Args:
             videoFormats (dict): Dictionary returned by `Video.get` or `Video.getFormats`.
+            deadline (Deadline | float, optional): Time budget in seconds of the requests made when `videoFormats`
+                lacks streams or the player JavaScript is needed. The result then gets a `timedOut` marker.
+                Defaults to None.
 
         Returns:
             Union[dict, None]: Returns stream URLs in a dictionary.
@@ -131,5 +138,7 @@ class StreamURLFetcher(StreamURLFetcherCore):
                 ]
             }
         '''
-        self._getDecipheredURLs(videoFormats)
+        self._getDecipheredURLs(videoFormats, deadline=deadline)
+        if self.deadline is not None:
+            return {"streams": self._streams, "timedOut": self.deadline.timedOut}
         return {"streams": self._streams}
@@ -0,0 +1,6 @@
+'''
+Offline testing helpers. `StubServer` serves canned YouTube responses from a local port, so that the library
+can be tested & load tested without network access.
+'''
+
+from youtubesearchpython.testing.server import StubServer
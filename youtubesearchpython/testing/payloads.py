@@ -0,0 +1,343 @@
+'''Canned InnerTube responses served by `StubServer`.
+
+Every builder returns a dictionary shaped like the real YouTube response for the same request, with just the
+fields the parsers of this library read. Identifiers are derived from the request, so the same request always
+gets the same response.
+'''
+import base64
+import hashlib
+import re
+from typing import List, Optional
+
+from youtubesearchpython.core.constants import *
+
+
+def stubId(seed: str, length: int = 11) -> str:
+    '''Returns a stable YouTube-like identifier for `seed`.'''
+    digest = base64.urlsafe_b64encode(hashlib.sha256(seed.encode('utf_8')).digest()).decode('ascii')
+    return digest[:length]
+
+
+def _text(text: str) -> dict:
+    return {'runs': [{'text': text}], 'accessibility': {'accessibilityData': {'label': text}}}
+
+
+def _thumbnails(videoId: str) -> List[dict]:
+    return [
+        {'url': f'https://i.ytimg.com/vi/{videoId}/hqdefault.jpg', 'width': 480, 'height': 360},
+        {'url': f'https://i.ytimg.com/vi/{videoId}/hq720.jpg?sqp=stub', 'width': 1280, 'height': 720},
+    ]
+
+
+def _continuation(token: Optional[str]) -> List[dict]:
+    if token is None:
+        return []
+    return [{continuationItemKey: {'continuationEndpoint': {'continuationCommand': {'token': token}}}}]
+
+
+def _channelRun(channelId: str) -> dict:
+    return {'runs': [{
+        'text': 'Stub Channel ' + channelId[:4],
+        'navigationEndpoint': {'browseEndpoint': {'browseId': channelId, 'canonicalBaseUrl': '/channel/' + channelId}},
+    }]}
+
+
+def videoRenderer(videoId: str, index: int = 0) -> dict:
+    channelId = 'UC' + stubId('channel' + videoId, 22)
+    return {videoElementKey: {
+        'videoId': videoId,
+        'title': _text(f'Stub video {index}'),
+        'publishedTimeText': {'simpleText': '1 year ago'},
+        'lengthText': {'simpleText': '3:09', 'accessibility': {'accessibilityData': {'label': '3 minutes, 9 seconds'}}},
+        'viewCountText': {'simpleText': '1,234,567 views'},
+        'shortViewCountText': {'simpleText': '1.2M views'},
+        'thumbnail': {'thumbnails': _thumbnails(videoId)},
+        'detailedMetadataSnippets': [{'snippetText': {'runs': [{'text': f'Description of stub video {index}'}]}}],
+        'ownerText': _channelRun(channelId),
+        'channelThumbnailSupportedRenderers': {'channelThumbnailWithLinkRenderer': {'thumbnail': {'thumbnails': [
+            {'url': f'https://yt3.ggpht.com/{channelId}=s68', 'width': 68, 'height': 68},
+        ]}}},
+        'navigationEndpoint': {'watchEndpoint': {'videoId': videoId}},
+    }}
+
+
+def channelRenderer(channelId: str, index: int = 0) -> dict:
+    return {channelElementKey: {
+        'channelId': channelId,
+        'title': {'simpleText': f'Stub channel {index}'},
+        'thumbnail': {'thumbnails': [{'url': f'https://yt3.ggpht.com/{channelId}=s88', 'width': 88, 'height': 88}]},
+        'videoCountText': {'runs': [{'text': '120'}, {'text': ' videos'}]},
+        'descriptionSnippet': {'runs': [{'text': f'Description of stub channel {index}'}]},
+        'subscriberCountText': {'simpleText': '1.2M subscribers'},
+    }}
+
+
+def playlistRenderer(playlistId: str, index: int = 0) -> dict:
+    videoId = stubId(playlistId)
+    return {playlistElementKey: {
+        'playlistId': playlistId,
+        'title': {'simpleText': f'Stub playlist {index}'},
+        'videoCount': '25',
+        'shortBylineText': _channelRun('UC' + stubId('channel' + playlistId, 22)),
+        'thumbnailRenderer': {'playlistVideoThumbnailRenderer': {'thumbnail': {'thumbnails': _thumbnails(videoId)}}},
+        'navigationEndpoint': {'watchEndpoint': {'videoId': videoId}},
+    }}
+
+
+def playlistVideoRenderer(videoId: str, index: int = 0) -> dict:
+    channelId = 'UC' + stubId('channel' + videoId, 22)
+    return {playlistVideoKey: {
+        'videoId': videoId,
+        'title': _text(f'Stub playlist video {index}'),
+        'thumbnail': {'thumbnails': _thumbnails(videoId)},
+        'shortBylineText': _channelRun(channelId),
+        'lengthText': {'simpleText': '3:09', 'accessibility': {'accessibilityData': {'label': '3 minutes, 9 seconds'}}},
+        'navigationEndpoint': {'commandMetadata': {'webCommandMetadata': {'url': '/watch?v=' + videoId}}},
+        'isPlayable': True,
+    }}
+
+
+def gridPlaylistRenderer(playlistId: str, index: int = 0) -> dict:
+    return {'gridPlaylistRenderer': {
+        'playlistId': playlistId,
+        'title': {'runs': [{'text': f'Stub channel playlist {index}'}]},
+        'thumbnail': {'thumbnails': _thumbnails(stubId(playlistId))},
+        'videoCountShortText': {'simpleText': '25'},
+        'publishedTimeText': {'simpleText': 'Updated 2 days ago'},
+    }}
+
+
+def commentThreadRenderer(commentId: str, index: int = 0) -> dict:
+    authorId = 'UC' + stubId('author' + commentId, 22)
+    return {'commentThreadRenderer': {'comment': {'commentRenderer': {
+        'commentId': commentId,
+        'authorEndpoint': {'browseEndpoint': {'browseId': authorId}},
+        'authorText': {'simpleText': f'@stub{index}'},
+        'authorThumbnail': {'thumbnails': [{'url': f'https://yt3.ggpht.com/{authorId}=s48', 'width': 48, 'height': 48}]},
+        'contentText': {'runs': [{'text': f'Stub comment {index}'}]},
+        'publishedTimeText': {'runs': [{'text': '3 weeks ago'}]},
+        'isLiked': False,
+        'authorIsChannelOwner': False,
+        'voteStatus': 'INDIFFERENT',
+        'voteCount': {'simpleText': '12', 'accessibility': {'accessibilityData': {'label': '12 likes'}}},
+        'replyCount': 1,
+    }}}}
+
+
+def queryVideoId(query: str) -> Optional[str]:
+    '''Returns the video a search query points to, for queries that are a video ID or watch link.'''
+    match = re.search(r'(?:v=|^)([A-Za-z0-9_-]{11})$', query)
+    return match.group(1) if match else None
+
+
+def search(query: str, params: Optional[str], page: int, pageSize: int, token: Optional[str]) -> dict:
+    '''Search results of `query` for the first (`page` 0) or a continuation page.'''
+    items = []
+    if query.startswith('#'):
+        items.append({hashtagElementKey: {'onTapCommand': {'browseEndpoint': {'browseId': hashtagBrowseKey, 'params': stubId(query)}}}})
+    for index in range(page * pageSize, (page + 1) * pageSize):
+        seed = f'{query}:{index}'
+        if params == SearchMode.channels:
+            items.append(channelRenderer('UC' + stubId(seed, 22), index))
+        elif params == SearchMode.playlists:
+            items.append(playlistRenderer('PL' + stubId(seed, 32), index))
+        elif params is None and index % 10 == 5:
+            items.append(channelRenderer('UC' + stubId(seed, 22), index))
+        elif params is None and index % 10 == 7:
+            items.append(playlistRenderer('PL' + stubId(seed, 32), index))
+        else:
+            videoId = queryVideoId(query) if index == 0 else None
+            items.append(videoRenderer(videoId or stubId(seed), index))
+    contents = [{itemSectionKey: {'contents': items}}] + _continuation(token)
+    if page == 0:
+        return {'contents': {'twoColumnSearchResultsRenderer': {'primaryContents': {'sectionListRenderer': {'contents': contents}}}}}
+    return {'onResponseReceivedCommands': [{'appendContinuationItemsAction': {'continuationItems': contents}}]}
+
+
+def player(videoId: str) -> dict:
+    '''Player response of `videoId`, with direct (not ciphered) stream URLs.'''
+    formats = []
+    for itag, mimeType, quality in [(18, 'video/mp4; codecs="avc1.42001E, mp4a.40.2"', '360p'), (22, 'video/mp4; codecs="avc1.64001F, mp4a.40.2"', '720p')]:
+        formats.append({
+            'itag': itag,
+            'url': f'https://rr1---sn-stub.googlevideo.com/videoplayback?id={videoId}&itag={itag}',
+            'mimeType': mimeType,
+            'qualityLabel': quality,
+            'bitrate': 500000 * itag,
+            'contentLength': str(1000000 * itag),
+            'approxDurationMs': '189000',
+        })
+    adaptiveFormats = [{
+        'itag': 140,
+        'url': f'https://rr1---sn-stub.googlevideo.com/videoplayback?id={videoId}&itag=140',
+        'mimeType': 'audio/mp4; codecs="mp4a.40.2"',
+        'bitrate': 130000,
+        'audioQuality': 'AUDIO_QUALITY_MEDIUM',
+        'approxDurationMs': '189000',
+    }]
+    channelId = 'UC' + stubId('channel' + videoId, 22)
+    return {
+        'playabilityStatus': {'status': 'OK'},
+        'videoDetails': {
+            'videoId': videoId,
+            'title': 'Stub video ' + videoId,
+            'lengthSeconds': '189',
+            'keywords': ['stub', 'video'],
+            'channelId': channelId,
+            'shortDescription': 'Description of stub video ' + videoId,
+            'thumbnail': {'thumbnails': _thumbnails(videoId)},
+            'allowRatings': True,
+            'averageRating': 4.9,
+            'viewCount': '1234567',
+            'author': 'Stub Channel ' + channelId[:4],
+            'isLiveContent': False,
+        },
+        'microformat': {'playerMicroformatRenderer': {
+            'publishDate': '2020-05-18T00:00:00-07:00',
+            'uploadDate': '2020-05-18T00:00:00-07:00',
+            'isFamilySafe': True,
+            'category': 'Music',
+        }},
+        'streamingData': {'expiresInSeconds': '21540', 'formats': formats, 'adaptiveFormats': adaptiveFormats},
+    }
+
+
+def playlist(playlistId: str, page: int, pageSize: int, token: Optional[str]) -> dict:
+    '''Playlist page with sidebar information (`page` 0), or a continuation page of its videos.'''
+    videos = [playlistVideoRenderer(stubId(f'{playlistId}:{index}'), index) for index in range(page * pageSize, (page + 1) * pageSize)]
+    videos += _continuation(token)
+    if page > 0:
+        return {'onResponseReceivedActions': [{'appendContinuationItemsAction': {'continuationItems': videos}}]}
+    channelId = 'UC' + stubId('channel' + playlistId, 22)
+    return {
+        'contents': {'twoColumnBrowseResultsRenderer': {'tabs': [{'tabRenderer': {'content': {'sectionListRenderer': {'contents': [
+            {'itemSectionRenderer': {'contents': [{'playlistVideoListRenderer': {'contents': videos}}]}},
+        ]}}}}]}},
+        'sidebar': {'playlistSidebarRenderer': {'items': [
+            {playlistPrimaryInfoKey: {
+                'title': {'runs': [{'text': 'Stub playlist ' + playlistId, 'navigationEndpoint': {'watchEndpoint': {'playlistId': playlistId}}}]},
+                'thumbnailRenderer': {'playlistVideoThumbnailRenderer': {'thumbnail': {'thumbnails': _thumbnails(stubId(playlistId))}}},
+                'stats': [{'runs': [{'text': '100'}, {'text': ' videos'}]}, {'simpleText': '12,345 views'}],
+            }},
+            {playlistSecondaryInfoKey: {'videoOwner': {'videoOwnerRenderer': {
+                'title': _channelRun(channelId),
+                'thumbnail': {'thumbnails': [{'url': f'https://yt3.ggpht.com/{channelId}=s48', 'width': 48, 'height': 48}]},
+            }}}},
+        ]}},
+        'microformat': {'microformatDataRenderer': {'urlCanonical': 'https://www.youtube.com/playlist?list=' + playlistId}},
+    }
+
+
+def hashtag(params: str, page: int, pageSize: int, token: Optional[str]) -> dict:
+    '''Hashtag feed page, the first one (`page` 0) or a continuation.'''
+    items = [{richItemKey: {'content': videoRenderer(stubId(f'{params}:{index}'), index)}} for index in range(page * pageSize, (page + 1) * pageSize)]
+    items += _continuation(token)
+    if page > 0:
+        return {'onResponseReceivedActions': [{'appendContinuationItemsAction': {'continuationItems': items}}]}
+    return {'contents': {'twoColumnBrowseResultsRenderer': {'tabs': [{'tabRenderer': {'content': {'richGridRenderer': {'contents': items}}}}]}}}
+
+
+def channel(channelId: str, page: int, pageSize: int, token: Optional[str]) -> dict:
+    '''Channel page with its playlists tab (`page` 0), or a continuation page of its playlists.'''
+    playlists = [gridPlaylistRenderer('PL' + stubId(f'{channelId}:{index}', 32), index) for index in range(page * pageSize, (page + 1) * pageSize)]
+    playlists += _continuation(token)
+    if page > 0:
+        return {'onResponseReceivedActions': [{'appendContinuationItemsAction': {'continuationItems': playlists}}]}
+    avatar = [{'url': f'https://yt3.ggpht.com/{channelId}=s176', 'width': 176, 'height': 176}]
+    return {
+        'header': {'c4TabbedHeaderRenderer': {
+            'avatar': {'thumbnails': avatar},
+            'banner': {'thumbnails': [{'url': f'https://yt3.ggpht.com/{channelId}=w1060', 'width': 1060, 'height': 175}]},
+            'subscriberCountText': {'simpleText': '1.2M subscribers', 'accessibility': {'accessibilityData': {'label': '1.2 million subscribers'}}},
+        }},
+        'metadata': {'channelMetadataRenderer': {
+            'externalId': channelId,
+            'channelUrl': 'https://www.youtube.com/channel/' + channelId,
+            'description': 'Description of stub channel ' + channelId,
+            'title': 'Stub Channel ' + channelId[:4],
+            'avatar': {'thumbnails': avatar},
+            'availableCountryCodes': ['US', 'IN'],
+            'isFamilySafe': True,
+            'keywords': 'stub channel',
+        }},
+        'microformat': {'microformatDataRenderer': {'thumbnail': {'thumbnails': avatar}, 'tags': ['stub']}},
+        'contents': {'twoColumnBrowseResultsRenderer': {'tabs': [
+            {'tabRenderer': {'title': 'Playlists', 'content': {'sectionListRenderer': {'contents': [
+                {'itemSectionRenderer': {'contents': [{'gridRenderer': {'items': playlists}}]}},
+            ]}}}},
+            {'tabRenderer': {'title': 'About', 'content': {'sectionListRenderer': {'contents': [
+                {'itemSectionRenderer': {'contents': [{'channelAboutFullMetadataRenderer': {
+                    'viewCountText': {'simpleText': '123,456,789 views'},
+                    'joinedDateText': {'runs': [{'text': 'Joined '}, {'text': 'Jan 1, 2012'}]},
+                    'country': {'simpleText': 'United States'},
+                }}]}},
+            ]}}}},
+        ]}},
+    }
+
+
+def channelSearch(channelId: str, query: str, pageSize: int) -> dict:
+    '''Results of searching `query` inside a channel.'''
+    items = [{itemSectionKey: {'contents': [videoRenderer(stubId(f'{channelId}:{query}:{index}'), index)]}} for index in range(pageSize)]
+    return {'contents': {'twoColumnBrowseResultsRenderer': {'tabs': [
+        {'tabRenderer': {'title': 'Home'}},
+        {'expandableTabRenderer': {'content': {'sectionListRenderer': {'contents': items}}}},
+    ]}}}
+
+
+def watchNext(videoId: str, token: str) -> dict:
+    '''`next` response of a video page, pointing to its comments & transcript.'''
+    return {
+        'contents': {'twoColumnWatchNextResults': {'results': {'results': {'contents': [
+            {'videoPrimaryInfoRenderer': {'title': {'runs': [{'text': 'Stub video ' + videoId}]}}},
+            {'itemSectionRenderer': {'contents': _continuation(token)}},
+        ]}}}},
+        'engagementPanels': [
+            {'engagementPanelSectionListRenderer': {'targetId': 'engagement-panel-structured-description'}},
+            {'engagementPanelSectionListRenderer': {
+                'targetId': 'engagement-panel-searchable-transcript',
+                'content': {'continuationItemRenderer': {'continuationEndpoint': {'getTranscriptEndpoint': {'params': 'transcript:' + videoId + ':en'}}}},
+            }},
+        ],
+    }
+
+
+def comments(seed: str, page: int, pageSize: int, token: Optional[str]) -> dict:
+    '''A page of comments, the first (`page` 0) is a reload command & the following ones append.'''
+    items = [commentThreadRenderer(stubId(f'{seed}:{index}', 26), index) for index in range(page * pageSize, (page + 1) * pageSize)]
+    items += _continuation(token)
+    if page == 0:
+        return {'onResponseReceivedEndpoints': [
+            {'reloadContinuationItemsCommand': {'slot': 'RELOAD_CONTINUATION_SLOT_HEADER', 'continuationItems': []}},
+            {'reloadContinuationItemsCommand': {'slot': 'RELOAD_CONTINUATION_SLOT_BODY', 'continuationItems': items}},
+        ]}
+    return {'onResponseReceivedEndpoints': [{'appendContinuationItemsAction': {'continuationItems': items}}]}
+
+
+def transcript(videoId: str, language: str, segments: int) -> dict:
+    '''Transcript of `videoId` with `segments` segments of 5 seconds each.'''
+    initialSegments = []
+    for index in range(segments):
+        initialSegments.append({'transcriptSegmentRenderer': {
+            'startMs': str(index * 5000),
+            'endMs': str((index + 1) * 5000),
+            'snippet': {'runs': [{'text': f'[{language}] stub line {index}'}]},
+            'startTimeText': {'simpleText': '%d:%02d' % divmod(index * 5, 60)},
+        }})
+    languages = []
+    for code, title in [('en', 'English'), ('es', 'Spanish')]:
+        languages.append({
+            'title': title,
+            'selected': code == language,
+            'continuation': {'reloadContinuationData': {'continuation': f'transcript:{videoId}:{code}'}},
+        })
+    return {'actions': [{'updateEngagementPanelAction': {'content': {'transcriptRenderer': {'content': {'transcriptSearchPanelRenderer': {
+        'body': {'transcriptSegmentListRenderer': {'initialSegments': initialSegments}},
+        'footer': {'transcriptFooterRenderer': {'languageMenu': {'sortFilterSubMenuRenderer': {'subMenuItems': languages}}}},
+    }}}}}}]}
+
+
+def suggestions(query: str, count: int = 10) -> str:
+    '''JSONP body of the `complete/search` endpoint.'''
+    items = ', '.join('["%s %d", 0, [512]]' % (query.replace('"', ''), index) for index in range(count))
+    return 'window.google.ac.h(["%s",[%s],{"k":1,"q":"stub"}])' % (query.replace('"', ''), items)
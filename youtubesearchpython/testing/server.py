@@ -0,0 +1,338 @@
+import asyncio
+import json
+import random
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from youtubesearchpython.core.constants import hashtagBrowseKey
+from youtubesearchpython.core.session import Session
+from youtubesearchpython.testing import payloads
+
+isH2installed = False
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.settings
+
+    isH2installed = True
+except ImportError:
+    isH2installed = False
+
+
+PREFACE = b'PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n'
+REASONS = {200: 'OK', 404: 'Not Found', 429: 'Too Many Requests', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+class StubServer:
+    '''Local stand-in for the YouTube endpoints used by this library, for offline tests & load tests.
+
+    Serves canned `search`, `player`, `browse` (playlists, channels, channel search, hashtags), `next` (comments),
+    `get_transcript`, `complete/search` (suggestions), `iframe_api` & thumbnail responses over cleartext HTTP/1.1,
+    and HTTP/2 with prior knowledge when the `h2` package is installed. Paginated results carry continuation tokens
+    until `pages` pages have been served. Like YouTube, JSON responses only keep the top-level fields listed in the
+    `X-Goog-FieldMask` header of the request, when there is one.
+
+    Args:
+        latency (float, optional): Seconds every response is delayed by. Defaults to 0.
+        jitter (float, optional): Upper bound of a random extra delay added to `latency`, in seconds. Defaults to 0.
+        tailRate (float, optional): Fraction of responses delayed by `tailLatency` on top, to simulate a latency
+            tail. Defaults to 0.
+        tailLatency (float, optional): Extra delay of the responses in the tail, in seconds. Defaults to 1.
+        errorRate (float, optional): Fraction of requests answered with `errorStatus` instead. Defaults to 0.
+        errorStatus (int, optional): Status code of the failed requests. Defaults to 503.
+        pageSize (int, optional): Number of items in every page of results. Defaults to 20.
+        pages (int, optional): Number of pages served for paginated results. Defaults to 3.
+        padding (int, optional): Number of filler bytes added to every JSON response, to simulate larger payloads.
+            Defaults to 0.
+        seed (int, optional): Seed of the random generator behind `jitter`, `tailRate` & `errorRate`. Defaults to None.
+
+    Examples:
+        Running in a background thread, for synchronous code.
+
+        >>> with StubServer(latency = 0.05) as server:
+        >>>     session = server.session()
+        >>>     search = VideosSearch('NoCopyrightSounds', session = session)
+
+        Running on the current event loop.
+
+        >>> async with StubServer(pages = 5) as server:
+        >>>     playlist = Playlist('PLRBp0Fe2GpgmsW46rJyudVFlY6IYjFBIK', session = server.session())
+    '''
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, tailRate: float = 0.0, tailLatency: float = 1.0,
+                 errorRate: float = 0.0, errorStatus: int = 503, pageSize: int = 20, pages: int = 3, padding: int = 0, seed: Optional[int] = None,
+                 maxConcurrentStreams: int = 100):
+        self.latency = latency
+        self.jitter = jitter
+        self.tailRate = tailRate
+        self.tailLatency = tailLatency
+        self.errorRate = errorRate
+        self.errorStatus = errorStatus
+        self.pageSize = pageSize
+        self.pages = pages
+        self.padding = padding
+        self.maxConcurrentStreams = maxConcurrentStreams
+        self.random = random.Random(seed)
+        self.url = None
+        self.sockets = 0
+        self.requests = {}
+        self.errors = 0
+        self._server = None
+        # Transports of the open connections, closed by `stop`.
+        self._transports = set()
+        self._loop = None
+        self._thread = None
+
+    async def start(self) -> str:
+        '''Starts listening on a free local port of the running event loop, and returns the server URL.'''
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(lambda: StubProtocol(self), '127.0.0.1', 0, backlog=1024)
+        self.url = 'http://127.0.0.1:%d' % self._server.sockets[0].getsockname()[1]
+        return self.url
+
+    async def stop(self) -> None:
+        '''Stops listening, and closes the connections still open.'''
+        self._server.close()
+        for transport in list(self._transports):
+            transport.close()
+        # Lets the closed transports release their sockets.
+        await asyncio.sleep(0)
+        await self._server.wait_closed()
+
+    def session(self, **kwargs) -> Session:
+        '''Returns a `Session` sending the requests for YouTube, its thumbnails & suggestions to this server.'''
+        return Session(hostOverrides={
+            'https://www.youtube.com': self.url,
+            'https://i.ytimg.com': self.url,
+            'https://clients1.google.com': self.url,
+        }, **kwargs)
+
+    async def __aenter__(self) -> 'StubServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.stop()
+
+    def __enter__(self) -> 'StubServer':
+        started = threading.Event()
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.start())
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.stop())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name='StubServer', daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def delay(self) -> float:
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if self.tailRate and self.random.random() < self.tailRate:
+            delay += self.tailLatency
+        return delay
+
+    def _token(self, kind: str, page: int, seed: str) -> Optional[str]:
+        if page + 1 >= self.pages:
+            return None
+        return f'{kind}:{page + 1}:{seed}'
+
+    def _json(self, payload: dict) -> Tuple[int, str, bytes]:
+        if self.padding:
+            payload['stubPadding'] = 'x' * self.padding
+        return 200, 'application/json; charset=UTF-8', json.dumps(payload, separators=(',', ':')).encode('utf_8')
+
+    def handle(self, method: str, target: str, body: bytes, fieldMask: Optional[str] = None) -> Tuple[int, Dict[str, str], bytes]:
+        '''Returns the status, headers & body of the response to a request.'''
+        parts = urlsplit(target)
+        endpoint = parts.path
+        self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+        if self.errorRate and self.random.random() < self.errorRate:
+            self.errors += 1
+            error = {'error': {'code': self.errorStatus, 'message': 'Stub error', 'status': 'UNAVAILABLE'}}
+            return self.errorStatus, {'Content-Type': 'application/json; charset=UTF-8'}, json.dumps(error).encode('utf_8')
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            data = {}
+        response = self.route(method, endpoint, query, data)
+        if response is None:
+            return 404, {'Content-Type': 'text/plain'}, b'Not Found'
+        status, contentType, content = response
+        if fieldMask and contentType.startswith('application/json'):
+            fields = {field.strip().split('.')[0].split('(')[0] for field in fieldMask.split(',')}
+            payload = json.loads(content)
+            content = json.dumps({key: value for key, value in payload.items() if key in fields}, separators=(',', ':')).encode('utf_8')
+        return status, {'Content-Type': contentType}, content
+
+    def route(self, method: str, endpoint: str, query: dict, data: dict) -> Optional[Tuple[int, str, bytes]]:
+        continuation = data.get('continuation')
+        page, seed = 0, ''
+        if continuation and continuation.count(':') >= 2:
+            kind, page, seed = continuation.split(':', 2)
+            page = int(page)
+        if endpoint == '/youtubei/v1/search':
+            searchQuery = data.get('query', '')
+            return self._json(payloads.search(searchQuery, data.get('params'), page, self.pageSize, self._token('search', page, searchQuery)))
+        if endpoint == '/youtubei/v1/player':
+            return self._json(payloads.player(query.get('videoId') or data.get('videoId') or payloads.stubId('player')))
+        if endpoint == '/youtubei/v1/browse':
+            if continuation:
+                kind = continuation.split(':', 1)[0]
+                builder = {'playlist': payloads.playlist, 'hashtag': payloads.hashtag, 'channel': payloads.channel}.get(kind)
+                if builder is None:
+                    return None
+                return self._json(builder(seed, page, self.pageSize, self._token(kind, page, seed)))
+            browseId = data.get('browseId', '')
+            if browseId.startswith('VL'):
+                return self._json(payloads.playlist(browseId[2:], 0, self.pageSize, self._token('playlist', 0, browseId[2:])))
+            if browseId == hashtagBrowseKey:
+                params = data.get('params') or ''
+                return self._json(payloads.hashtag(params, 0, self.pageSize, self._token('hashtag', 0, params)))
+            if data.get('query'):
+                return self._json(payloads.channelSearch(browseId, data['query'], self.pageSize))
+            return self._json(payloads.channel(browseId, 0, self.pageSize, self._token('channel', 0, browseId)))
+        if endpoint == '/youtubei/v1/next':
+            if continuation:
+                return self._json(payloads.comments(seed, page, self.pageSize, self._token('comments', page, seed)))
+            videoId = data.get('videoId', '')
+            return self._json(payloads.watchNext(videoId, f'comments:0:{videoId}'))
+        if endpoint == '/youtubei/v1/get_transcript':
+            _, videoId, language = (data.get('params') or 'transcript::en').split(':', 2)
+            return self._json(payloads.transcript(videoId, language, self.pageSize))
+        if endpoint == '/complete/search':
+            return 200, 'text/javascript; charset=UTF-8', payloads.suggestions(query.get('q', '')).encode('utf_8')
+        if endpoint == '/iframe_api':
+            script = "var scriptUrl = 'https:\\/\\/www.youtube.com\\/s\\/player\\/0c96dfd3\\/www-widgetapi.vflset\\/www-widgetapi.js';"
+            return 200, 'text/javascript', script.encode('utf_8')
+        if endpoint.startswith('/vi/') and not endpoint.endswith('maxresdefault.jpg'):
+            return 200, 'image/jpeg', b'' if method == 'HEAD' else b'\xff\xd8\xff\xd9'
+        return None
+
+
+class StubProtocol(asyncio.Protocol):
+    '''Speaks HTTP/1.1 with keep-alive, or HTTP/2 when a connection starts with the HTTP/2 preface.'''
+
+    def __init__(self, server: StubServer):
+        self.server = server
+        self.buffer = b''
+        self.h2 = None
+        self.streams = {}
+        self.pending = {}
+        self.transport = None
+
+    def connection_made(self, transport) -> None:
+        self.server.sockets += 1
+        self.server._transports.add(transport)
+        self.transport = transport
+
+    def connection_lost(self, error: Optional[Exception]) -> None:
+        self.server._transports.discard(self.transport)
+
+    def data_received(self, data: bytes) -> None:
+        if self.h2 is not None:
+            return self.h2DataReceived(data)
+        self.buffer += data
+        if self.buffer.startswith(PREFACE):
+            if not isH2installed:
+                return self.transport.close()
+            self.h2 = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False, header_encoding='utf_8'))
+            self.h2.initiate_connection()
+            self.h2.update_settings({h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: self.server.maxConcurrentStreams})
+            data, self.buffer = self.buffer, b''
+            return self.h2DataReceived(data)
+        if len(self.buffer) < len(PREFACE) and PREFACE.startswith(self.buffer):
+            return
+        self.h1DataReceived()
+
+    def respondLater(self, callback, *args) -> None:
+        delay = self.server.delay()
+        if delay > 0:
+            asyncio.get_running_loop().call_later(delay, callback, *args)
+        else:
+            callback(*args)
+
+    def h1DataReceived(self) -> None:
+        while b'\r\n\r\n' in self.buffer:
+            head, rest = self.buffer.split(b'\r\n\r\n', 1)
+            lines = head.decode('latin_1').split('\r\n')
+            method, target = lines[0].split(' ')[:2]
+            length = 0
+            fieldMask = None
+            for line in lines[1:]:
+                name, _, value = line.partition(':')
+                if name.strip().lower() == 'content-length':
+                    length = int(value.strip())
+                elif name.strip().lower() == 'x-goog-fieldmask':
+                    fieldMask = value.strip()
+            if len(rest) < length:
+                return
+            body, self.buffer = rest[:length], rest[length:]
+            self.respondLater(self.h1Respond, method, target, body, fieldMask)
+
+    def h1Respond(self, method: str, target: str, body: bytes, fieldMask: Optional[str] = None) -> None:
+        if self.transport.is_closing():
+            return
+        status, headers, content = self.server.handle(method, target, body, fieldMask)
+        head = 'HTTP/1.1 %d %s\r\nContent-Length: %d\r\n' % (status, REASONS.get(status, 'Unknown'), len(content))
+        head += ''.join('%s: %s\r\n' % item for item in headers.items())
+        self.transport.write(head.encode('latin_1') + b'\r\n' + (b'' if method == 'HEAD' else content))
+
+    def h2DataReceived(self, data: bytes) -> None:
+        for event in self.h2.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                self.streams[event.stream_id] = [dict(event.headers), b'']
+            elif isinstance(event, h2.events.DataReceived):
+                self.streams[event.stream_id][1] += event.data
+                self.h2.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                headers, body = self.streams.pop(event.stream_id)
+                self.respondLater(self.h2Respond, event.stream_id, headers[':method'], headers[':path'], body,
+                                  headers.get('x-goog-fieldmask'))
+            elif isinstance(event, h2.events.StreamReset):
+                self.streams.pop(event.stream_id, None)
+                self.pending.pop(event.stream_id, None)
+            elif isinstance(event, h2.events.WindowUpdated):
+                self.h2Flush()
+        self.transport.write(self.h2.data_to_send())
+
+    def h2Respond(self, streamId: int, method: str, target: str, body: bytes, fieldMask: Optional[str] = None) -> None:
+        if self.transport.is_closing():
+            return
+        status, headers, content = self.server.handle(method, target, body, fieldMask)
+        responseHeaders = [(':status', str(status)), ('content-length', str(len(content)))]
+        responseHeaders += [(name.lower(), value) for name, value in headers.items()]
+        if method == 'HEAD' or not content:
+            self.h2.send_headers(streamId, responseHeaders, end_stream=True)
+        else:
+            self.h2.send_headers(streamId, responseHeaders)
+            self.pending[streamId] = content
+        self.h2Flush()
+
+    def h2Flush(self) -> None:
+        for streamId in list(self.pending):
+            data = self.pending[streamId]
+            while data:
+                window = min(self.h2.local_flow_control_window(streamId), self.h2.max_outbound_frame_size)
+                if window <= 0:
+                    break
+                self.h2.send_data(streamId, data[:window])
+                data = data[window:]
+            if data:
+                self.pending[streamId] = data
+            else:
+                del self.pending[streamId]
+                self.h2.end_stream(streamId)
+        self.transport.write(self.h2.data_to_send())